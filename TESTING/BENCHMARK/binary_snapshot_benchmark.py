@@ -0,0 +1,61 @@
+###################################################################################################
+"""
+Module: binary_snapshot_benchmark
+Compares the binary snapshot format with JSON (compact, and orjson when it is installed) on a
+10k-class diagram: encode time, decode time and size. Every format is checked to decode back
+the exact main data it encoded.
+
+Run from the project root:
+    python TESTING/BENCHMARK/binary_snapshot_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import time
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_MVC.UML_CONTROLLER.uml_binary_snapshot import UMLBinarySnapshot
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLJsonSerializer, DEFAULT_JSON_BACKEND
+from TESTING.BENCHMARK.json_serializer_benchmark import build_main_data
+
+###################################################################################################
+
+NUMBER_OF_CLASSES = 10_000
+ROUNDS = 5
+
+def best_time(function, argument) -> tuple:
+    """
+    Runs the function ROUNDS times and returns its result and the best time in milliseconds.
+    """
+    best = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        result = function(argument)
+        best = min(best, time.perf_counter() - start)
+    return result, best * 1000
+
+def main():
+    main_data = build_main_data(NUMBER_OF_CLASSES)
+    format_list = [("pretty/json", UMLJsonSerializer(is_pretty=True, backend="json")),
+                   ("compact/json", UMLJsonSerializer(backend="json"))]
+    if DEFAULT_JSON_BACKEND == "orjson":
+        format_list.append(("compact/orjson", UMLJsonSerializer(backend="orjson")))
+    print(f"{NUMBER_OF_CLASSES} classes, best of {ROUNDS}")
+    print(f"{'format':>16} {'encode (ms)':>12} {'decode (ms)':>12} {'size (KiB)':>11}")
+    for format_name, serializer in format_list:
+        text, encode_time = best_time(serializer._dumps, main_data)
+        decoded_data, decode_time = best_time(serializer._loads, text)
+        assert decoded_data == main_data
+        print(f"{format_name:>16} {encode_time:>12.1f} {decode_time:>12.1f} {len(text.encode('utf-8')) / 1024:>11.1f}")
+    data, encode_time = best_time(UMLBinarySnapshot._encode, main_data)
+    decoded_data, decode_time = best_time(UMLBinarySnapshot._decode, data)
+    assert decoded_data == main_data
+    print(f"{'binary':>16} {encode_time:>12.1f} {decode_time:>12.1f} {len(data) / 1024:>11.1f}")
+
+if __name__ == "__main__":
+    main()
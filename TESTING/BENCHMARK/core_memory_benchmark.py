@@ -0,0 +1,74 @@
+###################################################################################################
+"""
+Module: core_memory_benchmark
+Reports the bytes allocated per class, field, method, parameter and relationship object,
+for the slotted core types and for an equivalent unslotted layout (the previous
+__dict__-based objects, rebuilt from the same methods).
+
+Run from the project root:
+    python TESTING/BENCHMARK/core_memory_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import tracemalloc
+import types
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_CORE.UML_CLASS.uml_class import UMLClass as Class
+from UML_CORE.UML_FIELD.uml_field import UMLField as Field
+from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+from UML_CORE.UML_RELATIONSHIP.uml_relationship import UMLRelationship as Relationship
+
+###################################################################################################
+
+NUMBER_OF_OBJECTS = 100_000
+
+def unslotted(slotted_class: type) -> type:
+    """
+    Builds a copy of a slotted class with the same methods but a regular __dict__ per instance.
+    The name-mangled attribute names are unchanged because the class name is the same.
+    """
+    namespace = {key: value for key, value in vars(slotted_class).items()
+                 if not isinstance(value, types.MemberDescriptorType) and key != "__slots__"}
+    return type(slotted_class.__name__, (), namespace)
+
+def bytes_per_object(build) -> float:
+    """
+    Creates NUMBER_OF_OBJECTS objects with build(name) and returns the traced bytes per object.
+    Names are created beforehand so string allocations are not counted.
+    """
+    name_list = [f"name{index}" for index in range(NUMBER_OF_OBJECTS)]
+    tracemalloc.start()
+    object_list = [build(name) for name in name_list]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del object_list
+    return current / NUMBER_OF_OBJECTS
+
+CORE_TYPE_LIST = [
+    ("class", Class, lambda core_type, name: core_type(name, 0, 0)),
+    ("field", Field, lambda core_type, name: core_type("int", name)),
+    ("method", Method, lambda core_type, name: core_type("void", name)),
+    ("parameter", Parameter, lambda core_type, name: core_type("int", name)),
+    ("relationship", Relationship, lambda core_type, name: core_type(name, name, "Aggregation")),
+]
+
+def main():
+    print(f"{NUMBER_OF_OBJECTS} objects per type")
+    print(f"{'object':>14} {'__dict__ (B/obj)':>18} {'__slots__ (B/obj)':>18} {'saved':>8}")
+    for label, core_type, build in CORE_TYPE_LIST:
+        dict_type = unslotted(core_type)
+        dict_bytes = bytes_per_object(lambda name: build(dict_type, name))
+        slot_bytes = bytes_per_object(lambda name: build(core_type, name))
+        saved = 1 - slot_bytes / dict_bytes
+        print(f"{label:>14} {dict_bytes:>18.1f} {slot_bytes:>18.1f} {saved:>7.0%}")
+
+if __name__ == "__main__":
+    main()
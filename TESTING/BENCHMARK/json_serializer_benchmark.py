@@ -0,0 +1,96 @@
+###################################################################################################
+"""
+Module: json_serializer_benchmark
+Measures saving and loading a diagram with each diagram file encoding: the pretty (indented) layout
+and the compact layout, with the standard library and with orjson when it is installed, and the
+compact layout compressed with gzip and xz.
+Every combination is checked to load back the exact main data it saved.
+
+Run from the project root:
+    python TESTING/BENCHMARK/json_serializer_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import tempfile
+import time
+from rich.console import Console
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_MVC.UML_MODEL.uml_model import UMLModel
+from UML_MVC.UML_VIEW.UML_CLI_VIEW.uml_cli_view import UMLView
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager, UMLJsonSerializer, DEFAULT_JSON_BACKEND
+
+###################################################################################################
+
+NUMBER_OF_CLASSES = 2000
+FIELDS_PER_CLASS = 5
+METHODS_PER_CLASS = 3
+ROUNDS = 5
+
+def build_main_data(number_of_classes: int) -> dict:
+    """
+    Builds a diagram with the given number of classes, each with fields, methods and parameters,
+    plus one relationship per class, and returns its main data.
+    """
+    uml_model = UMLModel(view=UMLView(), console=Console(quiet=True))
+    with uml_model.transaction():
+        for class_index in range(number_of_classes):
+            class_name = f"Class{class_index}"
+            uml_model._add_class(class_name, is_loading=True)
+            for field_index in range(FIELDS_PER_CLASS):
+                uml_model._add_field(class_name, "int", f"field{field_index}", is_loading=True)
+            for method_index in range(METHODS_PER_CLASS):
+                uml_model._add_method(class_name, "void", f"method{method_index}", is_loading=True)
+                uml_model._add_parameter(class_name, str(method_index + 1), "string", "value", is_loading=True)
+            if class_index > 0:
+                uml_model._add_relationship(f"Class{class_index - 1}", class_name, "Aggregation", is_loading=True)
+    return uml_model._copy_main_data()
+
+def time_round_trip(serializer: UMLJsonSerializer, main_data: dict, file_path: str):
+    """
+    Saves and loads the diagram ROUNDS times and returns the best save time, the best load time
+    (in milliseconds) and the file size in bytes.
+    """
+    storage_manager = UMLStorageManager(serializer)
+    best_save = best_load = float("inf")
+    for _ in range(ROUNDS):
+        start = time.perf_counter()
+        storage_manager._save_data_to_json_gui(file_path, main_data)
+        best_save = min(best_save, time.perf_counter() - start)
+        start = time.perf_counter()
+        loaded_data = storage_manager._load_data_from_json_gui(file_path)
+        best_load = min(best_load, time.perf_counter() - start)
+        assert loaded_data == main_data
+    return best_save * 1000, best_load * 1000, os.path.getsize(file_path)
+
+def main():
+    main_data = build_main_data(NUMBER_OF_CLASSES)
+    backend_list = ["json"] + (["orjson"] if DEFAULT_JSON_BACKEND == "orjson" else [])
+    print(f"{NUMBER_OF_CLASSES} classes, best of {ROUNDS}")
+    print(f"{'encoding':>16} {'save (ms)':>10} {'load (ms)':>10} {'size (KiB)':>11}")
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "diagram.json")
+        for is_pretty in (True, False):
+            for backend in backend_list:
+                if is_pretty and backend != "json":
+                    # The pretty layout is always written by the standard library
+                    continue
+                serializer = UMLJsonSerializer(is_pretty=is_pretty, backend=backend)
+                save_time, load_time, size = time_round_trip(serializer, main_data, file_path)
+                encoding = f"{'pretty' if is_pretty else 'compact'}/{backend}"
+                print(f"{encoding:>16} {save_time:>10.1f} {load_time:>10.1f} {size / 1024:>11.1f}")
+        # Compressed files, written and read piece by piece
+        for extension in (".json.gz", ".json.xz"):
+            compressed_path = os.path.join(directory, f"diagram{extension}")
+            save_time, load_time, size = time_round_trip(UMLJsonSerializer(), main_data, compressed_path)
+            encoding = f"compact{extension[5:]}"
+            print(f"{encoding:>16} {save_time:>10.1f} {load_time:>10.1f} {size / 1024:>11.1f}")
+
+if __name__ == "__main__":
+    main()
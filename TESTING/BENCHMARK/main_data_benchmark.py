@@ -0,0 +1,71 @@
+###################################################################################################
+"""
+Module: main_data_benchmark
+Measures the cost of a single edit (adding a field) on diagrams of increasing size.
+The incremental main data update should stay flat as the diagram grows, while the
+full rebuild (the old behavior) grows linearly with the number of classes.
+
+Run from the project root:
+    python TESTING/BENCHMARK/main_data_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import time
+from rich.console import Console
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_MVC.UML_MODEL.uml_model import UMLModel
+from UML_MVC.UML_VIEW.UML_CLI_VIEW.uml_cli_view import UMLView
+
+###################################################################################################
+
+DIAGRAM_SIZES = [250, 500, 1000, 2000]
+EDITS_PER_SIZE = 200
+FIELDS_PER_CLASS = 3
+
+def build_model(number_of_classes: int) -> UMLModel:
+    """
+    Builds a model with the given number of classes, each with a few fields and one method.
+    """
+    uml_model = UMLModel(view=UMLView(), console=Console(quiet=True))
+    for class_index in range(number_of_classes):
+        class_name = f"Class{class_index}"
+        uml_model._add_class(class_name, is_loading=True)
+        for field_index in range(FIELDS_PER_CLASS):
+            uml_model._add_field(class_name, "int", f"field{field_index}", is_loading=True)
+        uml_model._add_method(class_name, "void", "run", is_loading=True)
+    return uml_model
+
+def time_edits(uml_model: UMLModel, number_of_classes: int, is_full_rebuild: bool) -> float:
+    """
+    Adds EDITS_PER_SIZE fields spread over the diagram and returns the average time per edit in microseconds.
+    """
+    start = time.perf_counter()
+    for edit_index in range(EDITS_PER_SIZE):
+        class_name = f"Class{(edit_index * 7) % number_of_classes}"
+        uml_model._add_field(class_name, "string", f"extra{edit_index}")
+        if is_full_rebuild:
+            # Old behavior: every edit re-serialized the whole diagram
+            uml_model._update_main_data_for_every_action()
+    elapsed = time.perf_counter() - start
+    return elapsed / EDITS_PER_SIZE * 1_000_000
+
+def main():
+    print(f"{'classes':>8} {'incremental (us/edit)':>24} {'full rebuild (us/edit)':>24}")
+    for number_of_classes in DIAGRAM_SIZES:
+        incremental_model = build_model(number_of_classes)
+        incremental_cost = time_edits(incremental_model, number_of_classes, is_full_rebuild=False)
+        # Make sure the incremental path produced the same main data as a full rebuild
+        assert incremental_model._check_main_data_consistency()
+        full_rebuild_model = build_model(number_of_classes)
+        full_rebuild_cost = time_edits(full_rebuild_model, number_of_classes, is_full_rebuild=True)
+        print(f"{number_of_classes:>8} {incremental_cost:>24.1f} {full_rebuild_cost:>24.1f}")
+
+if __name__ == "__main__":
+    main()
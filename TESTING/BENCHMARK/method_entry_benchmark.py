@@ -0,0 +1,85 @@
+###################################################################################################
+"""
+Module: method_entry_benchmark
+Compares the old one-key {method: parameter_list} dictionary representation of a method
+with the slotted UMLMethodEntry record on a synthetic diagram of 100k methods.
+Reports memory held by the method containers (tracemalloc) and the time to walk every
+method and its parameters, which is what serialization and lookups do.
+
+Run from the project root:
+    python TESTING/BENCHMARK/method_entry_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import time
+import tracemalloc
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_METHOD.uml_method_entry import UMLMethodEntry as MethodEntry
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+
+###################################################################################################
+
+NUMBER_OF_METHODS = 100_000
+PARAMS_PER_METHOD = 2
+ROUNDS = 5
+
+def build_members():
+    """
+    Builds the methods and parameter lists shared by both representations,
+    so only the container cost is measured.
+    """
+    method_list = [Method("void", f"method{index}") for index in range(NUMBER_OF_METHODS)]
+    param_list_list = [[Parameter("int", f"param{param_index}") for param_index in range(PARAMS_PER_METHOD)]
+                       for _ in range(NUMBER_OF_METHODS)]
+    return method_list, param_list_list
+
+def measure_containers(build):
+    """
+    Returns the containers produced by build() and the bytes they allocated.
+    """
+    tracemalloc.start()
+    containers = build()
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return containers, current
+
+def walk_dictionaries(container_list) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for element in container_list:
+            method, param_list = next(iter(element.items()))
+            method._get_name()
+            len(param_list)
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+def walk_entries(container_list) -> float:
+    start = time.perf_counter()
+    for _ in range(ROUNDS):
+        for entry in container_list:
+            entry._get_method()._get_name()
+            len(entry._get_parameter_list())
+    return (time.perf_counter() - start) / ROUNDS * 1000
+
+def main():
+    method_list, param_list_list = build_members()
+    dictionary_list, dictionary_bytes = measure_containers(
+        lambda: [{method: param_list} for method, param_list in zip(method_list, param_list_list)])
+    entry_list, entry_bytes = measure_containers(
+        lambda: [MethodEntry(method, param_list) for method, param_list in zip(method_list, param_list_list)])
+    dictionary_ms = walk_dictionaries(dictionary_list)
+    entry_ms = walk_entries(entry_list)
+    print(f"{NUMBER_OF_METHODS} methods, {PARAMS_PER_METHOD} parameters each")
+    print(f"{'representation':>16} {'container bytes':>16} {'bytes/method':>14} {'walk (ms)':>10}")
+    print(f"{'dict':>16} {dictionary_bytes:>16} {dictionary_bytes / NUMBER_OF_METHODS:>14.1f} {dictionary_ms:>10.1f}")
+    print(f"{'MethodEntry':>16} {entry_bytes:>16} {entry_bytes / NUMBER_OF_METHODS:>14.1f} {entry_ms:>10.1f}")
+
+if __name__ == "__main__":
+    main()
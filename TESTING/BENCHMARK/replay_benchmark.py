@@ -0,0 +1,69 @@
+###################################################################################################
+"""
+Module: replay_benchmark
+Compares replaying a stream of three-child composite records with replaying the same child records
+as a flat stream. Each composite runs in a nested transaction so its children are applied together
+or not at all; that savepoint should cost no more than the children themselves.
+
+Run from the project root:
+    python TESTING/BENCHMARK/replay_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import time
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_MVC.uml_replay_engine import UMLReplayEngine
+
+###################################################################################################
+
+NUMBER_OF_COMPOSITES = 1500
+
+def build_composite_record_list(number_of_composites: int) -> list:
+    """
+    Builds composite records that each add a class with a field and a method.
+    """
+    return [["composite", [["add_class", f"Class{index}"],
+                           ["add_field", f"Class{index}", "int", "count"],
+                           ["add_method", f"Class{index}", "void", "run"]]]
+            for index in range(number_of_composites)]
+
+def measure(record_list: list) -> tuple:
+    """
+    Replays the records on a new headless model and returns the engine and the time in milliseconds.
+    """
+    engine = UMLReplayEngine()
+    start = time.perf_counter()
+    assert engine.replay(record_list)
+    elapsed = time.perf_counter() - start
+    return engine, elapsed * 1000
+
+def without_position(engine: UMLReplayEngine) -> dict:
+    """
+    Returns a copy of the engine's main data without the class positions.
+    """
+    main_data = engine._get_model()._copy_main_data()
+    for class_element in main_data["classes"]:
+        class_element.pop("position", None)
+    return main_data
+
+def main():
+    composite_record_list = build_composite_record_list(NUMBER_OF_COMPOSITES)
+    flat_record_list = [child_record for record in composite_record_list for child_record in record[1]]
+    composite_engine, composite_time = measure(composite_record_list)
+    flat_engine, flat_time = measure(flat_record_list)
+    # New classes get cascading default positions, compare everything else
+    assert without_position(composite_engine) == without_position(flat_engine)
+    print(f"{NUMBER_OF_COMPOSITES} composites of 3 records")
+    print(f"{'stream':>10} {'records':>8} {'time (ms)':>10}")
+    print(f"{'composite':>10} {len(composite_record_list):>8} {composite_time:>10.1f}")
+    print(f"{'flat':>10} {len(flat_record_list):>8} {flat_time:>10.1f}")
+
+if __name__ == "__main__":
+    main()
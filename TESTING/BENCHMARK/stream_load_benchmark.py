@@ -0,0 +1,65 @@
+###################################################################################################
+"""
+Module: stream_load_benchmark
+Compares loading a large diagram file by decoding the whole document first (the previous
+behavior) with streaming it one class record at a time into the bulk-load path.
+Reports the peak traced memory and the time of each, and checks both give the same diagram.
+
+Run from the project root:
+    python TESTING/BENCHMARK/stream_load_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from rich.console import Console
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_MVC.UML_MODEL.uml_model import UMLModel
+from UML_MVC.UML_VIEW.UML_CLI_VIEW.uml_cli_view import UMLView
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager, UMLJsonSerializer
+from TESTING.BENCHMARK.json_serializer_benchmark import build_main_data
+
+###################################################################################################
+
+NUMBER_OF_CLASSES = 5000
+
+def measure(load) -> tuple:
+    """
+    Runs one load into a fresh model and returns the model, the peak traced memory in MiB and the time in milliseconds.
+    """
+    uml_model = UMLModel(view=UMLView(), console=Console(quiet=True))
+    tracemalloc.start()
+    start = time.perf_counter()
+    assert load(uml_model)
+    elapsed = time.perf_counter() - start
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return uml_model, peak / (1024 * 1024), elapsed * 1000
+
+def main():
+    main_data = build_main_data(NUMBER_OF_CLASSES)
+    storage_manager = UMLStorageManager(UMLJsonSerializer(backend="json"))
+    with tempfile.TemporaryDirectory() as directory:
+        file_path = os.path.join(directory, "diagram.json")
+        storage_manager._save_data_to_json_gui(file_path, main_data)
+        del main_data
+        whole_model, whole_peak, whole_time = measure(
+            lambda uml_model: uml_model._bulk_load_main_data(storage_manager._load_data_from_json_gui(file_path)))
+        stream_model, stream_peak, stream_time = measure(
+            lambda uml_model: uml_model._bulk_load_stream(storage_manager._stream_data_from_json_gui(file_path)))
+    assert whole_model._copy_main_data() == stream_model._copy_main_data()
+    print(f"{NUMBER_OF_CLASSES} classes")
+    print(f"{'loader':>10} {'peak (MiB)':>11} {'time (ms)':>10}")
+    print(f"{'whole':>10} {whole_peak:>11.1f} {whole_time:>10.1f}")
+    print(f"{'stream':>10} {stream_peak:>11.1f} {stream_time:>10.1f}")
+
+if __name__ == "__main__":
+    main()
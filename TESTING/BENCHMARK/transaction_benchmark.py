@@ -0,0 +1,93 @@
+###################################################################################################
+"""
+Module: transaction_benchmark
+Measures the cost of small transactions on diagrams of increasing size, compared with the same edit
+made without a transaction. Entering a transaction, committing it and rolling it back should only
+depend on what the transaction touches, not on the number of classes in the diagram. The same holds
+for one-child composite commands, which run in a transaction, whether the child succeeds or fails.
+
+Run from the project root:
+    python TESTING/BENCHMARK/transaction_benchmark.py
+"""
+###################################################################################################
+
+import os
+import sys
+import time
+from rich.console import Console
+
+# ADD ROOT PATH #
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+os.chdir(root_path)
+
+from UML_MVC.UML_MODEL.uml_model import UMLModel
+from UML_MVC.uml_command_pattern import AddFieldCommand, CompositeCommand
+
+###################################################################################################
+
+DIAGRAM_SIZES = [750, 1500, 3000]
+TRANSACTIONS_PER_SIZE = 50
+FIELDS_PER_CLASS = 3
+
+class AbortTransaction(Exception):
+    pass
+
+def build_model(number_of_classes: int) -> UMLModel:
+    """
+    Builds a model with the given number of classes, each with a few fields and one method.
+    """
+    uml_model = UMLModel(None, Console(quiet=True))
+    with uml_model.transaction():
+        for class_index in range(number_of_classes):
+            class_name = f"Class{class_index}"
+            uml_model._add_class(class_name, is_loading=True)
+            for field_index in range(FIELDS_PER_CLASS):
+                uml_model._add_field(class_name, "int", f"field{field_index}", is_loading=True)
+            uml_model._add_method(class_name, "void", "run", is_loading=True)
+    return uml_model
+
+def edit(uml_model: UMLModel, number_of_classes: int, edit_index: int):
+    """
+    Adds a field to one class and a relationship between two classes.
+    """
+    class_name = f"Class{(edit_index * 7) % number_of_classes}"
+    uml_model._add_field(class_name, "string", f"extra{edit_index}")
+    uml_model._add_relationship(class_name, f"Class{(edit_index * 7 + 1) % number_of_classes}", "Aggregation")
+
+def time_edits(number_of_classes: int, mode: str) -> float:
+    """
+    Runs TRANSACTIONS_PER_SIZE edits in the given mode ("plain", "commit", "rollback", "composite" or
+    "failed composite") and returns the total time in milliseconds.
+    """
+    uml_model = build_model(number_of_classes)
+    start = time.perf_counter()
+    for edit_index in range(TRANSACTIONS_PER_SIZE):
+        if mode == "plain":
+            edit(uml_model, number_of_classes, edit_index)
+            continue
+        if mode in ("composite", "failed composite"):
+            # The failing child adds a field that already exists
+            field_name = "field0" if mode == "failed composite" else f"extra{edit_index}"
+            CompositeCommand(uml_model, [AddFieldCommand(uml_model, f"Class{edit_index}", "string", field_name)]).execute()
+            continue
+        try:
+            with uml_model.transaction():
+                edit(uml_model, number_of_classes, edit_index)
+                if mode == "rollback":
+                    raise AbortTransaction()
+        except AbortTransaction:
+            pass
+    elapsed = time.perf_counter() - start
+    assert uml_model._check_main_data_consistency()
+    return elapsed * 1000
+
+def main():
+    mode_list = ["plain", "commit", "rollback", "composite", "failed composite"]
+    print(f"{'classes':>8}" + "".join(f" {mode + ' (ms)':>22}" for mode in mode_list))
+    for number_of_classes in DIAGRAM_SIZES:
+        cost_list = [time_edits(number_of_classes, mode) for mode in mode_list]
+        print(f"{number_of_classes:>8}" + "".join(f" {cost:>22.1f}" for cost in cost_list))
+
+if __name__ == "__main__":
+    main()
@@ -1,6 +1,10 @@
 import sys
 import os
+import json
+import threading
+import tracemalloc
 import pytest
+from collections.abc import Mapping
 from rich.console import Console
 from unittest.mock import patch, MagicMock
 
@@ -11,7 +15,12 @@ sys.path.append(root_path)
 # Import the UMLModel class and UMLObserver
 from UML_MVC.UML_MODEL.uml_model import UMLModel
 from UML_MVC.UML_VIEW.UML_CLI_VIEW.uml_cli_view import UMLView
+from UML_MVC.uml_command_factory import CommandFactory
+from UML_MVC.UML_CONTROLLER.uml_session_journal import UMLSessionJournal
+from UML_MVC.uml_command_pattern import AddClassCommand, DeleteClassCommand, InputHandler, MoveUnitCommand, MoveUnitGroupCommand, RenameClassCommand, ReplaceParameterListCommand
 from UML_MVC.uml_observer import UMLObserver
+from UML_MVC.uml_replay_engine import UMLReplayEngine, read_record_file, write_record_file
+from UML_ENUM_CLASS.uml_enum import DispatchMode
 
 # Import other dependencies such as UMLClass, UMLField, UMLMethod, UMLParameter, UMLRelationship
 from UML_CORE.UML_CLASS.uml_class import UMLClass
@@ -19,7 +28,7 @@ from UML_CORE.UML_FIELD.uml_field import UMLField
 from UML_CORE.UML_METHOD.uml_method import UMLMethod
 from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter
 from UML_CORE.UML_RELATIONSHIP.uml_relationship import UMLRelationship
-from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager  # Corrected import
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager, UMLJsonSerializer, UMLJsonStreamReader, DEFAULT_JSON_BACKEND, STREAM_CHUNK_SIZE  # Corrected import
 
 ###############################################################################
 
@@ -91,7 +100,8 @@ def test_uml_model_init():
     assert uml_model._UMLModel__console == console
     assert isinstance(uml_model._UMLModel__class_list, dict)
     assert isinstance(uml_model._UMLModel__storage_manager, UMLStorageManager)  # Corrected to UMLStorageManager
-    assert isinstance(uml_model._UMLModel__relationship_list, list)
+    assert isinstance(uml_model._UMLModel__relationship_list, dict)
+    assert isinstance(uml_model._UMLModel__relationship_index, dict)
     assert isinstance(uml_model._UMLModel__main_data, dict)
     assert isinstance(uml_model._observers, list)
 
@@ -157,9 +167,30 @@ def test_observer_notification_on_class_addition(uml_model, sample_observer):
 
 def test_get_class_list(uml_model):
     class_list = uml_model._get_class_list()
-    assert isinstance(class_list, dict)
+    assert isinstance(class_list, Mapping)
     assert len(class_list) == 0
 
+def test_get_class_list_is_read_only_view(uml_model):
+    class_list = uml_model._get_class_list()
+    uml_model._add_class("TestClass")
+    # The view follows the model instead of being a snapshot
+    assert class_list["TestClass"] is uml_model._UMLModel__class_list["TestClass"]
+    with pytest.raises(TypeError):
+        class_list["Other"] = UMLClass(class_name="Other")
+
+def test_copy_class_list(uml_model):
+    uml_model._add_class("TestClass")
+    class_list_copy = uml_model._copy_class_list()
+    class_list_copy.pop("TestClass")
+    assert uml_model._has_class("TestClass")
+
+def test_has_and_get_class(uml_model):
+    uml_model._add_class("TestClass")
+    assert uml_model._has_class("TestClass")
+    assert not uml_model._has_class("Missing")
+    assert uml_model._get_class("TestClass") is uml_model._UMLModel__class_list["TestClass"]
+    assert uml_model._get_class("Missing") is None
+
 def test_get_relationship_list(uml_model):
     relationship_list = uml_model._get_relationship_list()
     assert isinstance(relationship_list, list)
@@ -171,9 +202,38 @@ def test_get_storage_manager(uml_model):
 
 def test_get_main_data(uml_model):
     main_data = uml_model._get_main_data()
-    assert isinstance(main_data, dict), "Expected main_data to be a dictionary"
+    assert isinstance(main_data, Mapping), "Expected main_data to be a mapping"
     assert len(main_data) == 2, "Expected main_data to be initially be empty with {'classes': [], 'relationships': []} "
 
+def test_get_main_data_is_read_only_view(uml_model):
+    main_data = uml_model._get_main_data()
+    uml_model._add_class("TestClass")
+    uml_model._add_field("TestClass", "int", "count")
+    # Nested entries are wrapped too, so no level can be modified through the view
+    assert main_data["classes"][0]["fields"] == [{"name": "count", "type": "int"}]
+    with pytest.raises(TypeError):
+        main_data["classes"][0]["name"] = "Other"
+    with pytest.raises(AttributeError):
+        main_data["classes"].append({})
+
+def test_copy_main_data(uml_model):
+    uml_model._add_class("TestClass")
+    main_data_copy = uml_model._copy_main_data()
+    main_data_copy["classes"][0]["name"] = "Other"
+    assert uml_model._get_main_data()["classes"][0]["name"] == "TestClass"
+    assert uml_model._get_main_data()._copy() == uml_model._get_main_data()
+
+def test_copy_class_data(uml_model):
+    uml_model._add_class("ClassA")
+    uml_model._add_class("ClassB")
+    uml_model._add_class("ClassC")
+    uml_model._add_relationship("ClassA", "ClassB", "Aggregation")
+    uml_model._add_relationship("ClassB", "ClassC", "Composition")
+    class_data = uml_model._copy_class_data("ClassA")
+    assert [each_class["name"] for each_class in class_data["classes"]] == ["ClassA"]
+    assert class_data["relationships"] == [{"source": "ClassA", "destination": "ClassB", "type": "Aggregation"}]
+    assert uml_model._copy_class_data("Missing") == {"classes": [], "relationships": []}
+
 def test_set_main_data(uml_model):
     # Set some dummy data
     new_main_data = {"classes": [], "relationships": []}
@@ -1251,6 +1311,303 @@ def test_change_relationship_type(uml_model, sample_observer):
         "new_type": "Composition"
     }
 
+def test_relationship_index_after_rename_and_delete(uml_model):
+    for class_name in ["ClassA", "ClassB", "ClassC"]:
+        uml_model._add_class(class_name)
+    uml_model._add_relationship("ClassA", "ClassB", "Aggregation")
+    uml_model._add_relationship("ClassC", "ClassA", "Composition")
+    uml_model._add_relationship("ClassA", "ClassA", "Inheritance")
+    uml_model._add_relationship("ClassB", "ClassC", "Realization")
+
+    # Renaming keeps the relationship order and re-keys only the incident edges
+    uml_model._rename_class("ClassA", "ClassD")
+    assert [(rel._get_source_class(), rel._get_destination_class()) for rel in uml_model._get_relationship_list()] == [
+        ("ClassD", "ClassB"), ("ClassC", "ClassD"), ("ClassD", "ClassD"), ("ClassB", "ClassC")]
+    assert uml_model._relationship_exist("ClassD", "ClassD")
+    assert not uml_model._relationship_exist("ClassA", "ClassB")
+    assert uml_model._get_rel_type("ClassC", "ClassD") == "Composition"
+
+    # Deleting a class removes all incident edges, including the self relationship
+    uml_model._delete_class("ClassD")
+    assert [(rel._get_source_class(), rel._get_destination_class()) for rel in uml_model._get_relationship_list()] == [("ClassB", "ClassC")]
+    assert uml_model._UMLModel__relationship_index.keys() == {("ClassB", "ClassC")}
+    assert uml_model._UMLModel__outgoing_relationship == {"ClassB": {"ClassC"}}
+    assert uml_model._UMLModel__incoming_relationship == {"ClassC": {"ClassB"}}
+    assert uml_model._check_main_data_consistency()
+
+def assert_member_index_matches_lists(class_object):
+    # The name indexes inside a class must always mirror its field and method lists
+    expected_method_index = {}
+    for method_and_parameter in class_object._get_method_and_parameters_list():
+        for method in method_and_parameter:
+            expected_method_index.setdefault(method._get_name(), []).append(method)
+    assert class_object._get_field_name_index() == {field._get_name(): field for field in class_object._get_class_field_list()}
+    assert class_object._get_method_name_index() == expected_method_index
+    expected_signature_index = {}
+    for method_and_parameter in class_object._get_method_and_parameters_list():
+        for method, param_list in method_and_parameter.items():
+            signature = class_object._make_signature(method._get_name(), param_list)
+            expected_signature_index[signature] = expected_signature_index.get(signature, 0) + 1
+    assert class_object._get_signature_index() == expected_signature_index
+
+def test_member_index_follows_every_edit(uml_model):
+    uml_model._add_class("ClassA")
+    class_object = uml_model._UMLModel__class_list["ClassA"]
+    uml_model._add_field("ClassA", "int", "count")
+    uml_model._add_field("ClassA", "string", "label")
+    uml_model._rename_field("ClassA", "count", "total")
+    uml_model._delete_field("ClassA", "label")
+    assert_member_index_matches_lists(class_object)
+    assert uml_model._get_chosen_field_or_method("ClassA", "total", is_field=True)._get_type() == "int"
+    assert uml_model._get_chosen_field_or_method("ClassA", "count", is_field=True) is None
+
+    uml_model._add_method("ClassA", "void", "run")
+    uml_model._add_method("ClassA", "int", "stop")
+    uml_model._add_parameter("ClassA", "1", "int", "speed")
+    uml_model._rename_method("ClassA", "2", "halt")
+    assert_member_index_matches_lists(class_object)
+    assert uml_model._get_chosen_field_or_method("ClassA", "halt", is_field=False)._get_type() == "int"
+    uml_model._delete_method("ClassA", "1")
+    assert_member_index_matches_lists(class_object)
+    assert uml_model._get_chosen_field_or_method("ClassA", "run", is_field=False) is None
+
+def test_overload_duplicate_detection_uses_signatures(uml_model):
+    uml_model._add_class("ClassA")
+    class_object = uml_model._UMLModel__class_list["ClassA"]
+    uml_model._add_method("ClassA", "void", "run")
+    uml_model._add_parameter("ClassA", "1", "int", "speed")
+    # An overload with a different parameter type list is accepted
+    overload = uml_model.create_method("void", "run")
+    assert uml_model._check_method_param_list("ClassA", {overload: []})
+    assert not uml_model._check_method_param_list("ClassA", {overload: [uml_model.create_parameter("int", "other")]})
+    # Editing the parameter type updates the signature in place
+    assert uml_model._edit_parameter_type("ClassA", "1", "speed", "float")
+    assert class_object._has_signature(("run", ("float",)))
+    assert not class_object._has_signature(("run", ("int",)))
+    assert uml_model._replace_param_list("ClassA", "1", ["int first", "string second"])
+    assert class_object._has_signature(("run", ("int", "string")))
+    assert uml_model._delete_parameter("ClassA", "1", "first")
+    assert class_object._get_signature_index() == {("run", ("string",)): 1}
+    assert_member_index_matches_lists(class_object)
+
+def test_member_index_after_bulk_load(uml_model, sample_main_data):
+    assert uml_model._bulk_load_main_data(sample_main_data)
+    for class_object in uml_model._UMLModel__class_list.values():
+        assert_member_index_matches_lists(class_object)
+
+def test_type_registry_tracks_usages(uml_model):
+    uml_model._add_class("ClassA")
+    uml_model._add_class("ClassB")
+    uml_model._add_field("ClassA", "int", "count")
+    uml_model._add_field("ClassB", "int", "size")
+    uml_model._add_method("ClassA", "int", "total")
+    uml_model._add_parameter("ClassA", "1", "string", "label")
+    usage_list = uml_model._find_type_usage("int")
+    assert sorted((usage["class_name"], usage["kind"], usage["name"]) for usage in usage_list) == [
+        ("ClassA", "field", "count"), ("ClassA", "method", "total"), ("ClassB", "field", "size")]
+    # Members sharing a type share the same string
+    assert len({id(usage["member"]._get_type()) for usage in usage_list}) == 1
+
+    # Type changes move the member between types, unused types disappear
+    uml_model._change_data_type(class_name="ClassA", input_name="count", new_type="float", is_field=True)
+    uml_model._edit_parameter_type("ClassA", "1", "label", "ClassB")
+    registry = uml_model._get_type_registry()
+    assert registry._get_usage_count("int") == 2
+    assert sorted(registry._get_type_list()) == ["ClassB", "float", "int"]
+    assert [usage["name"] for usage in uml_model._find_type_usage("ClassB")] == ["label"]
+
+    # Renaming the owner is reflected, deleting members and classes removes their usages
+    uml_model._rename_class("ClassA", "ClassC")
+    assert {usage["class_name"] for usage in uml_model._find_type_usage("float")} == {"ClassC"}
+    uml_model._delete_method("ClassC", "1")
+    assert uml_model._find_type_usage("ClassB") == []
+    uml_model._delete_class("ClassB")
+    assert sorted(registry._get_type_list()) == ["float"]
+
+def test_type_registry_after_bulk_load(uml_model, sample_main_data):
+    assert uml_model._bulk_load_main_data(sample_main_data)
+    registry = uml_model._get_type_registry()
+    expected_count = {}
+    for class_element in sample_main_data["classes"]:
+        for field in class_element["fields"]:
+            expected_count[field["type"]] = expected_count.get(field["type"], 0) + 1
+        for method in class_element["methods"]:
+            expected_count[method["return_type"]] = expected_count.get(method["return_type"], 0) + 1
+            for param in method["params"]:
+                expected_count[param["type"]] = expected_count.get(param["type"], 0) + 1
+    assert {type_name: registry._get_usage_count(type_name) for type_name in registry._get_type_list()} == expected_count
+
+def build_refactor_diagram(uml_model):
+    uml_model._add_class("Engine")
+    uml_model._add_class("Car")
+    uml_model._add_field("Car", "Engine", "engine")
+    uml_model._add_field("Engine", "Engine", "spare")
+    uml_model._add_method("Car", "Engine", "getEngine")
+    uml_model._add_method("Car", "void", "swap")
+    uml_model._add_parameter("Car", "2", "Engine", "newEngine")
+    uml_model._add_parameter("Car", "2", "int", "slot")
+
+def get_member_type_list(uml_model, class_name):
+    class_object = uml_model._UMLModel__class_list[class_name]
+    type_list = [field._get_type() for field in class_object._get_class_field_list()]
+    for method_entry in class_object._get_method_and_parameters_list():
+        type_list.append(method_entry._get_method()._get_type())
+        type_list.extend(param._get_type() for param in method_entry._get_parameter_list())
+    return type_list
+
+def test_rename_class_refactor_updates_type_references(uml_model, sample_observer):
+    build_refactor_diagram(uml_model)
+    uml_model._attach_observer(sample_observer)
+    assert uml_model._rename_class("Engine", "Motor", is_refactor=True)
+    assert get_member_type_list(uml_model, "Car") == ["Motor", "Motor", "void", "Motor", "int"]
+    assert get_member_type_list(uml_model, "Motor") == ["Motor"]
+    assert uml_model._find_type_usage("Engine") == []
+    assert uml_model._UMLModel__class_list["Car"]._has_signature(("swap", ("Motor", "int")))
+    assert uml_model._check_main_data_consistency()
+    # One notification carries the rename and every retyped member
+    assert len(sample_observer.events) == 1
+    retyped_member_list = sample_observer.events[0]["data"]["retyped_member_list"]
+    assert sorted((member["class_name"], member["kind"], member["name"]) for member in retyped_member_list) == [
+        ("Car", "field", "engine"), ("Car", "method", "getEngine"), ("Car", "parameter", "newEngine"), ("Motor", "field", "spare")]
+
+def test_rename_class_without_refactor_keeps_types(uml_model):
+    build_refactor_diagram(uml_model)
+    assert uml_model._rename_class("Engine", "Motor")
+    assert get_member_type_list(uml_model, "Car") == ["Engine", "Engine", "void", "Engine", "int"]
+
+def test_rename_class_refactor_rejects_duplicate_signature(uml_model):
+    uml_model._add_class("Engine")
+    uml_model._add_class("Car")
+    uml_model._add_method("Car", "void", "fit")
+    uml_model._add_parameter("Car", "1", "Engine", "part")
+    uml_model._add_method("Car", "void", "fitOther")
+    uml_model._add_parameter("Car", "2", "Motor", "part")
+    uml_model._rename_method("Car", "2", "fit")
+    # fit(Engine) would become fit(Motor), which already exists
+    assert uml_model._rename_class("Engine", "Motor", is_refactor=True) is False
+    assert "Engine" in uml_model._UMLModel__class_list
+    assert get_member_type_list(uml_model, "Car") == ["void", "Engine", "void", "Motor"]
+
+def test_rename_class_refactor_command_undo_redo(uml_model):
+    build_refactor_diagram(uml_model)
+    # A member that already used the new name as its type is not touched by undo
+    input_handler = InputHandler()
+    uml_model._add_class("Wheel")
+    uml_model._add_field("Wheel", "Motor", "motor")
+    assert input_handler.execute_command(RenameClassCommand(uml_model, class_name="Engine", new_name="Motor", is_refactor=True))
+    assert get_member_type_list(uml_model, "Wheel") == ["Motor"]
+    input_handler.undo()
+    assert get_member_type_list(uml_model, "Car") == ["Engine", "Engine", "void", "Engine", "int"]
+    assert get_member_type_list(uml_model, "Engine") == ["Engine"]
+    assert get_member_type_list(uml_model, "Wheel") == ["Motor"]
+    input_handler.redo()
+    assert get_member_type_list(uml_model, "Car") == ["Motor", "Motor", "void", "Motor", "int"]
+    assert get_member_type_list(uml_model, "Motor") == ["Motor"]
+    assert uml_model._check_main_data_consistency()
+
+def test_rename_class_refactor_undo_keeps_same_named_members(uml_model):
+    uml_model._add_class("Old")
+    uml_model._add_class("User")
+    uml_model._add_method("User", "void", "a")
+    uml_model._add_parameter("User", "1", "Old", "x")
+    uml_model._add_method("User", "void", "b")
+    uml_model._add_parameter("User", "2", "New", "x")
+    input_handler = InputHandler()
+    assert input_handler.execute_command(RenameClassCommand(uml_model, class_name="Old", new_name="New", is_refactor=True))
+    assert get_member_type_list(uml_model, "User") == ["void", "New", "void", "New"]
+    # Only the parameter of a() was retyped, b(x: New) keeps its type
+    input_handler.undo()
+    assert get_member_type_list(uml_model, "User") == ["void", "Old", "void", "New"]
+    input_handler.redo()
+    assert get_member_type_list(uml_model, "User") == ["void", "New", "void", "New"]
+    input_handler.undo()
+    assert get_member_type_list(uml_model, "User") == ["void", "Old", "void", "New"]
+    assert uml_model._check_main_data_consistency()
+
+def test_replace_param_list_command_cli_undo_redo(uml_model):
+    uml_model._add_class("Car")
+    uml_model._add_method("Car", "void", "drive")
+    uml_model._add_parameter("Car", "1", "int", "speed")
+    uml_model._add_method("Car", "void", "park")
+    input_handler = InputHandler(uml_model=uml_model)
+    assert input_handler.execute_command(ReplaceParameterListCommand(uml_model, class_name="Car", method_num="1",
+                                                                     new_param_list_str=["float speed", "string gear"]))
+    assert input_handler.execute_command(ReplaceParameterListCommand(uml_model, class_name="Car", method_num="2",
+                                                                     new_param_list_str=["int slot"]))
+    assert uml_model._get_param_list("Car", "1") == ["float speed", "string gear"]
+    input_handler.undo()
+    # A method without parameters gets an empty list back
+    assert uml_model._get_param_list("Car", "2") == []
+    input_handler.undo()
+    assert uml_model._get_param_list("Car", "1") == ["int speed"]
+    input_handler.redo()
+    assert uml_model._get_param_list("Car", "1") == ["float speed", "string gear"]
+    assert input_handler.goto(0)
+    assert uml_model._get_param_list("Car", "1") == ["int speed"]
+    assert uml_model._check_main_data_consistency()
+
+def test_delete_class_command_undo(uml_model):
+    uml_model._add_class("ClassA")
+    uml_model._add_class("ClassB")
+    uml_model._add_field("ClassA", "int", "count")
+    uml_model._add_method("ClassA", "void", "run")
+    uml_model._add_parameter("ClassA", "1", "int", "speed")
+    uml_model._add_relationship("ClassB", "ClassA", "Aggregation")
+    expected_class_entry = uml_model._class_json_format("ClassA")
+    input_handler = InputHandler()
+    # The undo snapshot only covers the deleted class, never the whole diagram
+    with patch.object(uml_model, '_copy_main_data') as mock_copy_main_data:
+        assert input_handler.execute_command(DeleteClassCommand(uml_model, class_name="ClassA"))
+        mock_copy_main_data.assert_not_called()
+    assert not uml_model._has_class("ClassA")
+    input_handler.undo()
+    assert uml_model._class_json_format("ClassA") == expected_class_entry
+    assert uml_model._relationship_exist("ClassB", "ClassA")
+    assert uml_model._find_type_usage("int")[0]["class_name"] == "ClassA"
+    assert uml_model._check_main_data_consistency()
+    input_handler.redo()
+    assert not uml_model._has_class("ClassA")
+    assert not uml_model._relationship_exist("ClassB", "ClassA")
+
+def test_delete_class_command_undo_is_one_operation(uml_model, sample_observer):
+    uml_model._add_class("ClassA")
+    uml_model._add_class("ClassB")
+    for index in range(5):
+        uml_model._add_field("ClassA", "int", f"field{index}")
+    uml_model._add_relationship("ClassA", "ClassB", "Composition")
+    command = DeleteClassCommand(uml_model, class_name="ClassA")
+    command.execute()
+    uml_model._attach_observer(sample_observer)
+    with patch.object(uml_model, '_class_json_format', wraps=uml_model._class_json_format) as mock_class_format:
+        assert command.undo()
+        mock_class_format.assert_called_once_with("ClassA")
+    assert [event["event_type"] for event in sample_observer.events] == ["add_class", "add_rel"]
+
+def test_delete_class_command_memory_does_not_grow_with_diagram(uml_model):
+    # A large diagram plus small classes to delete
+    with uml_model.transaction():
+        for class_index in range(200):
+            uml_model._add_class(f"Class{class_index}")
+            for field_index in range(10):
+                uml_model._add_field(f"Class{class_index}", "int", f"field{field_index}")
+        for class_index in range(20):
+            uml_model._add_class(f"Small{class_index}")
+            uml_model._add_relationship(f"Small{class_index}", "Class0", "Aggregation")
+    input_handler = InputHandler()
+    tracemalloc.start()
+    for class_index in range(20):
+        input_handler.execute_command(DeleteClassCommand(uml_model, class_name=f"Small{class_index}"))
+    history_bytes, _ = tracemalloc.get_traced_memory()
+    main_data_copy = uml_model._copy_main_data()
+    snapshot_bytes = tracemalloc.get_traced_memory()[0] - history_bytes
+    tracemalloc.stop()
+    # Twenty deletes in the history cost less than a single whole-diagram snapshot
+    assert history_bytes < snapshot_bytes
+    for _ in range(20):
+        input_handler.undo()
+    assert all(uml_model._relationship_exist(f"Small{class_index}", "Class0") for class_index in range(20))
+    assert uml_model._check_main_data_consistency()
+
 def test_add_relationship_duplicate(uml_model, sample_observer):
     uml_model._attach_observer(sample_observer)
     uml_model._add_class(class_name="ClassA", is_loading=False)
@@ -1472,6 +1829,531 @@ def test_update_main_data_for_every_action_with_classes(uml_model):
     uml_model._update_main_data_for_every_action()
     assert len(uml_model._UMLModel__main_data["classes"]) == 1  # Contains 1 class
 
+##################################################################################
+# _sync_main_data
+##################################################################################
+
+def test_sync_main_data_matches_full_rebuild(uml_model):
+    uml_model._add_class("ClassA")
+    uml_model._add_class("ClassB")
+    uml_model._add_class("ClassC")
+    uml_model._add_field("ClassA", "int", "count")
+    uml_model._add_method("ClassA", "void", "run")
+    uml_model._add_parameter("ClassA", "1", "string", "name")
+    uml_model._add_relationship("ClassA", "ClassB", "Aggregation")
+    uml_model._add_relationship("ClassC", "ClassA", "Composition")
+    uml_model._change_data_type(class_name="ClassA", input_name="count", new_type="float", is_field=True)
+    uml_model._rename_class("ClassA", "ClassD")
+    uml_model._change_type("ClassD", "ClassB", "Inheritance")
+    uml_model._delete_class("ClassC")
+    # Incremental main data must be identical to a full rebuild
+    assert uml_model._check_main_data_consistency()
+    main_data = uml_model._get_main_data()
+    assert [each_class["name"] for each_class in main_data["classes"]] == ["ClassB", "ClassD"]
+    assert main_data["relationships"] == [{"source": "ClassD", "destination": "ClassB", "type": "Inheritance"}]
+
+def test_sync_main_data_only_serializes_dirty_class(uml_model):
+    uml_model._add_class("ClassA")
+    uml_model._add_class("ClassB")
+    with patch.object(uml_model, '_class_json_format', wraps=uml_model._class_json_format) as mock_class_format:
+        uml_model._add_field("ClassA", "int", "count")
+        # Only the edited class is re-serialized
+        mock_class_format.assert_called_once_with("ClassA")
+
+def test_sync_main_data_after_set_main_data(uml_model):
+    uml_model._add_class("ClassA")
+    # Replacing main data from outside forces a full rebuild on the next sync
+    uml_model._set_main_data({"classes": [], "relationships": []})
+    uml_model._add_class("ClassB")
+    assert [each_class["name"] for each_class in uml_model._get_main_data()["classes"]] == ["ClassA", "ClassB"]
+    assert uml_model._check_main_data_consistency()
+
+def test_sync_main_data_verification_mode(uml_model):
+    uml_model._set_main_data_verification(True)
+    uml_model._add_class("ClassA")
+    # Corrupt main data behind the model's back; verification repairs it on the next sync
+    uml_model._UMLModel__main_data["classes"].clear()
+    uml_model._add_class("ClassB")
+    assert uml_model._check_main_data_consistency()
+    assert len(uml_model._get_main_data()["classes"]) == 2
+
+##################################################################################
+# Transaction Tests
+##################################################################################
+
+def test_transaction_defers_sync_and_notification(uml_model, sample_observer):
+    uml_model._attach_observer(sample_observer)
+    with patch.object(uml_model, '_class_json_format', wraps=uml_model._class_json_format) as mock_class_format:
+        with uml_model.transaction():
+            uml_model._add_class("ClassA")
+            uml_model._add_field("ClassA", "int", "count")
+            uml_model._add_field("ClassA", "int", "speed")
+            assert uml_model._is_in_transaction()
+            assert sample_observer.events == []
+        # The new entry is serialized once when added, the edits are synced once at commit
+        assert mock_class_format.call_count == 2
+    assert not uml_model._is_in_transaction()
+    assert [event["event_type"] for event in sample_observer.events] == ["add_class", "add_field", "add_field"]
+    assert uml_model._check_main_data_consistency()
+
+def test_transaction_still_validates_each_operation(uml_model):
+    with uml_model.transaction():
+        assert uml_model._add_class("ClassA")
+        assert uml_model._add_class("ClassA") is False
+    assert list(uml_model._get_class_list()) == ["ClassA"]
+
+def test_transaction_rollback_on_error(uml_model, sample_observer):
+    uml_model._add_class("ClassA")
+    uml_model._add_class("ClassB")
+    uml_model._add_relationship("ClassA", "ClassB", "Aggregation")
+    expected_main_data = uml_model._copy_main_data()
+    uml_model._attach_observer(sample_observer)
+    with pytest.raises(ValueError):
+        with uml_model.transaction():
+            uml_model._add_field("ClassA", "int", "count")
+            uml_model._delete_class("ClassB")
+            uml_model._add_class("ClassC")
+            raise ValueError("abort")
+    assert uml_model._get_main_data() == expected_main_data
+    assert uml_model._relationship_exist("ClassA", "ClassB")
+    assert uml_model._find_type_usage("int") == []
+    assert sample_observer.events == []
+    assert uml_model._check_main_data_consistency()
+
+def test_nested_transaction_rollback(uml_model, sample_observer):
+    uml_model._attach_observer(sample_observer)
+    with uml_model.transaction():
+        uml_model._add_class("ClassA")
+        with pytest.raises(ValueError):
+            with uml_model.transaction():
+                uml_model._add_class("ClassB")
+                raise ValueError("abort")
+        # Only the inner block is rolled back
+        assert list(uml_model._get_class_list()) == ["ClassA"]
+        assert uml_model._is_in_transaction()
+    assert [event["data"] for event in sample_observer.events] == [{"class_name": "ClassA"}]
+
+def test_transaction_rollback_restores_touched_entries_in_order(uml_model):
+    for class_name in ["ClassA", "ClassB", "ClassC", "ClassD"]:
+        uml_model._add_class(class_name)
+    uml_model._add_field("ClassA", "ClassB", "partner")
+    uml_model._add_method("ClassC", "ClassB", "find")
+    uml_model._add_parameter("ClassC", "1", "ClassB", "key")
+    uml_model._add_relationship("ClassA", "ClassB", "Aggregation")
+    uml_model._add_relationship("ClassB", "ClassC", "Composition")
+    uml_model._add_relationship("ClassC", "ClassD", "Inheritance")
+    expected_main_data = uml_model._copy_main_data()
+    untouched_class = uml_model._get_class("ClassD")
+    with pytest.raises(ValueError):
+        with uml_model.transaction():
+            uml_model._rename_class("ClassB", "ClassE", is_refactor=True)
+            with uml_model.transaction():
+                uml_model._delete_class("ClassA")
+                uml_model._change_type("ClassE", "ClassC", "Aggregation")
+            uml_model._delete_relationship("ClassC", "ClassD")
+            uml_model._add_class("ClassA")
+            uml_model._add_relationship("ClassA", "ClassD", "Realization")
+            raise ValueError("abort")
+    assert uml_model._get_main_data() == expected_main_data
+    assert list(uml_model._get_class_list()) == ["ClassA", "ClassB", "ClassC", "ClassD"]
+    assert [(relationship._get_source_class(), relationship._get_destination_class()) for relationship in uml_model._get_relationship_list()] == \
+        [("ClassA", "ClassB"), ("ClassB", "ClassC"), ("ClassC", "ClassD")]
+    assert uml_model._get_chosen_relationship_type("ClassB", "ClassC") == "Composition"
+    assert len(uml_model._find_type_usage("ClassB")) == 3
+    assert uml_model._find_type_usage("ClassE") == []
+    # Classes the transaction did not touch are not rebuilt
+    assert uml_model._get_class("ClassD") is untouched_class
+    assert uml_model._check_main_data_consistency()
+
+def test_transaction_savepoint_does_not_copy_the_model(uml_model):
+    for index in range(20):
+        uml_model._add_class(f"Class{index}")
+        uml_model._add_field(f"Class{index}", "int", "count")
+    with patch("UML_MVC.UML_MODEL.uml_model.copy.deepcopy") as mock_deepcopy, \
+            patch.object(uml_model, "_class_json_format", wraps=uml_model._class_json_format) as mock_class_format:
+        with pytest.raises(ValueError):
+            with uml_model.transaction():
+                with uml_model.transaction():
+                    uml_model._add_field("Class3", "int", "speed")
+                raise ValueError("abort")
+        mock_deepcopy.assert_not_called()
+        # The savepoints copy the entry of the edited class as it is, nothing is serialized
+        mock_class_format.assert_not_called()
+    assert [field._get_name() for field in uml_model._get_class("Class3")._get_class_field_list()] == ["count"]
+    assert uml_model._check_main_data_consistency()
+
+def test_transaction_rollback_after_replacing_the_model(uml_model):
+    uml_model._add_class("ClassA")
+    uml_model._add_field("ClassA", "int", "count")
+    expected_main_data = uml_model._copy_main_data()
+    with pytest.raises(ValueError):
+        with uml_model.transaction():
+            uml_model._add_field("ClassA", "int", "speed")
+            assert uml_model._bulk_load_main_data({"classes": [{"name": "ClassB", "fields": [], "methods": []}], "relationships": []})
+            uml_model._add_class("ClassC")
+            raise ValueError("abort")
+    assert uml_model._get_main_data() == expected_main_data
+    assert uml_model._find_type_usage("int")[0]["name"] == "count"
+
+def test_transaction_delivers_coalesced_batch(uml_model, sample_observer):
+    uml_model._add_class("ClassA")
+    uml_model._add_field("ClassA", "int", "count")
+    uml_model._attach_observer(sample_observer)
+    with uml_model.transaction():
+        uml_model._change_data_type(class_name="ClassA", input_name="count", new_type="float", is_field=True)
+        uml_model._change_data_type(class_name="ClassA", input_name="count", new_type="str", is_field=True)
+    # Only the final type of the field is reported
+    assert [event["data"]["new_type"] for event in sample_observer.events] == ["str"]
+
+def test_view_summarizes_large_batch(uml_model):
+    uml_view = uml_model._get_user_view()
+    uml_model._attach_observer(uml_view)
+    with patch.object(uml_view.console, "print") as mock_print:
+        with uml_model.transaction():
+            for index in range(UMLView.BATCH_SUMMARY_THRESHOLD + 1):
+                uml_model._add_class(f"Class{index}")
+        mock_print.assert_called_once()
+        assert f"{UMLView.BATCH_SUMMARY_THRESHOLD + 1}" in mock_print.call_args[0][0]
+
+def test_thread_dispatch_does_not_wait_for_observers(uml_model):
+    release_event = threading.Event()
+    received_list = []
+    class BlockingObserver(UMLObserver):
+        def _update(self, event_type=None, data=None, is_loading=None, is_undo_or_redo=None):
+            release_event.wait(timeout=5)
+            received_list.append(data["class_name"])
+    uml_model._attach_observer(BlockingObserver())
+    uml_model._get_event_bus()._set_dispatch_mode(DispatchMode.THREAD)
+    # The mutations return while the observer is still blocked on the first event
+    assert uml_model._add_class("ClassA")
+    assert uml_model._add_class("ClassB")
+    assert received_list == []
+    release_event.set()
+    uml_model._get_event_bus().flush()
+    assert received_list == ["ClassA", "ClassB"]
+    uml_model._get_event_bus()._set_dispatch_mode(DispatchMode.SYNC)
+
+def test_input_handler_evicts_beyond_max_depth(uml_model):
+    input_handler = InputHandler(max_depth=3)
+    for index in range(5):
+        input_handler.execute_command(AddClassCommand(uml_model, class_name=f"Class{index}"))
+    history_info = input_handler.get_history_info()
+    assert history_info["length"] == 3
+    assert history_info["undo_count"] == 3
+    assert history_info["evicted_count"] == 2
+    # Only the three most recent commands can be undone
+    assert input_handler.undo() and input_handler.undo() and input_handler.undo()
+    assert input_handler.undo() is False
+    assert list(uml_model._get_class_list()) == ["Class0", "Class1"]
+
+def test_input_handler_evicts_beyond_byte_budget(uml_model):
+    input_handler = InputHandler(max_depth=None, max_bytes=None)
+    for index in range(4):
+        input_handler.execute_command(AddClassCommand(uml_model, class_name=f"Class{index}"))
+    history_info = input_handler.get_history_info()
+    assert history_info["estimated_bytes"] == sum(input_handler.size_list) > 0
+    # Lowering the budget evicts the oldest commands right away
+    input_handler.set_history_limit(max_depth=None, max_bytes=sum(input_handler.size_list[-2:]))
+    assert input_handler.get_history_info()["length"] == 2
+    assert input_handler.command_list[-1].class_name == "Class3"
+
+def test_input_handler_estimate_excludes_model(uml_model):
+    with uml_model.transaction():
+        for index in range(100):
+            uml_model._add_class(f"Class{index}")
+    input_handler = InputHandler()
+    input_handler.execute_command(AddClassCommand(uml_model, class_name="Small"))
+    # The model is shared, it is not charged to the command
+    assert input_handler.get_history_info()["estimated_bytes"] < 2000
+
+def test_input_handler_redo_branch_released(uml_model):
+    input_handler = InputHandler()
+    input_handler.execute_command(AddClassCommand(uml_model, class_name="ClassA"))
+    input_handler.execute_command(AddClassCommand(uml_model, class_name="ClassB"))
+    input_handler.undo()
+    assert input_handler.get_history_info()["redo_count"] == 1
+    input_handler.execute_command(AddClassCommand(uml_model, class_name="ClassC"))
+    history_info = input_handler.get_history_info()
+    assert history_info["redo_count"] == 0
+    assert history_info["estimated_bytes"] == sum(input_handler.size_list)
+    assert input_handler.redo() is False
+
+class FakeArrowLine:
+    def __init__(self):
+        self.update_count = 0
+
+    def update_position(self):
+        self.update_count += 1
+
+class FakeClassBox:
+    # Stands in for UMLClassBox, only the calls the move commands make
+    def __init__(self, arrow_line_list=None):
+        self.position = (0, 0)
+        self.arrow_line_list = arrow_line_list or []
+
+    def move_without_arrow_update(self, new_x, new_y):
+        self.position = (new_x, new_y)
+
+    def update_arrow_lines(self):
+        for arrow_line in self.arrow_line_list:
+            arrow_line.update_position()
+
+def test_move_unit_commands_merge_into_one_step():
+    input_handler = InputHandler()
+    class_box = FakeClassBox()
+    input_handler.execute_command(MoveUnitCommand(class_box, 0, 0, 10, 0))
+    input_handler.execute_command(MoveUnitCommand(class_box, 10, 0, 20, 5))
+    input_handler.execute_command(MoveUnitCommand(class_box, 20, 5, 30, 5))
+    assert input_handler.get_history_info()["length"] == 1
+    assert class_box.position == (30, 5)
+    input_handler.undo()
+    assert class_box.position == (0, 0)
+    input_handler.redo()
+    assert class_box.position == (30, 5)
+
+def test_move_unit_commands_not_merged():
+    input_handler = InputHandler()
+    class_box = FakeClassBox()
+    other_box = FakeClassBox()
+    input_handler.execute_command(MoveUnitCommand(class_box, 0, 0, 10, 0))
+    # Another box is a separate step
+    input_handler.execute_command(MoveUnitCommand(other_box, 0, 0, 5, 5))
+    late_command = MoveUnitCommand(other_box, 5, 5, 6, 6)
+    # A move after the merge window is a separate step
+    late_command.timestamp += MoveUnitCommand.MERGE_WINDOW + 1
+    input_handler.execute_command(late_command)
+    assert input_handler.get_history_info()["length"] == 3
+
+def test_move_unit_group_command_updates_each_arrow_once():
+    shared_arrow_line = FakeArrowLine()
+    first_box = FakeClassBox([shared_arrow_line])
+    second_box = FakeClassBox([shared_arrow_line])
+    input_handler = InputHandler()
+    input_handler.execute_command(MoveUnitGroupCommand([(first_box, 0, 0, 10, 10), (second_box, 0, 0, 20, 20)]))
+    assert shared_arrow_line.update_count == 1
+    input_handler.execute_command(MoveUnitGroupCommand([(second_box, 20, 20, 25, 25), (first_box, 10, 10, 15, 15)]))
+    assert input_handler.get_history_info()["length"] == 1
+    input_handler.undo()
+    assert (first_box.position, second_box.position) == ((0, 0), (0, 0))
+    assert shared_arrow_line.update_count == 3
+
+def test_input_handler_transaction_rollback(uml_model):
+    input_handler = InputHandler()
+    uml_model._add_class("ClassA")
+    with pytest.raises(ValueError):
+        with input_handler.transaction(uml_model):
+            input_handler.execute_command(DeleteClassCommand(uml_model, class_name="ClassA"))
+            raise ValueError("abort")
+    # The rolled back command is not part of the history
+    assert uml_model._has_class("ClassA")
+    assert input_handler.command_list == []
+    assert input_handler.pointer == -1
+
+class CountingAddClassCommand(AddClassCommand):
+    execute_count = 0
+
+    def execute(self, is_undo_or_redo=False):
+        CountingAddClassCommand.execute_count += 1
+        return super().execute(is_undo_or_redo=is_undo_or_redo)
+
+def test_input_handler_goto_uses_checkpoints(uml_model):
+    input_handler = InputHandler(uml_model=uml_model, checkpoint_interval=10)
+    for index in range(45):
+        input_handler.execute_command(CountingAddClassCommand(uml_model, class_name=f"Class{index}"))
+    assert input_handler.get_history_info()["checkpoint_count"] == 5
+    CountingAddClassCommand.execute_count = 0
+    assert input_handler.goto(3)
+    # Restored from the checkpoint at revision 0 instead of undoing 42 commands
+    assert CountingAddClassCommand.execute_count == 3
+    assert sorted(uml_model._get_class_list()) == ["Class0", "Class1", "Class2"]
+    assert input_handler.get_revision() == 3
+    assert input_handler.goto(27)
+    assert CountingAddClassCommand.execute_count == 3 + 7
+    assert len(uml_model._get_class_list()) == 27
+    # Undo and redo continue from the new revision
+    input_handler.redo()
+    assert uml_model._has_class("Class27")
+    input_handler.undo()
+    input_handler.undo()
+    assert not uml_model._has_class("Class26")
+
+def test_input_handler_goto_out_of_range(uml_model):
+    input_handler = InputHandler(uml_model=uml_model, checkpoint_interval=10)
+    input_handler.execute_command(AddClassCommand(uml_model, class_name="Car"))
+    assert not input_handler.goto(2)
+    assert not input_handler.goto(-1)
+    assert input_handler.goto(0)
+    assert not uml_model._has_class("Car")
+
+def test_input_handler_new_command_drops_later_checkpoints(uml_model):
+    input_handler = InputHandler(uml_model=uml_model, checkpoint_interval=2)
+    for index in range(6):
+        input_handler.execute_command(AddClassCommand(uml_model, class_name=f"Class{index}"))
+    input_handler.goto(1)
+    input_handler.execute_command(AddClassCommand(uml_model, class_name="Other"))
+    assert set(input_handler.checkpoint_list) == {0}
+    assert [entry[1] for entry in input_handler.get_history_list()] == ["add class Class0", "add class Other"]
+    assert input_handler.get_history_list()[-1][2]
+
+def main_data_without_position(uml_model):
+    main_data = uml_model._copy_main_data()
+    for class_data in main_data["classes"]:
+        class_data.pop("position", None)
+    return main_data
+
+def test_input_handler_journal_replay(uml_model, tmp_path):
+    journal = UMLSessionJournal(str(tmp_path / "diagram.json"))
+    journal._read()
+    input_handler = InputHandler(uml_model=uml_model)
+    input_handler.set_journal(journal)
+    factory = CommandFactory(uml_model)
+    for spec in [{"command_name": "add_class", "class_name": "Car"},
+                 {"command_name": "add_class", "class_name": "Bus"},
+                 {"command_name": "add_field", "class_name": "Car", "field_type": "int", "input_name": "speed"}]:
+        input_handler.execute_command(factory.create_command_from_spec(spec))
+    input_handler.undo()
+    input_handler.undo()
+    input_handler.redo()
+    journal._close()
+    # A new session rebuilds the model and its history from the journal
+    recovered_model = UMLModel(view=UMLView(), console=Console())
+    recovered_handler = InputHandler(uml_model=recovered_model)
+    recovered_journal = UMLSessionJournal(str(tmp_path / "diagram.json"))
+    main_data, entry_list = recovered_journal._read()
+    assert main_data is None
+    recovered_handler.set_journal(recovered_journal)
+    assert recovered_handler.replay_journal(entry_list, CommandFactory(recovered_model)) == 6
+    assert main_data_without_position(recovered_model) == main_data_without_position(uml_model)
+    recovered_handler.redo()
+    input_handler.redo()
+    assert main_data_without_position(recovered_model) == main_data_without_position(uml_model)
+
+def test_input_handler_journal_snapshot_for_unjournaled_undo(uml_model, tmp_path):
+    input_handler = InputHandler(uml_model=uml_model)
+    input_handler.execute_command(AddClassCommand(uml_model, class_name="Car"))
+    journal = UMLSessionJournal(str(tmp_path / "diagram.json"))
+    journal._read()
+    input_handler.set_journal(journal)
+    # The class was added before journaling started, so its undo is written as a snapshot
+    input_handler.undo()
+    journal._close()
+    main_data, entry_list = UMLSessionJournal(str(tmp_path / "diagram.json"))._read()
+    assert main_data == {"classes": [], "relationships": []}
+    assert entry_list == []
+
+REPLAY_RECORD_LIST = [
+    ["add_class", "Car"],
+    ["add_class", "Engine"],
+    ["add_field", "Car", "int", "speed"],
+    ["rename_field", "Car", "speed", "top_speed"],
+    ["add_method", "Car", "void", "drive"],
+    ["add_param", "Car", "1", "int", "distance"],
+    ["edit_param_type", "Car", "1", "distance", "float"],
+    ["composite", [["add_class", "Wheel"], ["add_rel", "Car", "Wheel", "Composition"]]],
+    ["add_rel", "Car", "Engine", "Aggregation"],
+    ["edit_rel_type", "Car", "Engine", "Composition"],
+    ["rename_class", "Engine", "Motor"],
+]
+
+def test_command_record_round_trip(uml_model):
+    factory = CommandFactory(uml_model)
+    for record in REPLAY_RECORD_LIST:
+        assert factory.create_command_from_record(record).to_record() == record
+    with pytest.raises(ValueError):
+        factory.create_command_from_record(["no_such_command"])
+
+def test_replay_engine_matches_command_execution(uml_model):
+    factory = CommandFactory(uml_model)
+    for record in REPLAY_RECORD_LIST:
+        assert factory.create_command_from_record(record).execute()
+    engine = UMLReplayEngine()
+    assert engine.replay(REPLAY_RECORD_LIST)
+    assert engine._get_statistics() == {"applied_count": len(REPLAY_RECORD_LIST), "failed_count": 0}
+    assert main_data_without_position(engine._get_model()) == main_data_without_position(uml_model)
+
+def test_replay_engine_rejected_and_invalid_records(tmp_path):
+    engine = UMLReplayEngine()
+    record_path = str(tmp_path / "records.jsonl")
+    write_record_file(record_path, [["add_class", "Car"], ["add_class", "Car"],
+                                    ["composite", [["add_class", "Bus"], ["add_class", "Car"]]]])
+    assert not engine.replay(read_record_file(record_path))
+    assert engine._get_statistics() == {"applied_count": 1, "failed_count": 2}
+    # The failed composite rolled its first child back
+    assert [uml_class._get_class_name() for uml_class in engine._get_model()._get_class_list().values()] == ["Car"]
+    # A malformed record rolls the whole replay back
+    with pytest.raises(ValueError):
+        engine.replay([["add_class", "Truck"], ["add_class"]])
+    assert not engine._get_model()._has_class("Truck")
+
+def test_replay_engine_composite_does_not_copy_the_model():
+    engine = UMLReplayEngine()
+    assert engine.replay([["add_class", f"Class{index}"] for index in range(50)])
+    uml_model = engine._get_model()
+    untouched_class = uml_model._get_class("Class10")
+    with patch("UML_MVC.UML_MODEL.uml_model.copy.deepcopy") as mock_deepcopy, \
+            patch.object(uml_model, "_class_json_format", wraps=uml_model._class_json_format) as mock_class_format:
+        assert not engine.replay([["composite", [["add_field", "Class1", "int", "count"], ["add_class", "Class2"]]],
+                                  ["composite", [["add_field", "Class3", "int", "count"], ["add_method", "Class3", "void", "run"]]]])
+        mock_deepcopy.assert_not_called()
+        # Only Class3 is serialized, once, when the replay commits
+        assert mock_class_format.call_count == 1
+    assert engine._get_statistics() == {"applied_count": 51, "failed_count": 1}
+    assert uml_model._get_class("Class1")._get_class_field_list() == []
+    assert uml_model._get_class("Class10") is untouched_class
+    assert uml_model._check_main_data_consistency()
+
+class BatchCountObserver(UMLObserver):
+    def __init__(self):
+        self.batch_list = []
+
+    def _update_batch(self, event_list):
+        self.batch_list.append([event._get_event_type() for event in event_list])
+
+def test_composite_command_is_one_undo_step(uml_model):
+    observer = BatchCountObserver()
+    uml_model._attach_observer(observer)
+    input_handler = InputHandler()
+    command = CommandFactory(uml_model).create_composite_command([
+        {"command_name": "add_class", "class_name": "Car"},
+        {"command_name": "add_field", "class_name": "Car", "field_type": "int", "input_name": "speed"},
+        {"command_name": "add_class", "class_name": "Engine"},
+        {"command_name": "add_rel", "source_class": "Car", "dest_class": "Engine", "rel_type": "Composition"},
+    ])
+    assert input_handler.execute_command(command)
+    assert input_handler.get_history_info()["length"] == 1
+    assert observer.batch_list == [["add_class", "add_field", "add_class", "add_rel"]]
+    assert uml_model._relationship_exist("Car", "Engine")
+    input_handler.undo()
+    assert len(observer.batch_list) == 2
+    assert not uml_model._has_class("Car") and not uml_model._has_class("Engine")
+    input_handler.redo()
+    assert uml_model._get_class("Car")._get_class_field_list()[0]._get_name() == "speed"
+    assert uml_model._relationship_exist("Car", "Engine")
+
+def test_composite_command_failure_undoes_executed_children(uml_model, sample_observer):
+    uml_model._add_class("Engine")
+    expected_main_data = uml_model._copy_main_data()
+    observer = BatchCountObserver()
+    uml_model._attach_observer(observer)
+    uml_model._attach_observer(sample_observer)
+    input_handler = InputHandler()
+    command = CommandFactory(uml_model).create_composite_command([
+        AddClassCommand(uml_model, class_name="Car"),
+        {"command_name": "add_field", "class_name": "Engine", "field_type": "int", "input_name": "power"},
+        {"command_name": "add_class", "class_name": "Car"},
+    ])
+    assert not input_handler.execute_command(command)
+    assert not uml_model._has_class("Car")
+    assert uml_model._get_main_data() == expected_main_data
+    assert input_handler.command_list == []
+    # Observers never hear about a failed group
+    assert observer.batch_list == []
+    assert sample_observer.events == []
+
+def test_composite_command_spec_without_name(uml_model):
+    with pytest.raises(ValueError):
+        CommandFactory(uml_model).create_composite_command([{"class_name": "Car"}])
+
 ##################################################################################
 # _validate_entities
 ##################################################################################
@@ -1562,6 +2444,168 @@ def test_save_data(uml_model):
     assert storage_manager._save_data_to_json.call_count == 1
     assert storage_manager._save_data_to_json.call_args[0][0] == "test_file"  # Check filename only
 
+def test_save_data_to_json_gui_serializes_once(uml_model, tmp_path):
+    storage_manager = uml_model._get_storage_manager()
+    uml_model._add_class("Car")
+    file_path = str(tmp_path / "diagram.json")
+    written_list = []
+    with patch.object(UMLStorageManager, "_write_file_atomically", side_effect=lambda path, text: written_list.append((path, text))), \
+         patch.object(UMLJsonSerializer, "_dumps", return_value="{}") as mock_dumps:
+        storage_manager._save_data_to_json_gui(file_path, uml_model._copy_main_data(), file_name="diagram_copy")
+    assert mock_dumps.call_count == 1
+    assert [path for path, _ in written_list] == [file_path, os.path.join(root_path, "diagram_copy.json")]
+    assert written_list[0][1] == written_list[1][1]
+
+def test_write_file_atomically_replaces_file(tmp_path):
+    file_path = str(tmp_path / "diagram.json")
+    UMLStorageManager._write_file_atomically(file_path, "old")
+    UMLStorageManager._write_file_atomically(file_path, "new")
+    with open(file_path) as saved_file:
+        assert saved_file.read() == "new"
+    assert os.listdir(tmp_path) == ["diagram.json"]
+
+JSON_BACKEND_LIST = ["json"] + (["orjson"] if DEFAULT_JSON_BACKEND == "orjson" else [])
+
+@pytest.mark.parametrize("backend", JSON_BACKEND_LIST)
+@pytest.mark.parametrize("is_pretty", [False, True])
+def test_json_serializer_round_trip(uml_model, tmp_path, backend, is_pretty):
+    uml_model._add_class("Car")
+    uml_model._add_field("Car", "int", "speed")
+    uml_model._add_method("Car", "void", "drive")
+    uml_model._add_parameter("Car", "1", "float", "distance")
+    main_data = uml_model._copy_main_data()
+    storage_manager = UMLStorageManager(UMLJsonSerializer(is_pretty=is_pretty, backend=backend))
+    file_path = str(tmp_path / "diagram.json")
+    storage_manager._save_data_to_json_gui(file_path, main_data)
+    with open(file_path) as saved_file:
+        text = saved_file.read()
+    if is_pretty:
+        assert text == json.dumps(main_data, indent=4)
+    else:
+        assert "\n" not in text and ", " not in text and '": ' not in text
+    assert storage_manager._load_data_from_json_gui(file_path) == main_data
+
+def build_stream_test_data(uml_model):
+    uml_model._add_class("Car")
+    uml_model._add_field("Car", "int", "speed")
+    uml_model._add_method("Car", "void", "drive")
+    uml_model._add_parameter("Car", "1", "float", "distance")
+    uml_model._add_class("Engine")
+    uml_model._add_relationship("Car", "Engine", "Composition")
+    return uml_model._copy_main_data()
+
+@pytest.mark.parametrize("chunk_size", [1, 7, STREAM_CHUNK_SIZE])
+def test_json_stream_reader_yields_values(tmp_path, chunk_size):
+    file_path = tmp_path / "values.json"
+    file_path.write_text('[ {"a": [1, 2]}, 12345, "x y", [] , null ]')
+    with open(file_path) as file:
+        assert list(UMLJsonStreamReader(file, chunk_size)._iterate_array()) == [{"a": [1, 2]}, 12345, "x y", [], None]
+
+def test_stream_data_from_json_puts_relationships_last(uml_model, tmp_path):
+    main_data = build_stream_test_data(uml_model)
+    file_path = tmp_path / "diagram.json"
+    file_path.write_text(json.dumps({"relationships": main_data["relationships"], "version": 1, "classes": main_data["classes"]}))
+    record_list = list(uml_model._get_storage_manager()._stream_data_from_json_gui(str(file_path)))
+    assert record_list == [("class", class_element) for class_element in main_data["classes"]] + \
+                          [("relationship", relationship_element) for relationship_element in main_data["relationships"]]
+    assert uml_model._get_storage_manager()._stream_data_from_json_gui(str(tmp_path / "missing.json")) is None
+
+@pytest.mark.parametrize("is_pretty", [False, True])
+def test_bulk_load_stream_from_file(uml_model, tmp_path, is_pretty):
+    main_data = build_stream_test_data(uml_model)
+    storage_manager = UMLStorageManager(UMLJsonSerializer(is_pretty=is_pretty))
+    file_path = str(tmp_path / "diagram.json")
+    storage_manager._save_data_to_json_gui(file_path, main_data)
+    loaded_model = UMLModel(view=UMLView(), console=Console())
+    assert loaded_model._bulk_load_stream(storage_manager._stream_data_from_json_gui(file_path))
+    assert loaded_model._copy_main_data() == main_data
+    assert loaded_model._check_main_data_consistency()
+
+@pytest.mark.parametrize("text", [
+    '{"classes": [{"name": "Car", "fields": [], "methods": []}], "relationships": [',
+    '{"classes": [{"name": "Car", "fields": [], "methods": []}]}',
+    '{"classes": [{"name": "Car"}], "relationships": []}',
+    '{"classes": [], "relationships": [{"source": "Car", "destination": "Bus", "type": "Composition"}]}',
+])
+def test_bulk_load_stream_rejects_invalid_file(uml_model, tmp_path, text):
+    main_data = build_stream_test_data(uml_model)
+    file_path = tmp_path / "diagram.json"
+    file_path.write_text(text)
+    assert not uml_model._bulk_load_stream(uml_model._get_storage_manager()._stream_data_from_json_gui(str(file_path)))
+    # The model is left untouched
+    assert uml_model._copy_main_data() == main_data
+
+def test_snapshot_save_and_load(uml_model, tmp_path):
+    main_data = build_stream_test_data(uml_model)
+    storage_manager = uml_model._get_storage_manager()
+    file_path = str(tmp_path / "diagram.umlb")
+    assert storage_manager._save_snapshot(file_path, main_data)
+    assert storage_manager._load_snapshot(file_path) == main_data
+    assert storage_manager._load_snapshot(str(tmp_path / "missing.umlb")) is None
+
+@pytest.mark.parametrize("is_pretty", [False, True])
+def test_json_serializer_iter_dumps_matches_dumps(uml_model, is_pretty):
+    main_data = build_stream_test_data(uml_model)
+    serializer = UMLJsonSerializer(is_pretty=is_pretty)
+    assert "".join(serializer._iter_dumps(main_data)) == serializer._dumps(main_data)
+
+@pytest.mark.parametrize("extension, magic", [(".json.gz", b"\x1f\x8b"), (".json.xz", b"\xfd7zXZ\x00")])
+def test_compressed_diagram_file_round_trip(uml_model, tmp_path, extension, magic):
+    main_data = build_stream_test_data(uml_model)
+    storage_manager = uml_model._get_storage_manager()
+    file_path = str(tmp_path / f"diagram{extension}")
+    storage_manager._save_data_to_json_gui(file_path, main_data)
+    with open(file_path, "rb") as saved_file:
+        assert saved_file.read(len(magic)) == magic
+    assert sorted(os.listdir(tmp_path)) == [f"diagram{extension}"]
+    assert storage_manager._load_data_from_json_gui(file_path) == main_data
+    loaded_model = UMLModel(view=UMLView(), console=Console())
+    assert loaded_model._bulk_load_stream(storage_manager._stream_data_from_json_gui(file_path))
+    assert loaded_model._copy_main_data() == main_data
+    # The content decides how a file is read, not its name
+    renamed_path = str(tmp_path / "renamed.json")
+    os.replace(file_path, renamed_path)
+    assert storage_manager._load_data_from_json_gui(renamed_path) == main_data
+
+def test_corrupted_compressed_diagram_file(uml_model, tmp_path):
+    main_data = build_stream_test_data(uml_model)
+    storage_manager = uml_model._get_storage_manager()
+    file_path = tmp_path / "diagram.json.gz"
+    storage_manager._save_data_to_json_gui(str(file_path), main_data)
+    file_path.write_bytes(file_path.read_bytes()[:-12])
+    assert storage_manager._load_data_from_json_gui(str(file_path)) is None
+    assert not uml_model._bulk_load_stream(storage_manager._stream_data_from_json_gui(str(file_path)))
+    assert uml_model._copy_main_data() == main_data
+
+@pytest.mark.parametrize("file_path, name, is_diagram_file", [
+    ("dir/car.json", "car", True),
+    ("dir/car.json.gz", "car", True),
+    ("dir/car.JSON.XZ", "car", True),
+    ("dir/car.v2.json", "car.v2", True),
+    ("dir/car.txt", "car", False),
+    ("dir/car.gz", "car", False),
+])
+def test_diagram_file_name(file_path, name, is_diagram_file):
+    assert UMLStorageManager._get_diagram_name(file_path) == name
+    assert UMLStorageManager._is_diagram_file(file_path) == is_diagram_file
+
+def test_json_serializer_rejects_unknown_backend():
+    with pytest.raises(ValueError):
+        UMLJsonSerializer(backend="yaml")
+
+def test_update_saved_list_only_writes_changes(uml_model):
+    storage_manager = uml_model._get_storage_manager()
+    saved_list = storage_manager._get_saved_list()
+    with patch.object(UMLStorageManager, "_write_file_atomically") as mock_write:
+        storage_manager._update_saved_list(saved_list)
+        storage_manager._update_saved_list_gui(storage_manager._get_saved_list_gui())
+        assert mock_write.call_count == 0
+        saved_list.append({"catalog_test": "off"})
+        storage_manager._update_saved_list(saved_list)
+        storage_manager._update_saved_list(saved_list)
+        assert mock_write.call_count == 1
+    saved_list.pop()
+
 def test_save_data_NAME_LIST(uml_model):
     # Access the storage manager via the public getter method
     storage_manager = uml_model._get_storage_manager()
@@ -1608,7 +2652,51 @@ def test_load_protected_file_name(uml_model):
 def test_load_quit(uml_model):
     with patch("builtins.input", return_value="quit"):
         result = uml_model._load()
-    assert result is None 
+    assert result is None
+
+##################################################################################
+# _bulk_load_main_data
+##################################################################################
+
+@pytest.fixture
+def sample_main_data():
+    return {
+        "classes": [
+            {"name": "Car", "fields": [{"name": "speed", "type": "int"}],
+             "methods": [{"name": "drive", "return_type": "void", "params": [{"name": "distance", "type": "int"}]},
+                         {"name": "drive", "return_type": "void", "params": []}],
+             "position": {"x": 10, "y": 20}},
+            {"name": "Wheel", "fields": [], "methods": [], "position": {"x": 0, "y": 0}},
+        ],
+        "relationships": [{"source": "Car", "destination": "Wheel", "type": "Composition"}],
+    }
+
+def test_bulk_load_main_data(uml_model, sample_observer, sample_main_data):
+    uml_model._attach_observer(sample_observer)
+    assert uml_model._bulk_load_main_data(sample_main_data) is True
+    # Model and main data reflect the loaded document
+    assert uml_model._get_main_data() == sample_main_data
+    assert uml_model._relationship_exist("Car", "Wheel")
+    assert uml_model._get_param_based_on_index("Car", "1", "distance")._get_type() == "int"
+    # Observers receive a single notification for the whole diagram
+    assert len(sample_observer.events) == 1
+    assert sample_observer.events[0]["event_type"] == "load"
+    assert sample_observer.events[0]["is_loading"] is True
+
+def test_bulk_load_main_data_duplicate_signature(uml_model, sample_main_data):
+    uml_model._add_class("Existing")
+    sample_main_data["classes"][0]["methods"][1]["params"] = [{"name": "other", "type": "int"}]
+    assert uml_model._bulk_load_main_data(sample_main_data) is False
+    # Invalid document leaves the current model untouched
+    assert list(uml_model._get_class_list()) == ["Existing"]
+
+def test_bulk_load_main_data_unknown_relationship_class(uml_model, sample_main_data):
+    sample_main_data["relationships"].append({"source": "Car", "destination": "Engine", "type": "Aggregation"})
+    assert uml_model._bulk_load_main_data(sample_main_data) is False
+
+def test_bulk_load_main_data_incomplete_entry(uml_model, sample_main_data):
+    del sample_main_data["classes"][1]["fields"]
+    assert uml_model._bulk_load_main_data(sample_main_data) is False
 
 def test_set_file_status(uml_model):
     # Access the storage manager via the public getter
@@ -0,0 +1,67 @@
+import sys
+import os
+import json
+import pytest
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+# Testing Module
+from UML_MVC.UML_CONTROLLER.uml_binary_snapshot import UMLBinarySnapshot
+
+###############################################################################
+
+MAIN_DATA = {
+    "classes": [
+        {"name": "Car", "fields": [{"name": "speed", "type": "int"}, {"name": "naïve", "type": "string"}],
+         "methods": [{"name": "drive", "return_type": "void", "params": [{"name": "distance", "type": "float"}]},
+                     {"name": "stop", "return_type": "void", "params": []}],
+         "position": {"x": -461.5, "y": 224}},
+        {"name": "Engine", "fields": [], "methods": [], "position": None},
+        {"name": "Wheel", "fields": [], "methods": []},
+    ],
+    "relationships": [{"source": "Car", "destination": "Engine", "type": "Composition"}],
+}
+
+def test_round_trip_is_lossless():
+    data = UMLBinarySnapshot._encode(MAIN_DATA)
+    assert UMLBinarySnapshot._is_snapshot(data)
+    decoded = UMLBinarySnapshot._decode(data)
+    assert decoded == MAIN_DATA
+    # Key order and coordinate types are kept, so the JSON text is identical
+    assert json.dumps(decoded) == json.dumps(MAIN_DATA)
+    assert type(decoded["classes"][0]["position"]["y"]) is int
+
+def test_empty_diagram():
+    empty = {"classes": [], "relationships": []}
+    assert UMLBinarySnapshot._decode(UMLBinarySnapshot._encode(empty)) == empty
+
+def test_strings_are_stored_once():
+    main_data = {"classes": [{"name": f"Class{index}", "fields": [{"name": "value", "type": "int"}] * 1, "methods": []}
+                             for index in range(100)], "relationships": []}
+    data = UMLBinarySnapshot._encode(main_data)
+    assert data.count(b"value") == 1
+
+@pytest.mark.parametrize("main_data", [
+    {"classes": [{"name": "Car", "fields": [], "methods": [], "color": "red"}], "relationships": []},
+    {"classes": [{"name": 3, "fields": [], "methods": []}], "relationships": []},
+    {"classes": [{"name": "Car", "fields": [], "methods": [], "position": {"x": "1", "y": 2}}], "relationships": []},
+    {"classes": []},
+    {"classes": [{"name": ["Car"], "fields": [], "methods": []}], "relationships": []},
+])
+def test_encode_rejects_data_outside_the_schema(main_data):
+    with pytest.raises(ValueError):
+        UMLBinarySnapshot._encode(main_data)
+
+def test_decode_rejects_bad_data():
+    data = UMLBinarySnapshot._encode(MAIN_DATA)
+    with pytest.raises(ValueError):
+        UMLBinarySnapshot._decode(data[:-3])
+    with pytest.raises(ValueError):
+        UMLBinarySnapshot._decode(b"{}")
+    with pytest.raises(ValueError):
+        # Unsupported version
+        UMLBinarySnapshot._decode(data[:4] + b"\x63\x00" + data[6:])
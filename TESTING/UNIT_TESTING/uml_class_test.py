@@ -161,3 +161,87 @@ def test_set_position():
     expected_position = {'x': new_x, 'y': new_y}
     assert uml_class._get_position() == expected_position
 
+
+###############################################################################
+# Name index tests
+
+def assert_index_matches_lists(uml_class):
+    # Rebuild the expected indexes from the lists and compare with the live ones
+    expected_field_index = {field._get_name(): field for field in uml_class._get_class_field_list()}
+    expected_method_index = {}
+    for method_and_parameter in uml_class._get_method_and_parameters_list():
+        for method in method_and_parameter:
+            expected_method_index.setdefault(method._get_name(), []).append(method)
+    assert uml_class._get_field_name_index() == expected_field_index
+    assert uml_class._get_method_name_index() == expected_method_index
+    expected_signature_index = {}
+    for method_and_parameter in uml_class._get_method_and_parameters_list():
+        for method, param_list in method_and_parameter.items():
+            signature = UMLClass._make_signature(method._get_name(), param_list)
+            expected_signature_index[signature] = expected_signature_index.get(signature, 0) + 1
+    assert uml_class._get_signature_index() == expected_signature_index
+
+def test_field_index_add_rename_remove(uml_class, sample_field):
+    uml_class._add_field(sample_field)
+    assert uml_class._get_field("sample_field") is sample_field
+    assert_index_matches_lists(uml_class)
+    uml_class._rename_field(sample_field, "renamed_field")
+    assert uml_class._get_field("sample_field") is None
+    assert uml_class._get_field("renamed_field") is sample_field
+    assert_index_matches_lists(uml_class)
+    uml_class._remove_field(sample_field)
+    assert uml_class._get_field("renamed_field") is None
+    assert_index_matches_lists(uml_class)
+
+def test_method_index_with_overloads(uml_class, sample_method, sample_parameter):
+    overload = Method(type="int", method_name="sampleMethod")
+    uml_class._add_method(sample_method)
+    uml_class._add_method(overload, [sample_parameter])
+    assert uml_class._get_method_list("sampleMethod") == [sample_method, overload]
+    assert uml_class._get_method_and_parameters_list()[1] == {overload: [sample_parameter]}
+    assert_index_matches_lists(uml_class)
+    # Renaming one overload only moves that method
+    uml_class._rename_method(1, "otherMethod")
+    assert uml_class._get_method_list("sampleMethod") == [sample_method]
+    assert uml_class._get_method_list("otherMethod") == [overload]
+    assert_index_matches_lists(uml_class)
+    removed_pair = uml_class._remove_method_at(0)
+    assert removed_pair == {sample_method: []}
+    assert uml_class._get_method_list("sampleMethod") == []
+    assert "sampleMethod" not in uml_class._get_method_name_index()
+    assert_index_matches_lists(uml_class)
+
+def test_set_class_field_list_rebuilds_index(uml_class, sample_field):
+    uml_class._add_field(Field(type="string", field_name="old_field"))
+    uml_class._set_class_field_list([sample_field])
+    assert uml_class._get_field("old_field") is None
+    assert uml_class._get_field("sample_field") is sample_field
+    assert_index_matches_lists(uml_class)
+
+def test_signature_index_follows_parameter_edits(uml_class, sample_method, sample_parameter):
+    uml_class._add_method(sample_method)
+    assert uml_class._has_signature(("sampleMethod", ()))
+    uml_class._add_parameter(0, sample_parameter)
+    assert not uml_class._has_signature(("sampleMethod", ()))
+    assert uml_class._has_signature(("sampleMethod", ("int",)))
+    uml_class._set_parameter_type(0, sample_parameter, "float")
+    assert uml_class._has_signature(("sampleMethod", ("float",)))
+    assert_index_matches_lists(uml_class)
+    second_parameter = Parameter(type="string", parameter_name="other")
+    uml_class._replace_parameter_list(0, [sample_parameter, second_parameter])
+    assert uml_class._get_signature_index() == {("sampleMethod", ("float", "string")): 1}
+    uml_class._remove_parameter(0, sample_parameter)
+    assert uml_class._get_signature_index() == {("sampleMethod", ("string",)): 1}
+    assert_index_matches_lists(uml_class)
+
+def test_signature_index_counts_duplicates(uml_class):
+    # Legacy files may hold the same signature twice, removing one must keep the other
+    uml_class._add_method(Method(type="void", method_name="run"))
+    uml_class._add_method(Method(type="int", method_name="run"))
+    assert uml_class._get_signature_index() == {("run", ()): 2}
+    uml_class._remove_method_at(0)
+    assert uml_class._has_signature(("run", ()))
+    assert_index_matches_lists(uml_class)
+
+def test_class_has_no_instance_dict(uml_class):
+    assert not hasattr(uml_class, "__dict__")
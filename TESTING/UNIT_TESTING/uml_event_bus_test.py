@@ -0,0 +1,167 @@
+import sys
+import os
+import threading
+import time
+import pytest
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+# Testing Module
+from UML_MVC.uml_event_bus import UMLEvent, UMLEventBus
+from UML_MVC.uml_observer import UMLObserver
+from UML_ENUM_CLASS.uml_enum import DispatchMode
+
+###############################################################################
+
+class BatchObserver(UMLObserver):
+    def __init__(self):
+        self.batch_list = []
+        self.event_type_list = []
+
+    def _update(self, event_type=None, data=None, is_loading=None, is_undo_or_redo=None):
+        self.event_type_list.append(event_type)
+
+    def _update_batch(self, event_list):
+        self.batch_list.append(event_list)
+
+class LegacyObserver:
+    # Does not inherit from UMLObserver and has no _update_batch
+    def __init__(self):
+        self.data_list = []
+
+    def _update(self, event_type=None, data=None, is_loading=None, is_undo_or_redo=None):
+        self.data_list.append(data)
+
+@pytest.fixture
+def batch_observer():
+    return BatchObserver()
+
+@pytest.fixture
+def legacy_observer():
+    return LegacyObserver()
+
+@pytest.fixture
+def event_bus(batch_observer, legacy_observer):
+    return UMLEventBus([batch_observer, legacy_observer])
+
+def field_type_event(field_name, new_type):
+    return UMLEvent("edit_field_type", {"class_name": "Car", "field_name": field_name, "new_type": new_type})
+
+def test_publish_outside_batch_is_immediate(event_bus, batch_observer, legacy_observer):
+    event_bus._publish(UMLEvent("add_class", {"class_name": "Car"}))
+    assert batch_observer.event_type_list == ["add_class"]
+    assert batch_observer.batch_list == []
+    assert legacy_observer.data_list == [{"class_name": "Car"}]
+
+def test_batch_is_delivered_once(event_bus, batch_observer, legacy_observer):
+    with event_bus.batch():
+        event_bus._publish(UMLEvent("add_class", {"class_name": "Car"}))
+        event_bus._publish(UMLEvent("add_class", {"class_name": "Bus"}))
+        assert batch_observer.batch_list == []
+    assert [[event._get_data() for event in batch] for batch in batch_observer.batch_list] == [[{"class_name": "Car"}, {"class_name": "Bus"}]]
+    # Observers without _update_batch receive one _update call per event
+    assert legacy_observer.data_list == [{"class_name": "Car"}, {"class_name": "Bus"}]
+
+def test_nested_batch_is_delivered_by_outermost(event_bus, batch_observer):
+    with event_bus.batch():
+        with event_bus.batch():
+            event_bus._publish(UMLEvent("add_class", {"class_name": "Car"}))
+        assert event_bus._is_batching()
+        assert batch_observer.batch_list == []
+    assert len(batch_observer.batch_list) == 1
+
+def test_coalesce_keeps_final_state(event_bus, batch_observer):
+    with event_bus.batch():
+        event_bus._publish(field_type_event("speed", "int"))
+        event_bus._publish(field_type_event("name", "str"))
+        event_bus._publish(field_type_event("speed", "float"))
+    assert [event._get_data()["new_type"] for event in batch_observer.batch_list[0]] == ["str", "float"]
+
+def test_coalesce_stops_at_structural_event(event_bus):
+    event_list = [field_type_event("speed", "int"),
+                  UMLEvent("rename_field", {"class_name": "Car", "old_field_name": "speed", "new_field_name": "other"}),
+                  field_type_event("speed", "float")]
+    assert event_bus._coalesce(event_list) == event_list
+
+def test_set_coalesce_key(event_bus):
+    event_bus._set_coalesce_key("edit_method_type", ("class_name", "method_name"))
+    first_event = UMLEvent("edit_method_type", {"class_name": "Car", "method_name": "drive", "new_type": "int"})
+    last_event = UMLEvent("edit_method_type", {"class_name": "Car", "method_name": "drive", "new_type": "void"})
+    assert event_bus._coalesce([first_event, last_event]) == [last_event]
+
+def test_discard_pending(event_bus, batch_observer):
+    with event_bus.batch():
+        event_bus._publish(UMLEvent("add_class", {"class_name": "Car"}))
+        event_bus._publish(UMLEvent("add_class", {"class_name": "Bus"}))
+        event_bus._discard_pending(1)
+        assert event_bus._get_pending_count() == 1
+    assert [event._get_data() for event in batch_observer.batch_list[0]] == [{"class_name": "Car"}]
+
+###############################################################################
+# Asynchronous dispatch
+
+class SlowObserver(UMLObserver):
+    def __init__(self):
+        self.thread_list = []
+        self.data_list = []
+
+    def _update(self, event_type=None, data=None, is_loading=None, is_undo_or_redo=None):
+        time.sleep(0.001)
+        self.thread_list.append(threading.current_thread())
+        self.data_list.append(data)
+
+class FailingObserver(UMLObserver):
+    def _update(self, event_type=None, data=None, is_loading=None, is_undo_or_redo=None):
+        raise RuntimeError("observer failed")
+
+def test_thread_dispatch_preserves_order():
+    slow_observer = SlowObserver()
+    event_bus = UMLEventBus([slow_observer])
+    event_bus._set_dispatch_mode(DispatchMode.THREAD)
+    for index in range(20):
+        event_bus._publish(UMLEvent("add_class", {"class_name": f"Class{index}"}))
+    with event_bus.batch():
+        event_bus._publish(UMLEvent("add_class", {"class_name": "Last"}))
+    event_bus.flush()
+    assert [data["class_name"] for data in slow_observer.data_list] == [f"Class{index}" for index in range(20)] + ["Last"]
+    assert threading.current_thread() not in slow_observer.thread_list
+    event_bus._set_dispatch_mode(DispatchMode.SYNC)
+    event_bus._publish(UMLEvent("add_class", {"class_name": "Sync"}))
+    assert slow_observer.thread_list[-1] is threading.current_thread()
+
+def test_setting_thread_dispatch_twice_keeps_one_worker():
+    slow_observer = SlowObserver()
+    event_bus = UMLEventBus([slow_observer])
+    event_bus._set_dispatch_mode(DispatchMode.THREAD)
+    event_bus._publish(UMLEvent("add_class", {"class_name": "Car"}))
+    worker_count = threading.active_count()
+    event_bus._set_dispatch_mode(DispatchMode.THREAD)
+    assert threading.active_count() == worker_count
+    event_bus._publish(UMLEvent("add_class", {"class_name": "Bus"}))
+    event_bus.flush()
+    assert [data["class_name"] for data in slow_observer.data_list] == ["Car", "Bus"]
+    assert len(set(slow_observer.thread_list)) == 1
+    # Leaving THREAD mode stops the only worker
+    event_bus._set_dispatch_mode(DispatchMode.SYNC)
+    assert not any(thread.name == "UMLEventBus" and thread.is_alive() for thread in slow_observer.thread_list)
+
+def test_thread_dispatch_error_raised_by_flush():
+    event_bus = UMLEventBus([FailingObserver()])
+    event_bus._set_dispatch_mode(DispatchMode.THREAD)
+    event_bus._publish(UMLEvent("add_class", {"class_name": "Car"}))
+    with pytest.raises(RuntimeError):
+        event_bus.flush()
+    event_bus._set_dispatch_mode(DispatchMode.SYNC)
+
+def test_qt_dispatch_is_deferred_until_flush(batch_observer):
+    event_bus = UMLEventBus([batch_observer])
+    event_bus._set_dispatch_mode(DispatchMode.QT)
+    event_bus._publish(UMLEvent("add_class", {"class_name": "Car"}))
+    event_bus._publish(UMLEvent("add_class", {"class_name": "Bus"}))
+    assert batch_observer.event_type_list == []
+    event_bus.flush()
+    assert batch_observer.event_type_list == ["add_class", "add_class"]
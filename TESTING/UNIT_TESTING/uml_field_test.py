@@ -51,3 +51,7 @@ def test_convert_to_json_field(uml_field):
     
     assert json_data == expected_json
 
+
+def test_field_has_no_instance_dict(uml_field):
+    # Core objects are slotted to keep large diagrams small
+    assert not hasattr(uml_field, "__dict__")
@@ -0,0 +1,66 @@
+import sys
+import os
+import pytest
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+# Testing Module
+from UML_CORE.UML_METHOD.uml_method import UMLMethod
+from UML_CORE.UML_METHOD.uml_method_entry import UMLMethodEntry
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter
+
+###############################################################################
+
+@pytest.fixture
+def uml_method():
+    return UMLMethod(type="void", method_name="testMethod")
+
+@pytest.fixture
+def uml_parameter():
+    return UMLParameter(type="int", parameter_name="testParam")
+
+@pytest.fixture
+def uml_method_entry(uml_method, uml_parameter):
+    # Fixture to set up an entry holding one method with one parameter
+    return UMLMethodEntry(uml_method, [uml_parameter])
+
+def test_get_method_and_parameter_list(uml_method_entry, uml_method, uml_parameter):
+    assert uml_method_entry._get_method() is uml_method
+    assert uml_method_entry._get_parameter_list() == [uml_parameter]
+
+def test_default_parameter_list_is_not_shared(uml_method):
+    first_entry = UMLMethodEntry(uml_method)
+    second_entry = UMLMethodEntry(uml_method)
+    first_entry._get_parameter_list().append(UMLParameter(type="int", parameter_name="x"))
+    assert second_entry._get_parameter_list() == []
+
+def test_set_parameter_list(uml_method_entry):
+    new_parameter = UMLParameter(type="string", parameter_name="other")
+    uml_method_entry._set_parameter_list([new_parameter])
+    assert uml_method_entry._get_parameter_list() == [new_parameter]
+
+def test_entry_has_no_instance_dict(uml_method_entry):
+    # The entry is slotted so a diagram with many methods stays small
+    assert not hasattr(uml_method_entry, "__dict__")
+
+def test_dictionary_adapter(uml_method_entry, uml_method, uml_parameter):
+    # Code written against the old {method: parameter_list} element keeps working
+    assert next(iter(uml_method_entry)) is uml_method
+    assert next(iter(uml_method_entry.items())) == (uml_method, [uml_parameter])
+    assert next(iter(uml_method_entry.values())) == [uml_parameter]
+    assert uml_method_entry[uml_method] == [uml_parameter]
+    assert uml_method in uml_method_entry
+    assert len(uml_method_entry) == 1
+    assert uml_method_entry == {uml_method: [uml_parameter]}
+    assert uml_method_entry._to_dict() == {uml_method: [uml_parameter]}
+
+def test_getitem_unknown_method(uml_method_entry):
+    with pytest.raises(KeyError):
+        uml_method_entry[UMLMethod(type="void", method_name="testMethod")]
+
+def test_str(uml_method_entry):
+    assert str(uml_method_entry) == "void testMethod(int testParam)"
@@ -0,0 +1,76 @@
+import sys
+import os
+import json
+import pytest
+
+###############################################################################
+# ADD ROOT PATH #
+# Adjusting the path to allow imports from the project root
+root_path = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", ".."))
+sys.path.append(root_path)
+
+# Testing Module
+from UML_MVC.UML_CONTROLLER.uml_session_journal import UMLSessionJournal
+
+###############################################################################
+
+MAIN_DATA = {"classes": [{"name": "Car", "fields": [], "methods": []}], "relationships": []}
+
+def add_class_entry(class_name):
+    return ["add_class", class_name]
+
+@pytest.fixture
+def journal(tmp_path):
+    return UMLSessionJournal(str(tmp_path / "diagram.json"), flush_count=2, flush_interval=60)
+
+def reopen(journal):
+    return UMLSessionJournal(journal._get_journal_path().removesuffix(".journal") + ".json")
+
+def test_entries_are_written_in_batches(journal):
+    journal._append(add_class_entry("Car"))
+    assert not os.path.exists(journal._get_journal_path())
+    journal._append(["undo"])
+    assert reopen(journal)._read() == (None, [add_class_entry("Car"), ["undo"]])
+
+def test_close_writes_pending_entries(journal):
+    journal._append(add_class_entry("Car"))
+    journal._close()
+    assert reopen(journal)._read()[1] == [add_class_entry("Car")]
+
+def test_torn_last_line_ends_the_entries(journal):
+    journal._append(add_class_entry("Car"))
+    journal._append(add_class_entry("Bus"))
+    with open(journal._get_journal_path(), "a") as journal_file:
+        journal_file.write('{"op": "exec')
+    assert reopen(journal)._read()[1] == [add_class_entry("Car"), add_class_entry("Bus")]
+
+def test_compact_replaces_entries_by_snapshot(journal):
+    journal._append(add_class_entry("Car"))
+    journal._append(add_class_entry("Bus"))
+    journal._compact(MAIN_DATA)
+    journal._append(["undo"])
+    journal._close()
+    assert reopen(journal)._read() == (MAIN_DATA, [["undo"]])
+
+def test_journal_older_than_snapshot_is_not_replayed(journal):
+    journal._append(add_class_entry("Car"))
+    journal._append(add_class_entry("Bus"))
+    # Crash after the snapshot was written but before the journal was reset
+    with open(journal._get_snapshot_path(), "w") as snapshot_file:
+        json.dump({"generation": 1, "main_data": MAIN_DATA}, snapshot_file)
+    assert reopen(journal)._read() == (MAIN_DATA, [])
+
+def test_needs_compaction(tmp_path):
+    journal = UMLSessionJournal(str(tmp_path / "diagram.json"), compact_bytes=30)
+    journal._append(add_class_entry("Car"))
+    assert not journal._needs_compaction()
+    journal._append(add_class_entry("Bus"))
+    assert journal._needs_compaction()
+
+def test_discard_removes_files(journal):
+    journal._append(add_class_entry("Car"))
+    journal._compact(MAIN_DATA)
+    journal._discard()
+    assert not os.path.exists(journal._get_journal_path())
+    assert not os.path.exists(journal._get_snapshot_path())
+    assert reopen(journal)._read() == (None, [])
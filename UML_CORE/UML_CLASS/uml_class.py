@@ -1,10 +1,16 @@
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
 from UML_CORE.UML_FIELD.uml_field import UMLField as Field
 from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_METHOD.uml_method_entry import UMLMethodEntry as MethodEntry
 from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
 class UMLClass:
 
+    # Fixed attribute layout, instances carry no __dict__
+    __slots__ = ("__class_name", "__field_list", "__method_and_parameter_list",
+                 "__field_name_index", "__method_name_index", "__signature_index",
+                 "__position", "parameter_list")
+
     # Private class variables to track the default position for new classes
     __last_x = 0
     __last_y = 0
@@ -20,8 +26,17 @@ class UMLClass:
         # so we can easily access to the its details
         self.__field_list: List[Field] = []
         
-        # Store method and its parameters
-        self.__method_and_parameter_list: List[Dict[Method, List[Parameter]]] = []
+        # Store method and its parameters, one entry per method
+        self.__method_and_parameter_list: List[MethodEntry] = []
+        
+        # Name indexes so lookups do not walk the lists
+        # field name -> field, method name -> overloaded methods in insertion order
+        self.__field_name_index: Dict[str, Field] = {}
+        self.__method_name_index: Dict[str, List[Method]] = {}
+        
+        # Method signature (name, parameter types) -> number of methods with that signature
+        # so duplicate overload checks are a single lookup
+        self.__signature_index: Dict[Tuple[str, Tuple[str, ...]], int] = {}
                 
         # If position is provided (e.g., from loaded data), use it; otherwise, use default incrementing position
         if x is not None and y is not None:
@@ -39,12 +54,37 @@ class UMLClass:
     def _get_class_field_list(self) -> List[Field]:
         return self.__field_list
     
-    def _get_method_and_parameters_list(self) -> List[Dict[Method, List[Parameter]]]:
+    def _get_method_and_parameters_list(self) -> List[MethodEntry]:
         return self.__method_and_parameter_list
     
+    def _get_method_entry(self, index: int) -> MethodEntry:
+        return self.__method_and_parameter_list[index]
+    
     def _get_position(self) -> Dict[str, int]:
         return self.__position
     
+    def _get_field(self, field_name: str) -> Optional[Field]:
+        return self.__field_name_index.get(field_name)
+    
+    def _get_method_list(self, method_name: str) -> List[Method]:
+        return self.__method_name_index.get(method_name, [])
+    
+    def _get_field_name_index(self) -> Dict[str, Field]:
+        return self.__field_name_index
+    
+    def _get_method_name_index(self) -> Dict[str, List[Method]]:
+        return self.__method_name_index
+    
+    def _get_signature_index(self) -> Dict[Tuple[str, Tuple[str, ...]], int]:
+        return self.__signature_index
+    
+    def _has_signature(self, signature: Tuple[str, Tuple[str, ...]]) -> bool:
+        return signature in self.__signature_index
+    
+    @staticmethod
+    def _make_signature(method_name: str, param_list: List[Parameter]) -> Tuple[str, Tuple[str, ...]]:
+        return (method_name, tuple(param._get_type() for param in param_list))
+    
     def __str__(self):
         return f"Class name: {self.__class_name}"
 
@@ -55,12 +95,110 @@ class UMLClass:
 
     def _set_class_field_list(self, new_field_list: List[Field]):
         self.__field_list = new_field_list
+        self._rebuild_member_index()
         
     def _set_parameter_list(self, new_params_list: List[Parameter]):
         self.parameter_list = new_params_list
 
     def _set_position(self, x: int, y: int):
         self.__position = {"x": x, "y": y}
+    
+    #################################################################
+    # Method to modify fields and methods while keeping the name and signature indexes in sync #
+    def _add_field(self, new_field: Field):
+        self.__field_list.append(new_field)
+        self.__field_name_index[new_field._get_name()] = new_field
+    
+    def _remove_field(self, chosen_field: Field):
+        self.__field_list.remove(chosen_field)
+        self.__field_name_index.pop(chosen_field._get_name(), None)
+    
+    def _rename_field(self, chosen_field: Field, new_name: str):
+        self.__field_name_index.pop(chosen_field._get_name(), None)
+        chosen_field._set_name(new_name)
+        self.__field_name_index[new_name] = chosen_field
+    
+    def _add_method(self, new_method: Method, param_list: Optional[List[Parameter]] = None):
+        param_list = param_list if param_list is not None else []
+        self.__method_and_parameter_list.append(MethodEntry(new_method, param_list))
+        self.__method_name_index.setdefault(new_method._get_name(), []).append(new_method)
+        self.__index_signature(self._make_signature(new_method._get_name(), param_list))
+    
+    def _remove_method_at(self, index: int) -> MethodEntry:
+        chosen_entry = self.__method_and_parameter_list.pop(index)
+        chosen_method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
+        self.__unindex_method(chosen_method)
+        self.__unindex_signature(self._make_signature(chosen_method._get_name(), param_list))
+        return chosen_entry
+    
+    def _rename_method(self, index: int, new_name: str):
+        chosen_entry = self.__method_and_parameter_list[index]
+        chosen_method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
+        self.__unindex_method(chosen_method)
+        self.__unindex_signature(self._make_signature(chosen_method._get_name(), param_list))
+        chosen_method._set_name(new_name)
+        self.__method_name_index.setdefault(new_name, []).append(chosen_method)
+        self.__index_signature(self._make_signature(new_name, param_list))
+    
+    #################################################################
+    # Method to modify parameters while keeping the signature index in sync #
+    def _add_parameter(self, index: int, new_param: Parameter):
+        self.__update_parameter_list(index, lambda param_list: param_list.append(new_param))
+    
+    def _remove_parameter(self, index: int, chosen_param: Parameter):
+        self.__update_parameter_list(index, lambda param_list: param_list.remove(chosen_param))
+    
+    def _set_parameter_type(self, index: int, chosen_param: Parameter, new_type: str):
+        self.__update_parameter_list(index, lambda param_list: chosen_param._set_type(new_type))
+    
+    def _set_parameter_list_type(self, index: int, chosen_param_list: List[Parameter], new_type: str):
+        def set_type(param_list: List[Parameter]):
+            for param in chosen_param_list:
+                param._set_type(new_type)
+        self.__update_parameter_list(index, set_type)
+    
+    def _replace_parameter_list(self, index: int, new_param_list: List[Parameter]):
+        def replace(param_list: List[Parameter]):
+            param_list.clear()
+            param_list.extend(new_param_list)
+        self.__update_parameter_list(index, replace)
+    
+    def __update_parameter_list(self, index: int, update):
+        # The parameter list is edited in place so references held elsewhere stay valid
+        chosen_entry = self.__method_and_parameter_list[index]
+        chosen_method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
+        self.__unindex_signature(self._make_signature(chosen_method._get_name(), param_list))
+        update(param_list)
+        self.__index_signature(self._make_signature(chosen_method._get_name(), param_list))
+    
+    def __index_signature(self, signature: Tuple[str, Tuple[str, ...]]):
+        self.__signature_index[signature] = self.__signature_index.get(signature, 0) + 1
+    
+    def __unindex_signature(self, signature: Tuple[str, Tuple[str, ...]]):
+        count = self.__signature_index.get(signature, 0) - 1
+        if count > 0:
+            self.__signature_index[signature] = count
+        else:
+            self.__signature_index.pop(signature, None)
+    
+    def __unindex_method(self, chosen_method: Method):
+        method_name = chosen_method._get_name()
+        overload_list = self.__method_name_index.get(method_name, [])
+        for index, method in enumerate(overload_list):
+            if method is chosen_method:
+                overload_list.pop(index)
+                break
+        if not overload_list:
+            self.__method_name_index.pop(method_name, None)
+    
+    def _rebuild_member_index(self):
+        self.__field_name_index = {field._get_name(): field for field in self.__field_list}
+        self.__method_name_index = {}
+        self.__signature_index = {}
+        for method_entry in self.__method_and_parameter_list:
+            method = method_entry._get_method()
+            self.__method_name_index.setdefault(method._get_name(), []).append(method)
+            self.__index_signature(self._make_signature(method._get_name(), method_entry._get_parameter_list()))
         
     #################################################################
     # Method to convert uml class to json format #
@@ -1,4 +1,6 @@
 class UMLField:
+    __slots__ = ("__type", "__field_name")
+
     # UML class attribute constructor
     # Create an attribute to add to the UML Class
     def __init__(self,type: str = "", field_name: str = ""):
@@ -0,0 +1,70 @@
+from typing import Dict, Iterator, List, Tuple
+
+from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+
+class UMLMethodEntry:
+    # A method and its parameter list, stored as one slotted record
+    # instead of a one-key {method: parameter_list} dictionary
+    __slots__ = ("__method", "__parameter_list")
+
+    #################################################################
+    # Uml method entry constructor #
+    def __init__(self, method: Method, parameter_list: List[Parameter] = None):
+        self.__method = method
+        self.__parameter_list: List[Parameter] = parameter_list if parameter_list is not None else []
+
+    def __str__(self):
+        return f"{self.__method}({', '.join(str(param) for param in self.__parameter_list)})"
+
+    #################################################################
+    # Method to get method entry's data members #
+    def _get_method(self) -> Method:
+        return self.__method
+
+    def _get_parameter_list(self) -> List[Parameter]:
+        return self.__parameter_list
+
+    #################################################################
+    # Method to modify method entry's data members #
+    def _set_parameter_list(self, new_parameter_list: List[Parameter]):
+        self.__parameter_list = new_parameter_list
+
+    #################################################################
+    # Adapter so code written against the old {method: parameter_list} #
+    # element keeps working during the migration #
+    def __iter__(self) -> Iterator[Method]:
+        return iter((self.__method,))
+
+    def __len__(self) -> int:
+        return 1
+
+    def __contains__(self, method: Method) -> bool:
+        return method is self.__method
+
+    def __getitem__(self, method: Method) -> List[Parameter]:
+        if method is not self.__method:
+            raise KeyError(method)
+        return self.__parameter_list
+
+    def keys(self) -> Tuple[Method]:
+        return (self.__method,)
+
+    def values(self) -> Tuple[List[Parameter]]:
+        return (self.__parameter_list,)
+
+    def items(self) -> Tuple[Tuple[Method, List[Parameter]]]:
+        return ((self.__method, self.__parameter_list),)
+
+    def _to_dict(self) -> Dict[Method, List[Parameter]]:
+        return {self.__method: self.__parameter_list}
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, UMLMethodEntry):
+            return self.__method is other._get_method() and self.__parameter_list == other._get_parameter_list()
+        if isinstance(other, dict):
+            return self._to_dict() == other
+        return NotImplemented
+
+    # Entries are mutable, like the dictionaries they replace
+    __hash__ = None
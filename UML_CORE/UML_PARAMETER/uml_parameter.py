@@ -1,4 +1,6 @@
 class UMLParameter:
+    __slots__ = ("__type", "__parameter_name")
+
     # UML class attribute constructor
     # Create an attribute to add to the UML Class
     def __init__(self, type: str = "", parameter_name: str = ""):
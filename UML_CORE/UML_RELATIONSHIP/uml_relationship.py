@@ -1,4 +1,6 @@
 class UMLRelationship:
+    __slots__ = ("__source_class", "__destination_class", "__rel_type")
+
     # UML class relationship constructor
     # Create a relationship between classes
     def __init__(
@@ -8,9 +8,12 @@ from enum import Enum
 
 class InterfaceOptions(Enum):
     MOVE_UNIT = "move_unit" # This is created  for factory command
+    MOVE_UNIT_GROUP = "move_unit_group" # This is created  for factory command
+    COMPOSITE = "composite" # This is created  for factory command
     ADD_CLASS = "add_class"
     DELETE_CLASS = "delete_class"
     RENAME_CLASS = "rename_class"
+    REFACTOR_CLASS = "refactor_class"
     ADD_FIELD = "add_field"
     DELETE_FIELD = "delete_field"
     RENAME_FIELD = "rename_field"
@@ -30,6 +33,8 @@ class InterfaceOptions(Enum):
     EDIT_REL_TYPE = "edit_rel_type"
     UNDO = "undo"
     REDO = "redo"
+    HISTORY = "history"
+    GOTO = "goto"
     LIST_CLASS = "list_class"
     CLASS_DETAIL = "class_detail"
     CLASS_REL = "class_rel"
@@ -53,6 +58,15 @@ class RelationshipType(Enum):
     INHERITANCE = "Inheritance"
     REALIZATION = "Realization"
     
+class DispatchMode(Enum):
+    """
+    Enum for how the event bus delivers model events to the observers.
+    SYNC delivers inside the mutation call, THREAD on a worker thread and QT on the Qt event loop.
+    """
+    SYNC = "sync"
+    THREAD = "thread"
+    QT = "qt"
+    
 class BoxDefaultStat(Enum):
     BOX_DEFAULT_WIDTH = 170
     BOX_DEFAULT_HEIGHT = 50
@@ -12,6 +12,8 @@ from rich.console import Console
 from typing import List, Dict
 from UML_MVC.UML_MODEL.uml_model import UMLModel as Model
 from UML_MVC.UML_CONTROLLER.uml_controller import UMLController as Controller, InterfaceOptions
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLJsonSerializer
+from UML_ENUM_CLASS.uml_enum import DispatchMode
 from UML_MVC.UML_CONTROLLER.cli_completer import create_prompt_session
 from prompt_toolkit import HTML
 
@@ -137,10 +139,20 @@ class UMLInterface:
         Retrieves the list of UML classes from the model.
 
         Returns:
-            A list of class names.
+            A read-only view mapping class names to classes.
         """
         return self.Model._get_class_list()
     
+    # Diagram file format interface #
+    def set_pretty_output(self, is_pretty: bool):
+        """
+        Chooses how diagram files are written: indented for human diffs, or compact (the default).
+
+        Parameters:
+            is_pretty (bool): True to write indented JSON.
+        """
+        self.get_storage_manager()._set_serializer(UMLJsonSerializer(is_pretty=is_pretty))
+
     # Get storage manager interface #
     def get_storage_manager(self):
         """
@@ -167,7 +179,7 @@ class UMLInterface:
         Retrieves the main data structure from the model, which includes classes and relationships.
 
         Returns:
-            A dictionary containing UML classes and relationships.
+            A read-only view of the dictionary containing UML classes and relationships.
         """
         return self.Model._get_main_data()
     
@@ -241,7 +253,40 @@ class UMLInterface:
     
     def get_rel_type(self, source_class_name: str, destination_class_name: str):
         return self.Model._get_rel_type(source_class_name, destination_class_name)
-    
+
+    # Undo history interface #
+    def get_history_info(self) -> Dict:
+        """
+        Reports the undo history: its length, undo and redo counts, estimated memory, limits and
+        the number of commands evicted to stay within them.
+
+        Returns:
+            A dictionary describing the undo history.
+        """
+        return self.Controller._get_history_info()
+
+    def set_history_limit(self, max_depth: int = None, max_bytes: int = None):
+        """
+        Changes the maximum undo depth and the approximate memory budget of the undo history.
+
+        Parameters:
+            max_depth (int): The maximum number of undoable actions, None for no limit.
+            max_bytes (int): The memory budget in bytes, None for no limit.
+        """
+        self.Controller._get_input_handler().set_history_limit(max_depth, max_bytes)
+
+    # Transaction interface #
+    def transaction(self):
+        """
+        Opens a model transaction, to be used as 'with interface.transaction():'.
+        Main data sync and observer notifications are deferred until the block ends,
+        and the model is rolled back if the block raises an exception.
+
+        Returns:
+            A context manager wrapping the model transaction.
+        """
+        return self.Model.transaction()
+
     ## CLASS RELATED ##
     
     # Add class interface #
@@ -265,15 +310,16 @@ class UMLInterface:
         return self.Model._delete_class(class_name)
         
     # Rename class interface #
-    def rename_class(self, current_name: str, new_name: str):
+    def rename_class(self, current_name: str, new_name: str, is_refactor: bool = False):
         """
         Renames a UML class by delegating the operation to the model.
 
         Parameters:
             current_name (str): The current name of the class.
             new_name (str): The new name for the class.
+            is_refactor (bool): Also rename every field, return and parameter type referring to the class.
         """
-        return self.Model._rename_class(current_name, new_name)
+        return self.Model._rename_class(current_name, new_name, is_refactor=is_refactor)
         
     ## FIELD RELATED ##
     
@@ -481,7 +527,9 @@ class UMLInterface:
         """
         Saves the current UML diagram data by delegating the operation to the model.
         """
-        self.Model._save()
+        saved_file_name = self.Model._save()
+        if saved_file_name is not None:
+            self.Controller._after_save(saved_file_name)
         
     # Save data GUI #
     def save_gui(self, file_name, file_path, class_name_list_from_gui):
@@ -493,13 +541,16 @@ class UMLInterface:
             file_path: The path where the file will be saved.
         """
         self.Model._save_gui(file_name, file_path, class_name_list_from_gui)
+        # The GUI does not journal, the saved file only makes a leftover journal stale
+        self.Controller._after_save(file_name, is_journaling=False)
         
     # Load data #
     def load(self):
         """
         Loads the UML diagram data by delegating the operation to the model.
         """
-        self.Model._load()
+        if self.Model._load() is not None:
+            self.Controller._after_load()
         
     # Load data GUI #
     def load_gui(self, file_name, file_path, graphical_view):
@@ -551,6 +602,9 @@ class UMLInterface:
         Clears the current UML data in the active session by delegating the operation to the model.
         """
         self.Model._clear_current_active_data()
+        active_file = self.Model._get_active_file()
+        if active_file != "No active file!":
+            self.Controller._after_save(active_file)
     
     # Go back to blank program #
     def new_file(self):
@@ -558,6 +612,7 @@ class UMLInterface:
         Ends the current session and resets the program to a blank state by delegating the operation to the model.
         """
         self.Model._new_file()
+        self.Controller._close_session_journal(is_discarded=True)
         
     # Sort class list #
     def sort_class_list(self):
@@ -570,7 +625,9 @@ class UMLInterface:
     def exit(self):
         """
         Exits the UML program by delegating the operation to the model.
+        The session journal is removed, leaving without saving is not a crash.
         """
+        self.Controller._close_session_journal(is_discarded=True)
         self.Model._exit()
         
     # Keep updating main data #
@@ -592,6 +649,24 @@ class UMLInterface:
         """
         self.Model._attach_observer(observer)
         
+    # Choose how observers receive events
+    def set_event_dispatch_mode(self, dispatch_mode: DispatchMode):
+        """
+        Sets whether observers are notified inside each model change (DispatchMode.SYNC), on a worker
+        thread (DispatchMode.THREAD) or on the Qt event loop (DispatchMode.QT).
+
+        Parameters:
+            dispatch_mode (DispatchMode): The dispatch mode to use.
+        """
+        self.Model._get_event_bus()._set_dispatch_mode(dispatch_mode)
+
+    # Wait for observers
+    def flush_events(self):
+        """
+        Waits until every observer has received every event published so far.
+        """
+        self.Model._get_event_bus().flush()
+        
     # Detach observer
     def detach_observer(self, observer):
         """
@@ -651,7 +726,13 @@ class UMLInterface:
         """
         # Display a welcome message and help menu
         self.View._prompt_menu()  # Show initial instructions
+        # Bring back the work a crashed session did not save
+        recovered_count = self.Controller._open_session_journal()
+        if recovered_count > 0:
+            self.Console.print(f"\n[bold green]Recovered [bold white]{recovered_count}[/bold white] unsaved action(s) from the session journal.[/bold green]")
         while True:
+            # Make the journal durable while waiting for the user
+            self.Controller._flush_session_journal()
             # Display the current active file in the interface
             current_active_file: str = self.get_active_file()
             if current_active_file != "No active file!":
@@ -0,0 +1,270 @@
+###################################################################################################
+"""
+Module: UMLBinarySnapshot
+This module defines the UMLBinarySnapshot class, a compact binary encoding of the diagram schema
+({"classes": [...], "relationships": [...]}) for autosave and batch jobs where JSON encode and parse time dominate.
+Every name and type is stored once in a string table; the structure is stored as flat arrays of
+fixed-size integers that are packed, unpacked and resolved against the string table in bulk.
+Decoding gives back exactly the data that was encoded.
+
+Layout (little-endian), version 1:
+
+    header          "UMLB", version (uint16), flags (uint16)
+    section sizes   string count, reference count, count count, integer count, float count (uint32 each)
+    string table    string byte lengths (uint32 each), then the UTF-8 bytes of every string
+    references      uint32 string table index of every name and type, in document order
+    counts          uint32 stream: class count, then per class: field count, method count, parameter count per
+                    method, position kind [and the kind of x and y]; then relationship count
+    integers        int64 stream of the integer position coordinates
+    floats          float64 stream of the float position coordinates
+"""
+###################################################################################################
+
+import gc
+import struct
+import sys
+from array import array
+from typing import Dict, List
+
+###################################################################################################
+
+# Position kinds #
+POSITION_ABSENT = 0
+POSITION_NULL = 1
+POSITION_PRESENT = 2
+# Coordinate kinds #
+COORDINATE_INT = 0
+COORDINATE_FLOAT = 1
+# Keys of each record of the schema #
+CLASS_KEY_SET = frozenset(("name", "fields", "methods"))
+CLASS_WITH_POSITION_KEY_SET = frozenset(("name", "fields", "methods", "position"))
+FIELD_KEY_SET = frozenset(("name", "type"))
+METHOD_KEY_SET = frozenset(("name", "return_type", "params"))
+POSITION_KEY_SET = frozenset(("x", "y"))
+RELATIONSHIP_KEY_SET = frozenset(("source", "destination", "type"))
+
+class UMLBinarySnapshot:
+
+    """
+    UMLBinarySnapshot encodes and decodes diagrams in the binary snapshot format.
+    """
+
+    MAGIC = b"UMLB"
+    VERSION = 1
+    EXTENSION = ".umlb"
+
+    __HEADER = struct.Struct("<4sHH")
+    __SECTION_SIZES = struct.Struct("<IIIII")
+    __INT64_LIMIT = 1 << 63
+
+    #################################################################
+
+    # Check the magic bytes #
+    @classmethod
+    def _is_snapshot(cls, data: bytes) -> bool:
+        """
+        Parameters:
+            data (bytes): The start of a file (at least 4 bytes).
+
+        Returns:
+            bool: True if the data starts like a binary snapshot.
+        """
+        return data[:len(cls.MAGIC)] == cls.MAGIC
+
+    # Encode a diagram #
+    @classmethod
+    def _encode(cls, main_data: Dict) -> bytes:
+        """
+        Encodes a diagram.
+
+        Parameters:
+            main_data (Dict): The diagram in {"classes": [...], "relationships": [...]} format.
+
+        Returns:
+            bytes: The binary snapshot.
+
+        Raises:
+            ValueError: If the data does not follow the diagram schema (missing or extra keys, names that are not
+                        strings, positions that are not numbers), so it could not be decoded back unchanged.
+        """
+        reference_list: List[str] = []
+        add_reference = reference_list.append
+        count_list = array("I")
+        add_count = count_list.append
+        integer_list = array("q")
+        float_list = array("d")
+
+        def add_coordinate(value):
+            if type(value) is int and -cls.__INT64_LIMIT <= value < cls.__INT64_LIMIT:
+                add_count(COORDINATE_INT)
+                integer_list.append(value)
+            elif type(value) is float:
+                add_count(COORDINATE_FLOAT)
+                float_list.append(value)
+            else:
+                raise ValueError(f"Expected a position coordinate, got {value!r}")
+
+        try:
+            cls.__check_keys(main_data, {"classes", "relationships"})
+            class_list = main_data["classes"]
+            add_count(len(class_list))
+            for class_element in class_list:
+                cls.__check_keys(class_element, CLASS_WITH_POSITION_KEY_SET if "position" in class_element else CLASS_KEY_SET)
+                add_reference(class_element["name"])
+                field_list = class_element["fields"]
+                add_count(len(field_list))
+                for each_field in field_list:
+                    if each_field.keys() != FIELD_KEY_SET:
+                        cls.__check_keys(each_field, FIELD_KEY_SET)
+                    add_reference(each_field["name"])
+                    add_reference(each_field["type"])
+                method_list = class_element["methods"]
+                add_count(len(method_list))
+                for each_method in method_list:
+                    if each_method.keys() != METHOD_KEY_SET:
+                        cls.__check_keys(each_method, METHOD_KEY_SET)
+                    add_reference(each_method["name"])
+                    add_reference(each_method["return_type"])
+                    param_list = each_method["params"]
+                    add_count(len(param_list))
+                    for param in param_list:
+                        if param.keys() != FIELD_KEY_SET:
+                            cls.__check_keys(param, FIELD_KEY_SET)
+                        add_reference(param["name"])
+                        add_reference(param["type"])
+                if "position" not in class_element:
+                    add_count(POSITION_ABSENT)
+                elif class_element["position"] is None:
+                    add_count(POSITION_NULL)
+                else:
+                    position = class_element["position"]
+                    cls.__check_keys(position, POSITION_KEY_SET)
+                    add_count(POSITION_PRESENT)
+                    add_coordinate(position["x"])
+                    add_coordinate(position["y"])
+            relationship_list = main_data["relationships"]
+            add_count(len(relationship_list))
+            for relationship_element in relationship_list:
+                cls.__check_keys(relationship_element, RELATIONSHIP_KEY_SET)
+                add_reference(relationship_element["source"])
+                add_reference(relationship_element["destination"])
+                add_reference(relationship_element["type"])
+            # Build the string table, every name and type is stored once
+            string_list = list(dict.fromkeys(reference_list))
+        except (KeyError, TypeError, AttributeError) as error:
+            raise ValueError(f"The data does not follow the diagram schema: {error}") from error
+        if any(type(each_string) is not str for each_string in string_list):
+            raise ValueError("Every name and type must be a string")
+        # Resolve every reference in bulk
+        string_index = {each_string: index for index, each_string in enumerate(string_list)}
+        reference_index_list = array("I", map(string_index.__getitem__, reference_list))
+        encoded_string_list = [each_string.encode("utf-8") for each_string in string_list]
+        length_list = array("I", map(len, encoded_string_list))
+        section_list = [length_list, reference_index_list, count_list, integer_list, float_list]
+        if sys.byteorder == "big":
+            for section in section_list:
+                section.byteswap()
+        return b"".join([
+            cls.__HEADER.pack(cls.MAGIC, cls.VERSION, 0),
+            cls.__SECTION_SIZES.pack(len(string_list), len(reference_index_list), len(count_list), len(integer_list), len(float_list)),
+            length_list.tobytes(),
+            b"".join(encoded_string_list),
+            reference_index_list.tobytes(),
+            count_list.tobytes(),
+            integer_list.tobytes(),
+            float_list.tobytes(),
+        ])
+
+    # Decode a diagram #
+    @classmethod
+    def _decode(cls, data: bytes) -> Dict:
+        """
+        Decodes a binary snapshot. The garbage collector is paused while the records are built: they hold
+        no reference cycles, and collections triggered by the many new containers would dominate the decode time.
+
+        Parameters:
+            data (bytes): The binary snapshot.
+
+        Returns:
+            Dict: The diagram in {"classes": [...], "relationships": [...]} format.
+
+        Raises:
+            ValueError: If the data is not a binary snapshot, has an unsupported version or is truncated.
+        """
+        is_gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            return cls.__decode(data)
+        except (struct.error, StopIteration, IndexError, UnicodeDecodeError) as error:
+            raise ValueError("Truncated or corrupted binary snapshot") from error
+        finally:
+            if is_gc_enabled:
+                gc.enable()
+
+    @classmethod
+    def __decode(cls, data: bytes) -> Dict:
+        magic, version, _ = cls.__HEADER.unpack_from(data, 0)
+        if magic != cls.MAGIC:
+            raise ValueError("Not a binary diagram snapshot")
+        if version != cls.VERSION:
+            raise ValueError(f"Unsupported binary snapshot version {version}")
+        offset = cls.__HEADER.size
+        string_count, reference_count, count_count, integer_count, float_count = cls.__SECTION_SIZES.unpack_from(data, offset)
+        offset += cls.__SECTION_SIZES.size
+        length_list, offset = cls.__read_array("I", data, offset, string_count)
+        string_list = []
+        for length in length_list:
+            string_list.append(data[offset:offset + length].decode("utf-8"))
+            offset += length
+        reference_index_list, offset = cls.__read_array("I", data, offset, reference_count)
+        count_list, offset = cls.__read_array("I", data, offset, count_count)
+        integer_list, offset = cls.__read_array("q", data, offset, integer_count)
+        float_list, offset = cls.__read_array("d", data, offset, float_count)
+        if offset != len(data):
+            raise ValueError("Unexpected data after the binary snapshot")
+
+        next_string = iter(list(map(string_list.__getitem__, reference_index_list))).__next__
+        next_count = iter(count_list).__next__
+        next_integer = iter(integer_list).__next__
+        next_float = iter(float_list).__next__
+
+        def read_coordinate():
+            return next_integer() if next_count() == COORDINATE_INT else next_float()
+
+        class_list = []
+        for _ in range(next_count()):
+            class_element = {"name": next_string()}
+            class_element["fields"] = [{"name": next_string(), "type": next_string()} for _ in range(next_count())]
+            class_element["methods"] = [{"name": next_string(), "return_type": next_string(),
+                                         "params": [{"name": next_string(), "type": next_string()} for _ in range(next_count())]}
+                                        for _ in range(next_count())]
+            position_kind = next_count()
+            if position_kind == POSITION_NULL:
+                class_element["position"] = None
+            elif position_kind == POSITION_PRESENT:
+                x = read_coordinate()
+                class_element["position"] = {"x": x, "y": read_coordinate()}
+            class_list.append(class_element)
+        relationship_list = [{"source": next_string(), "destination": next_string(), "type": next_string()}
+                             for _ in range(next_count())]
+        return {"classes": class_list, "relationships": relationship_list}
+
+    #################################################################
+
+    # Make sure a record has exactly the keys of the schema #
+    @staticmethod
+    def __check_keys(record: Dict, key_set: frozenset):
+        if record.keys() != key_set:
+            raise ValueError(f"Expected the keys {sorted(key_set)}, got {list(record)}")
+
+    # Read a packed array #
+    @staticmethod
+    def __read_array(type_code: str, data: bytes, offset: int, count: int):
+        values = array(type_code)
+        end = offset + count * values.itemsize
+        if end > len(data):
+            raise ValueError("Truncated binary snapshot")
+        values.frombytes(data[offset:end])
+        if sys.byteorder == "big":
+            values.byteswap()
+        return values, end
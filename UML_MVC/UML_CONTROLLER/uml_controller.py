@@ -9,9 +9,12 @@ methods, parameters, and relationships.
 ###################################################################################################
 
 # Import necessary libraries and modules for console interaction, typing, and model/view handling.
+import os
 from rich.console import Console
-from typing import List
-from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage
+from typing import Dict, List
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage, root_directory
+from UML_MVC.UML_CONTROLLER.uml_session_journal import UMLSessionJournal as Journal
+from UML_MVC.uml_command_factory import CommandFactory
 from UML_MVC.UML_MODEL.uml_model import UMLModel as Model
 from UML_ENUM_CLASS.uml_enum import InterfaceOptions
 from UML_MVC import uml_command_pattern as Command
@@ -35,11 +38,13 @@ class UMLController:
             view: The view class responsible for displaying output to the user.
             console (Console): A rich console instance used to print messages to the terminal.
         """
-        self.__input_handler = Command.InputHandler()
+        self.__input_handler = Command.InputHandler(uml_model=model)
         self.__model = model  # Reference to the UML model
         self.__user_view = view  # Reference to the view for displaying data
         self.__console = console  # Console for printing messages
         self.__storage_manager: Storage = self.__model._get_storage_manager()  # Storage manager to handle save/load functionality
+        self.__journal: Journal | None = None  # Session journal of the active file
+        self.__journal_file_name: str | None = None
         
     
     def _get_model_obj(self):
@@ -47,6 +52,102 @@ class UMLController:
     
     def _get_input_handler(self):
         return self.__input_handler
+
+    def _get_history_info(self) -> Dict:
+        return self.__input_handler.get_history_info()
+
+    # Tell the user why there is nothing left to undo or redo #
+    def __print_history_end(self, action: str):
+        history_info = self.__input_handler.get_history_info()
+        self.__console.print(f"\n[bold red]Nothing to {action}![/bold red]")
+        if action == "undo" and history_info["evicted_count"] > 0:
+            self.__console.print(f"[bold yellow]The [bold white]{history_info['evicted_count']}[/bold white] oldest action(s) were dropped to keep the undo history within its limits.[/bold yellow]")
+    
+    #################################################################
+    
+    ## SESSION JOURNAL ##
+    
+    # Start journaling the active file #
+    def _open_session_journal(self) -> int:
+        """
+        Records the history of the active file to its session journal from now on. If a previous session
+        ended without saving, the last save (or the latest snapshot) is loaded and the journal replayed on
+        top of it, which also rebuilds its undo history.
+
+        Returns:
+            int: The number of journal entries recovered.
+        """
+        self._close_session_journal()
+        active_file = self.__model._get_active_file()
+        if active_file == "No active file!":
+            return 0
+        journal = Journal(os.path.join(root_directory, f"{active_file}.json"))
+        main_data, entry_list = journal._read()
+        recovered_count = 0
+        if main_data is not None or entry_list:
+            if main_data is None:
+                main_data = self.__storage_manager._load_data_from_json(active_file)
+            if main_data is not None and self.__model._bulk_load_main_data(main_data):
+                self.__input_handler.set_journal(journal)
+                recovered_count = self.__input_handler.replay_journal(entry_list, CommandFactory(self.__model))
+            else:
+                journal._discard()
+        else:
+            journal._discard()
+        if self.__input_handler.journal is not journal:
+            self.__input_handler.set_journal(journal)
+        self.__journal = journal
+        self.__journal_file_name = active_file
+        return recovered_count
+    
+    # Stop journaling #
+    def _close_session_journal(self, is_discarded: bool = False):
+        """
+        Detaches the session journal from the undo history.
+
+        Args:
+            is_discarded (bool): True to also remove the journal, when its unsaved work is abandoned on purpose.
+        """
+        if self.__journal is None:
+            return
+        if is_discarded:
+            self.__journal._discard()
+        else:
+            self.__journal._close()
+        self.__input_handler.set_journal(None)
+        self.__journal = None
+        self.__journal_file_name = None
+    
+    # Write the buffered journal entries #
+    def _flush_session_journal(self):
+        if self.__journal is not None:
+            self.__journal._flush()
+    
+    # A file was saved #
+    def _after_save(self, saved_file_name: str, is_journaling: bool = True):
+        """
+        The saved file now holds everything its journal recorded, so the journal starts over.
+        Journaling follows the active file if the save changed it.
+
+        Args:
+            saved_file_name (str): The name of the saved file.
+            is_journaling (bool): False when the session does not journal (GUI), only the stale journal is removed.
+        """
+        if saved_file_name == self.__journal_file_name:
+            self.__journal._discard()
+            self.__input_handler.set_journal(self.__journal)
+        else:
+            Journal(os.path.join(root_directory, f"{saved_file_name}.json"))._discard()
+        if is_journaling and self.__model._get_active_file() != self.__journal_file_name:
+            self._open_session_journal()
+    
+    # A file was loaded #
+    def _after_load(self):
+        """
+        The unsaved work of the previous file is abandoned, journaling moves to the loaded file.
+        """
+        self._close_session_journal(is_discarded=True)
+        self._open_session_journal()
     
     #################################################################
     
@@ -97,6 +198,15 @@ class UMLController:
         ):
             rename_class_command = Command.RenameClassCommand(self.__model, class_name=first_param, new_name=second_param)
             self.__input_handler.execute_command(rename_class_command)
+        
+        # Rename class and every type referring to it
+        elif (
+            command == InterfaceOptions.REFACTOR_CLASS.value
+            and first_param
+            and second_param
+        ):
+            refactor_class_command = Command.RenameClassCommand(self.__model, class_name=first_param, new_name=second_param, is_refactor=True)
+            self.__input_handler.execute_command(refactor_class_command)
 
         #######################################################
         
@@ -238,7 +348,7 @@ class UMLController:
             if param_list_str:
                 # Split param_list_str by commas to get individual parameters
                 new_param_list = [item.strip() for item in param_list_str.split(",")]
-                rename_param_command = Command.ReplaceParameterListCommand(self.__model, class_name=first_param, method_num=second_param, new_param_list=new_param_list)
+                rename_param_command = Command.ReplaceParameterListCommand(self.__model, class_name=first_param, method_num=second_param, new_param_list_str=new_param_list)
                 self.__input_handler.execute_command(rename_param_command)
             else:
                 self.__console.print("\n[bold red]Error: Parameter list is missing.[/bold red]")
@@ -281,11 +391,28 @@ class UMLController:
         
         # Undo #
         elif command == InterfaceOptions.UNDO.value:
-            self.__input_handler.undo()
+            if not self.__input_handler.undo():
+                self.__print_history_end("undo")
         
         # Redo #
         elif command == InterfaceOptions.REDO.value:
-            self.__input_handler.redo()
+            if not self.__input_handler.redo():
+                self.__print_history_end("redo")
+        
+        # Show the undo history #
+        elif command == InterfaceOptions.HISTORY.value:
+            self.__user_view._display_history(self.__input_handler.get_history_list())
+        
+        # Jump to a revision of the history #
+        elif command == InterfaceOptions.GOTO.value and first_param:
+            revision = int(first_param) if first_param.isdigit() else None
+            if revision is None or not self.__input_handler.goto(revision):
+                history_info = self.__input_handler.get_history_info()
+                self.__console.print(f"\n[bold red]Revision [bold white]'{first_param}'[/bold white] is not in the history. "
+                                     f"Choose a revision between [bold white]{history_info['evicted_count']}[/bold white] and "
+                                     f"[bold white]{history_info['evicted_count'] + history_info['length']}[/bold white].[/bold red]")
+            else:
+                self.__console.print(f"\n[bold green]Moved to revision [bold white]{revision}[/bold white].[/bold green]")
         
         #######################################################
         
@@ -310,11 +437,16 @@ class UMLController:
         
         # Save current UML data
         elif command == InterfaceOptions.SAVE.value:
-            self.__model._save()
+            saved_file_name = self.__model._save()
+            if saved_file_name is not None:
+                self._after_save(saved_file_name)
         
         # Load saved UML data
         elif command == InterfaceOptions.LOAD.value:
-            self.__model._load()
+            loaded_file_name = self.__model._load()
+            self.__input_handler.clear_checkpoints()
+            if loaded_file_name is not None:
+                self._after_load()
         
         # Delete a saved file
         elif command == InterfaceOptions.DELETE_SAVED.value:
@@ -323,10 +455,15 @@ class UMLController:
         # Clear current data from storage
         elif command == InterfaceOptions.CLEAR_DATA.value:
             self.__model._clear_current_active_data()
+            self.__input_handler.clear_checkpoints()
+            if self.__journal_file_name is not None:
+                self._after_save(self.__journal_file_name)
         
         # Reset to a blank program
         elif command == InterfaceOptions.NEW.value:
             self.__model._new_file()
+            self.__input_handler.clear_checkpoints()
+            self._close_session_journal(is_discarded=True)
         
         # Sort the list of classes alphabetically
         # elif command == InterfaceOptions.SORT.value:
@@ -0,0 +1,213 @@
+###################################################################################################
+"""
+Module: UMLSessionJournal
+This module defines the UMLSessionJournal class, an append-only log of the commands executed, undone and redone
+on the active file since it was last saved. It lives next to the active file ('<name>.journal'), so after a crash
+the last save plus the journal brings back the unsaved work, including its undo history.
+Entries are buffered and written with one fsync per batch. Once the journal grows past a size threshold, it is
+compacted: the current diagram is written to a snapshot file ('<name>.snapshot.json') and the journal starts over.
+Both files carry a generation number, so a crash between writing the snapshot and resetting the journal never
+replays entries that the snapshot already contains.
+"""
+###################################################################################################
+
+import json
+import os
+import time
+from typing import Dict, List, Tuple
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage
+
+###################################################################################################
+
+class UMLSessionJournal:
+
+    """
+    UMLSessionJournal records the history of one diagram file as JSON lines, a header followed by
+    command records (see Command.to_record) and undo/redo entries:
+
+        {"generation": 0}
+        ["add_class","Car"]
+        ["undo"]
+        ["redo"]
+    """
+
+    DEFAULT_FLUSH_COUNT = 32
+    DEFAULT_FLUSH_INTERVAL = 1.0
+    DEFAULT_COMPACT_BYTES = 1024 * 1024
+
+    #################################################################
+
+    # UML session journal constructor #
+    def __init__(self, file_path: str, flush_count: int = DEFAULT_FLUSH_COUNT,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL, compact_bytes: int = DEFAULT_COMPACT_BYTES):
+        """
+        Initializes the journal of a diagram file. Nothing is written until the first entry is flushed.
+
+        Parameters:
+            file_path (str): The path of the diagram file the journal belongs to.
+            flush_count (int): The number of buffered entries that triggers a write.
+            flush_interval (float): The number of seconds after which buffered entries are written on the next append.
+            compact_bytes (int | None): The journal size in bytes that triggers a compaction, None to never compact.
+        """
+        base_path = os.path.splitext(file_path)[0]
+        self.__journal_path: str = f"{base_path}.journal"
+        self.__snapshot_path: str = f"{base_path}.snapshot.json"
+        self.__flush_count = flush_count
+        self.__flush_interval = flush_interval
+        self.__compact_bytes = compact_bytes
+        self.__generation: int = 0
+        self.__pending_line_list: List[str] = []
+        self.__pending_size: int = 0
+        self.__last_flush_time: float = time.monotonic()
+        self.__file = None
+
+    def _get_journal_path(self) -> str:
+        return self.__journal_path
+
+    def _get_snapshot_path(self) -> str:
+        return self.__snapshot_path
+
+    #################################################################
+
+    # Read what a previous session left behind #
+    def _read(self) -> Tuple[Dict | None, List[List]]:
+        """
+        Reads the snapshot and the journal entries written after it. A torn last line (a crash in the middle of a
+        write) ends the entries. A journal from an older generation than the snapshot is already contained in the
+        snapshot, so it is reset and no entry is returned.
+
+        Returns:
+            Tuple[Dict | None, List[List]]: The snapshot main data (None if there is no snapshot, so the saved
+                                            file is the base) and the entries to replay on top of it, in order.
+        """
+        main_data = None
+        self.__generation = 0
+        if os.path.exists(self.__snapshot_path):
+            try:
+                with open(self.__snapshot_path, "r") as snapshot_file:
+                    snapshot = json.load(snapshot_file)
+                main_data = snapshot["main_data"]
+                self.__generation = snapshot["generation"]
+            except (json.JSONDecodeError, KeyError, TypeError):
+                print(f"\nError decoding JSON from {self.__snapshot_path}.")
+                main_data = None
+        entry_list = []
+        is_current = False
+        if os.path.exists(self.__journal_path):
+            with open(self.__journal_path, "r") as journal_file:
+                for index, line in enumerate(journal_file):
+                    try:
+                        record = json.loads(line)
+                    except json.JSONDecodeError:
+                        break
+                    if index == 0:
+                        is_current = isinstance(record, dict) and record.get("generation") == self.__generation
+                        if not is_current:
+                            break
+                        continue
+                    entry_list.append(record)
+            if not is_current:
+                self.__reset_journal()
+                entry_list = []
+        return main_data, entry_list
+
+    #################################################################
+
+    # Record an entry #
+    def _append(self, entry: List):
+        """
+        Buffers an entry and writes the buffer when it holds flush_count entries or flush_interval has passed.
+
+        Parameters:
+            entry (List): A command record, ["undo"] or ["redo"].
+        """
+        line = json.dumps(entry, separators=(",", ":")) + "\n"
+        self.__pending_line_list.append(line)
+        self.__pending_size += len(line)
+        if (len(self.__pending_line_list) >= self.__flush_count
+                or time.monotonic() - self.__last_flush_time >= self.__flush_interval):
+            self._flush()
+
+    # Write the buffered entries #
+    def _flush(self):
+        """
+        Writes the buffered entries and fsyncs the journal once for the whole batch.
+        """
+        self.__last_flush_time = time.monotonic()
+        if not self.__pending_line_list:
+            return
+        if self.__file is None:
+            if not os.path.exists(self.__journal_path) or os.stat(self.__journal_path).st_size == 0:
+                self.__reset_journal()
+            self.__file = open(self.__journal_path, "a")
+        self.__file.write("".join(self.__pending_line_list))
+        self.__file.flush()
+        os.fsync(self.__file.fileno())
+        self.__pending_line_list = []
+        self.__pending_size = 0
+
+    # Size of the journal #
+    def _get_size(self) -> int:
+        """
+        Returns:
+            int: The size of the journal in bytes, buffered entries included.
+        """
+        size = os.stat(self.__journal_path).st_size if os.path.exists(self.__journal_path) else 0
+        return size + self.__pending_size
+
+    def _needs_compaction(self) -> bool:
+        return self.__compact_bytes is not None and self._get_size() > self.__compact_bytes
+
+    #################################################################
+
+    # Replace the journal by a snapshot #
+    def _compact(self, main_data: Dict):
+        """
+        Writes the current diagram to the snapshot file and starts an empty journal on top of it.
+        Buffered entries are dropped, the snapshot already contains their effect.
+
+        Parameters:
+            main_data (Dict): The current diagram in {"classes": [...], "relationships": [...]} format.
+        """
+        self.__close_file()
+        self.__pending_line_list = []
+        self.__pending_size = 0
+        self.__generation += 1
+        snapshot = json.dumps({"generation": self.__generation, "main_data": main_data}, separators=(",", ":"))
+        Storage._write_file_atomically(self.__snapshot_path, snapshot)
+        self.__reset_journal()
+
+    # Forget the journal #
+    def _discard(self):
+        """
+        Removes the journal and the snapshot. Used once the diagram is saved, or when the unsaved work is
+        abandoned on purpose.
+        """
+        self.__close_file()
+        self.__pending_line_list = []
+        self.__pending_size = 0
+        self.__generation = 0
+        for path in (self.__journal_path, self.__snapshot_path):
+            if os.path.exists(path):
+                os.remove(path)
+
+    # Stop writing #
+    def _close(self):
+        """
+        Writes the buffered entries and closes the journal. The files stay on disk.
+        """
+        self._flush()
+        self.__close_file()
+
+    #################################################################
+
+    def __close_file(self):
+        if self.__file is not None:
+            self.__file.close()
+            self.__file = None
+
+    # Start a journal holding only the header of the current generation #
+    def __reset_journal(self):
+        self.__close_file()
+        line = json.dumps({"generation": self.__generation}, separators=(",", ":")) + "\n"
+        Storage._write_file_atomically(self.__journal_path, line)
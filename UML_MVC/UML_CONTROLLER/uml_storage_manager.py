@@ -1,12 +1,231 @@
 ###################################################################################################
 
 # IMPORTED MODULES #
+import gzip
+import io
 import json
+import lzma
 import os
-from typing import List, Dict
+from typing import Any, Dict, Iterable, Iterator, List, TextIO, Tuple
+# Optional faster JSON backend, the standard library is used when it is not installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+from UML_MVC.UML_CONTROLLER.uml_binary_snapshot import UMLBinarySnapshot as BinarySnapshot
 # Get the root directory where the main.py file exists
 root_directory = os.path.dirname(os.path.abspath(__file__))  # This gets the current script's directory
 root_directory = os.path.abspath(os.path.join(root_directory, "..", ".."))  # Move to the root directory (where main.py is)
+# Saved file name lists, relative to the working directory
+NAME_LIST_PATH = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
+NAME_LIST_GUI_PATH = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
+# JSON backend picked at import time
+DEFAULT_JSON_BACKEND = "orjson" if orjson is not None else "json"
+# Number of characters read at a time when streaming a diagram file
+STREAM_CHUNK_SIZE = 64 * 1024
+# Compressed diagram files: the extension that selects the compression when writing, and the magic bytes
+# that identify it when reading, whatever the file is called
+COMPRESSION_EXTENSION_LIST = {".gz": gzip, ".xz": lzma}
+COMPRESSION_MAGIC_LIST = {b"\x1f\x8b": gzip, b"\xfd7zXZ\x00": lzma}
+DIAGRAM_EXTENSION_LIST = (".json.gz", ".json.xz", ".json")
+
+###################################################################################################
+
+class UMLJsonSerializer:
+
+    """
+    Encodes and decodes diagram files. The compact mode writes no indentation and tight separators
+    and uses the fastest available backend. The pretty mode writes the 4-space indented layout
+    with the standard library, so files stay byte-identical for human diffs whatever is installed.
+    Both modes read any JSON file.
+    """
+
+    # UML JSON serializer constructor #
+    def __init__(self, is_pretty: bool = False, backend: str = DEFAULT_JSON_BACKEND):
+        """
+        Initializes the serializer.
+
+        Args:
+            is_pretty (bool): True to write indented JSON.
+            backend (str): "orjson" or "json".
+
+        Raises:
+            ValueError: If the backend is unknown or not installed.
+        """
+        if backend not in ("orjson", "json"):
+            raise ValueError(f"Unknown JSON backend: {backend}")
+        if backend == "orjson" and orjson is None:
+            raise ValueError("The orjson backend is not installed")
+        self.__is_pretty = is_pretty
+        self.__backend = backend
+
+    def _is_pretty(self) -> bool:
+        return self.__is_pretty
+
+    def _get_backend(self) -> str:
+        return self.__backend
+
+    # Encode data #
+    def _dumps(self, data: Any) -> str:
+        """
+        Args:
+            data (Any): The data to encode.
+
+        Returns:
+            str: The JSON text.
+        """
+        if self.__is_pretty:
+            return json.dumps(data, indent=4)
+        if self.__backend == "orjson":
+            return orjson.dumps(data).decode("utf-8")
+        return json.dumps(data, separators=(",", ":"), ensure_ascii=False)
+
+    # Encode data piece by piece #
+    def _iter_dumps(self, data: Any) -> Iterator[str]:
+        """
+        Encodes data as a sequence of text pieces that join to the same text as _dumps, so the
+        whole text never has to be held in memory. In compact mode each element of a top-level list
+        (each class, each relationship) is encoded by the fast backend on its own.
+
+        Args:
+            data (Any): The data to encode.
+
+        Yields:
+            str: The next piece of the JSON text.
+        """
+        if self.__is_pretty:
+            yield from json.JSONEncoder(indent=4).iterencode(data)
+            return
+        if not isinstance(data, dict):
+            yield self._dumps(data)
+            return
+        yield "{"
+        for key_index, (key, value) in enumerate(data.items()):
+            yield f"{',' if key_index else ''}{self._dumps(key)}:"
+            if isinstance(value, list):
+                yield "["
+                for element_index, element in enumerate(value):
+                    yield f",{self._dumps(element)}" if element_index else self._dumps(element)
+                yield "]"
+            else:
+                yield self._dumps(value)
+        yield "}"
+
+    # Decode data #
+    def _loads(self, text: str) -> Any:
+        """
+        Args:
+            text (str): The JSON text.
+
+        Returns:
+            Any: The decoded data.
+
+        Raises:
+            json.JSONDecodeError: If the text is not valid JSON (orjson raises a subclass of it).
+        """
+        if self.__backend == "orjson":
+            return orjson.loads(text)
+        return json.loads(text)
+
+###################################################################################################
+
+class UMLJsonStreamReader:
+
+    """
+    Reads JSON values one at a time from a text file, keeping only the unread part of the current chunk
+    in memory. The standard library decoder is used, it is the only one that can decode from an offset.
+    """
+
+    # UML JSON stream reader constructor #
+    def __init__(self, file: TextIO, chunk_size: int = STREAM_CHUNK_SIZE):
+        """
+        Args:
+            file (TextIO): The file to read, positioned at the start of the document.
+            chunk_size (int): The number of characters read at a time.
+        """
+        self.__file = file
+        self.__chunk_size = chunk_size
+        self.__decoder = json.JSONDecoder()
+        self.__buffer: str = ""
+        self.__position: int = 0
+        self.__is_end_of_file: bool = False
+
+    # Read more of the file #
+    def __fill(self) -> bool:
+        if self.__is_end_of_file:
+            return False
+        # Read at least as much as is left, so a large value is decoded in a logarithmic number of attempts
+        chunk = self.__file.read(max(self.__chunk_size, len(self.__buffer) - self.__position))
+        if not chunk:
+            self.__is_end_of_file = True
+        self.__buffer = self.__buffer[self.__position:] + chunk
+        self.__position = 0
+        return bool(chunk)
+
+    # Next non-whitespace character, without consuming it #
+    def _peek(self) -> str:
+        """
+        Returns:
+            str: The next non-whitespace character, or "" at the end of the file.
+        """
+        while True:
+            while self.__position < len(self.__buffer) and self.__buffer[self.__position] in " \t\n\r":
+                self.__position += 1
+            if self.__position < len(self.__buffer) or not self.__fill():
+                return self.__buffer[self.__position:self.__position + 1]
+
+    # Consume one structural character #
+    def _expect(self, character: str):
+        """
+        Raises:
+            ValueError: If the next non-whitespace character is not the expected one.
+        """
+        if self._peek() != character:
+            raise ValueError(f"Expected '{character}' in the JSON document")
+        self.__position += 1
+
+    # Decode the next value #
+    def _read_value(self) -> Any:
+        """
+        Returns:
+            Any: The next JSON value.
+
+        Raises:
+            json.JSONDecodeError: If the document is not valid JSON.
+        """
+        self._peek()
+        while True:
+            try:
+                value, end = self.__decoder.raw_decode(self.__buffer, self.__position)
+                # A value that ends the buffer may continue in the next chunk (e.g. a number)
+                if end < len(self.__buffer) or self.__is_end_of_file:
+                    self.__position = end
+                    return value
+            except json.JSONDecodeError:
+                if self.__is_end_of_file:
+                    raise
+            self.__fill()
+
+    # Decode the elements of an array one at a time #
+    def _iterate_array(self) -> Iterator[Any]:
+        """
+        Yields:
+            Any: Each element of the array that starts at the current position.
+
+        Raises:
+            ValueError: If the array is malformed.
+        """
+        self._expect("[")
+        if self._peek() == "]":
+            self.__position += 1
+            return
+        while True:
+            yield self._read_value()
+            if self._peek() == ",":
+                self.__position += 1
+                continue
+            self._expect("]")
+            return
 
 ###################################################################################################
 
@@ -27,7 +246,7 @@ class UMLStorageManager:
             list: A list of dictionaries containing saved file names and their status ('on'/'off').
             None: If there is a file not found error or JSON decoding error.
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
+        file_path = NAME_LIST_PATH
         try:
             # Check if the file is empty
             if os.stat(file_path).st_size == 0:
@@ -55,7 +274,7 @@ class UMLStorageManager:
             list: A list of dictionaries containing saved file names and their status ('on'/'off').
             None: If there is a file not found error or JSON decoding error.
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
+        file_path = NAME_LIST_GUI_PATH
         try:
             # Check if the file is empty
             if os.stat(file_path).st_size == 0:
@@ -76,12 +295,21 @@ class UMLStorageManager:
     #################################################################
     
     # UML storage manager constructor #
-    def __init__(self):
+    def __init__(self, serializer: UMLJsonSerializer = None):
         """
         Initializes the UMLStorageManager by loading the saved file name list into memory.
+
+        Args:
+            serializer (UMLJsonSerializer, optional): Encodes diagram files, compact by default.
         """
+        self.__serializer: UMLJsonSerializer = serializer if serializer is not None else UMLJsonSerializer()
         self.__saved_file_name_list: List[Dict] = self.load_name()
         self.__saved_file_name_list_gui: List[Dict] = self.load_name_gui()
+        # Content of each name list file as last read or written, so unchanged lists are not rewritten
+        self.__flushed_name_list_text: Dict[str, str] = {
+            NAME_LIST_PATH: json.dumps(self.__saved_file_name_list, indent=4),
+            NAME_LIST_GUI_PATH: json.dumps(self.__saved_file_name_list_gui, indent=4),
+        }
         
     # Getter to retrieve the list of saved file names #
     def _get_saved_list(self) -> List[Dict]:
@@ -102,6 +330,12 @@ class UMLStorageManager:
         """
         return self.__saved_file_name_list_gui
         
+    def _get_serializer(self) -> UMLJsonSerializer:
+        return self.__serializer
+
+    def _set_serializer(self, serializer: UMLJsonSerializer):
+        self.__serializer = serializer
+        
     #################################################################
     ### MEMBER FUNCTIONS ###
     
@@ -111,6 +345,7 @@ class UMLStorageManager:
     def _save_data_to_json(self, file_name: str, main_data: Dict):
         """
         Save the current UML data (main_data) to a specified JSON file.
+        An existing file is only overwritten if it is in the saved list.
 
         Args:
             file_name (str): The name of the file to save.
@@ -120,57 +355,166 @@ class UMLStorageManager:
             None
         """
         file_path = os.path.join(root_directory, f"{file_name}.json")
-        try:
-            # If the file does not exist, create and write the data
-            if not os.path.exists(file_path):
-                with open(file_path, "w") as json_file:
-                    json.dump(main_data, json_file, indent=4)
-                    return
-            # If file exists, update its data if the file name is in the saved list
-            for dictionary in self.__saved_file_name_list:
-                if file_name in dictionary:
-                    # Open the file and overwrite the current data with the new data
-                    with open(file_path, "r") as json_file:
-                        data = json.load(json_file)
-                        data = main_data  # Overwrite with new data
-                    with open(file_path, "w") as json_file:
-                        json.dump(data, json_file, indent=4)
-        except json.JSONDecodeError:
-            # Handle JSON decoding errors
-            print(f"\nError decoding JSON from {file_path}.")
+        if os.path.exists(file_path) and not any(file_name in dictionary for dictionary in self.__saved_file_name_list):
             return None
+        self.__save_main_data(main_data, [file_path])
     
     # Save data specifically for GUI-based interactions
-    def _save_data_to_json_gui(self, file_path: str, main_data: Dict):
+    def _save_data_to_json_gui(self, file_path: str, main_data: Dict, file_name: str = None):
         """
         Save the UML data (main_data) to a specified file path for GUI operations.
+        The data is serialized once, even when the root copy is written as well.
 
         Args:
-            file_name (str): The name of the file to save.
             file_path (str): The full path (directory + file) where the data will be saved.
             main_data (Dict): The UML data to be saved in JSON format.
+            file_name (str, optional): Also save the data to '<file_name>.json' in the root directory,
+                                       the copy the CLI loads from.
 
         Returns:
             None
         """
-        try:
-            # If file does not exist, create it and write the data
-            if not os.path.exists(file_path):
-                with open(file_path, "w") as json_file:
-                    json.dump(main_data, json_file, indent=4)
-                    return
-            
-            # If file exists, update its data
-            with open(file_path, "r") as json_file:
-                data = json.load(json_file)
-            
-            # Overwrite with new data
-            with open(file_path, "w") as json_file:
-                json.dump(main_data, json_file, indent=4)
+        file_path_list = [file_path]
+        # The root copy is always plain JSON
+        if file_name is not None:
+            root_file_path = os.path.join(root_directory, f"{file_name}.json")
+            if os.path.abspath(root_file_path) != os.path.abspath(file_path):
+                file_path_list.append(root_file_path)
+        self.__save_main_data(main_data, file_path_list)
         
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+    # Serialize the data once and write it to every path #
+    def __save_main_data(self, main_data: Dict, file_path_list: List[str]):
+        text = None
+        for file_path in file_path_list:
+            try:
+                if self._get_compression(file_path) is not None:
+                    # Compressed files are encoded and compressed piece by piece
+                    self._write_file_atomically(file_path, self.__serializer._iter_dumps(main_data))
+                    continue
+                if text is None:
+                    text = self.__serializer._dumps(main_data)
+                self._write_file_atomically(file_path, text)
+            except OSError as error:
+                print(f"\nError writing {file_path}: {error}")
+
+    # Compression of a file to write #
+    @staticmethod
+    def _get_compression(file_path: str):
+        """
+        Args:
+            file_path (str): The file to write.
+
+        Returns:
+            module | None: gzip for a '.gz' file, lzma for a '.xz' file, None for an uncompressed file.
+        """
+        return COMPRESSION_EXTENSION_LIST.get(os.path.splitext(file_path)[1].lower())
+
+    # Compression of a file to read #
+    @staticmethod
+    def _detect_compression(file_path: str):
+        """
+        Identifies the compression of a file by its magic bytes, whatever its extension.
+
+        Args:
+            file_path (str): The file to read.
+
+        Returns:
+            module | None: gzip, lzma, or None for an uncompressed file.
+
+        Raises:
+            FileNotFoundError: If the file does not exist.
+        """
+        with open(file_path, "rb") as file:
+            magic = file.read(6)
+        for magic_bytes, compression in COMPRESSION_MAGIC_LIST.items():
+            if magic.startswith(magic_bytes):
+                return compression
+        return None
+
+    # Open a diagram file for reading as text #
+    @classmethod
+    def _open_diagram_file(cls, file_path: str) -> TextIO:
+        """
+        Opens a diagram file as text, decompressing it on the fly if it is compressed.
+
+        Args:
+            file_path (str): The file to read.
+
+        Returns:
+            TextIO: The open file.
+        """
+        compression = cls._detect_compression(file_path)
+        if compression is None:
+            return open(file_path, "r", encoding="utf-8")
+        return compression.open(file_path, "rt", encoding="utf-8")
+
+    # Name of a diagram from its path #
+    @staticmethod
+    def _get_diagram_name(file_path: str) -> str:
+        """
+        Args:
+            file_path (str): The path of a diagram file, e.g. 'dir/car.json.gz'.
+
+        Returns:
+            str: The file name without its diagram extension, e.g. 'car'.
+        """
+        file_base_name = os.path.basename(file_path)
+        for extension in DIAGRAM_EXTENSION_LIST:
+            if file_base_name.lower().endswith(extension):
+                return file_base_name[:-len(extension)]
+        return os.path.splitext(file_base_name)[0]
+
+    # Check the extension of a diagram file #
+    @staticmethod
+    def _is_diagram_file(file_path: str) -> bool:
+        return file_path.lower().endswith(DIAGRAM_EXTENSION_LIST)
+        
+    # Write a file through a temporary file #
+    @staticmethod
+    def _write_file_atomically(file_path: str, text: str | bytes | Iterable[str]):
+        """
+        Write text to a temporary file next to the target, then move it over the target in one step,
+        so a crash during the write leaves either the old or the new file, never a truncated one.
+        A '.gz' or '.xz' file is compressed while it is written.
+
+        Args:
+            file_path (str): The file to write.
+            text (str | bytes | Iterable[str]): The full content of the file, bytes are written as they are,
+                                                text pieces are written one after the other.
+
+        Raises:
+            OSError: If the file can't be written. The target is left untouched.
+        """
+        temp_path = f"{file_path}.tmp"
+        compression = UMLStorageManager._get_compression(file_path)
+        try:
+            with open(temp_path, "wb") as temp_file:
+                if compression is gzip:
+                    # Record the name of the target, not of the temporary file, in the gzip header
+                    binary_file = gzip.GzipFile(filename=file_path, mode="wb", fileobj=temp_file)
+                elif compression is not None:
+                    binary_file = compression.open(temp_file, "wb")
+                else:
+                    binary_file = temp_file
+                if isinstance(text, bytes):
+                    binary_file.write(text)
+                else:
+                    text_file = io.TextIOWrapper(binary_file, encoding="utf-8")
+                    for piece in ([text] if isinstance(text, str) else text):
+                        text_file.write(piece)
+                    text_file.flush()
+                    # Keep the binary file open, it is closed below
+                    text_file.detach()
+                if compression is not None:
+                    # Writes the end of the compressed stream, the temporary file stays open
+                    binary_file.close()
+                temp_file.flush()
+                os.fsync(temp_file.fileno())
+            os.replace(temp_path, file_path)
+        except OSError:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
         
     # Load UML data from a specified JSON file #
     def _load_data_from_json(self, file_name: str):
@@ -187,8 +531,8 @@ class UMLStorageManager:
         # Create the file path to save the file in the root directory
         file_path = os.path.join(root_directory, f"{file_name}.json")
         try:
-            with open(file_path, "r") as file:
-                data = json.load(file)
+            with open(file_path, "r", encoding="utf-8") as file:
+                data = self.__serializer._loads(file.read())
                 return data
         except FileNotFoundError:
             # Handle the case where the file is not found
@@ -202,29 +546,159 @@ class UMLStorageManager:
     # Load UML data from a specified JSON file #
     def _load_data_from_json_gui(self, file_path: str):
         """
-        Load UML data from a specified JSON file.
+        Load UML data from a specified JSON file. A gzip or xz compressed file is recognized by its magic bytes
+        and decompressed while it is read.
 
         Args:
-            file_name (str): The name of the file to load data from.
+            file_path (str): The full path of the file to load data from.
 
         Returns:
             dict: The UML data loaded from the JSON file.
             None: If there is a file not found error or JSON decoding error.
         """
-        # Create the file path to save the file in the root directory
         try:
-            with open(file_path, "r") as file:
-                data = json.load(file)
+            if self._detect_compression(file_path) is not None:
+                # Never hold the whole decompressed text, build the diagram one record at a time
+                main_data = {"classes": [], "relationships": []}
+                for record_kind, record in self.__stream_records(file_path):
+                    main_data["classes" if record_kind == "class" else "relationships"].append(record)
+                return main_data
+            with open(file_path, "r", encoding="utf-8") as file:
+                data = self.__serializer._loads(file.read())
                 return data
         except FileNotFoundError:
             # Handle the case where the file is not found
             print(f"File {file_path} not found.")
             return None
-        except json.JSONDecodeError:
+        except ValueError:
             # Handle JSON decoding errors
             print(f"\nError decoding JSON from {file_path}.")
             return None
         
+    # Stream UML data from a specified JSON file #
+    def _stream_data_from_json(self, file_name: str):
+        """
+        Stream UML data from a specified JSON file, see _stream_data_from_json_gui.
+
+        Args:
+            file_name (str): The name of the file to load data from.
+
+        Returns:
+            Iterator[Tuple[str, Dict]]: The records of the file.
+            None: If the file is not found.
+        """
+        file_path = os.path.join(root_directory, f"{file_name}.json")
+        return self._stream_data_from_json_gui(file_path)
+
+    # Stream UML data from a JSON file path #
+    def _stream_data_from_json_gui(self, file_path: str):
+        """
+        Stream UML data from a JSON file without decoding the whole document at once. Each class is yielded
+        as ("class", class_record) while it is read, then each relationship as ("relationship", relationship_record).
+        Relationships stored before the classes are held back until every class was yielded.
+        A gzip or xz compressed file is decompressed on the fly.
+
+        Args:
+            file_path (str): The full path of the file.
+
+        Returns:
+            Iterator[Tuple[str, Dict]]: The records of the file. Iterating raises ValueError if the
+                                        document is not valid JSON, has no 'classes' or 'relationships' list,
+                                        or can't be decompressed.
+            None: If the file is not found.
+        """
+        if not os.path.exists(file_path):
+            print(f"File {file_path} not found.")
+            return None
+        return self.__stream_records(file_path)
+
+    def __stream_records(self, file_path: str) -> Iterator[Tuple[str, Dict]]:
+        try:
+            yield from self.__read_records(file_path)
+        except (OSError, EOFError, lzma.LZMAError) as error:
+            # A corrupted or truncated compressed file
+            if isinstance(error, FileNotFoundError):
+                raise
+            raise ValueError(f"Can't decompress {file_path}: {error}") from error
+
+    def __read_records(self, file_path: str) -> Iterator[Tuple[str, Dict]]:
+        with self._open_diagram_file(file_path) as file:
+            reader = UMLJsonStreamReader(file)
+            reader._expect("{")
+            held_relationship_list = []
+            key_set = set()
+            while reader._peek() != "}":
+                if key_set:
+                    reader._expect(",")
+                key = reader._read_value()
+                reader._expect(":")
+                key_set.add(key)
+                if key == "classes":
+                    for class_element in reader._iterate_array():
+                        yield "class", class_element
+                    for relationship_element in held_relationship_list:
+                        yield "relationship", relationship_element
+                    held_relationship_list = []
+                elif key == "relationships":
+                    for relationship_element in reader._iterate_array():
+                        if "classes" in key_set:
+                            yield "relationship", relationship_element
+                        else:
+                            held_relationship_list.append(relationship_element)
+                else:
+                    # Unknown entries are skipped
+                    reader._read_value()
+            reader._expect("}")
+            if reader._peek() != "":
+                raise ValueError("Extra data after the JSON document")
+            if not {"classes", "relationships"} <= key_set:
+                raise ValueError("Expected 'classes' and 'relationships' lists")
+
+    # Save UML data as a binary snapshot #
+    def _save_snapshot(self, file_path: str, main_data: Dict) -> bool:
+        """
+        Save the UML data (main_data) to a binary snapshot file, see UMLBinarySnapshot.
+        Faster to write and read than JSON, meant for autosave and batch jobs.
+
+        Args:
+            file_path (str): The full path of the snapshot file, usually ending with '.umlb'.
+            main_data (Dict): The UML data to be saved.
+
+        Returns:
+            bool: True if the snapshot was written.
+        """
+        try:
+            self._write_file_atomically(file_path, BinarySnapshot._encode(main_data))
+        except ValueError as error:
+            print(f"\nCan't encode the data as a binary snapshot: {error}")
+            return False
+        except OSError as error:
+            print(f"\nError writing {file_path}: {error}")
+            return False
+        return True
+
+    # Load UML data from a binary snapshot #
+    def _load_snapshot(self, file_path: str):
+        """
+        Load UML data from a binary snapshot file.
+
+        Args:
+            file_path (str): The full path of the snapshot file.
+
+        Returns:
+            dict: The UML data, in the same format as a loaded JSON file.
+            None: If the file is not found or is not a valid snapshot.
+        """
+        try:
+            with open(file_path, "rb") as file:
+                return BinarySnapshot._decode(file.read())
+        except FileNotFoundError:
+            print(f"File {file_path} not found.")
+            return None
+        except ValueError as error:
+            print(f"\nError decoding binary snapshot {file_path}: {error}")
+            return None
+
     # Add a new file name to the saved file list #
     def _add_name_to_saved_file(self, file_name: str):
         """
@@ -236,28 +710,19 @@ class UMLStorageManager:
         Returns:
             None
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
         saved_list = self.__saved_file_name_list
         # Avoid duplicate file names
         for pair in saved_list:
             if file_name in pair:
                 return
         saved_list.append({file_name: "off"})
-        try:
-            # Write the updated saved list to the file
-            with open(file_path, "w") as file:
-                json.dump(saved_list, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        self.__flush_name_list(NAME_LIST_PATH, saved_list)
         
     # Update the saved file list with new information #
     def _update_saved_list(self, saved_list: List[Dict]):
         """
         Update the saved file name list and store it in 'NAME_LIST.json'.
+        The file is only written if the list differs from what was last read or written.
 
         Args:
             saved_list (List[Dict]): The updated list of saved files.
@@ -265,17 +730,7 @@ class UMLStorageManager:
         Returns:
             None
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST.json"
-        try:
-            # Write the updated saved list to the file
-            with open(file_path, "w") as file:
-                json.dump(saved_list, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+        self.__flush_name_list(NAME_LIST_PATH, saved_list)
         
     # Add name to saved list for GUI #
     def _add_name_to_saved_file_gui(self, file_path: str):
@@ -283,50 +738,43 @@ class UMLStorageManager:
         Add a new file name to the saved file name list and store it in 'NAME_LIST_GUI.json'.
 
         Args:
-            file_name (str): The name of the file to be added to the saved list.
+            file_path (str): The path of the file to be added to the saved list.
 
         Returns:
             None
         """
-        file_name_path = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
         saved_list_gui = self.__saved_file_name_list_gui
         # Avoid duplicate file names
         for pair in saved_list_gui:
             if file_path in pair:
                 return
         saved_list_gui.append({file_path: "off"})
-        try:
-            # Write the updated saved list to the file
-            with open(file_name_path, "w") as file:
-                json.dump(saved_list_gui, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_name_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_name_path}.")
-            return None
+        self.__flush_name_list(NAME_LIST_GUI_PATH, saved_list_gui)
         
     # Update the saved file list with new information #
     def _update_saved_list_gui(self, saved_list_gui: List[Dict]):
         """
-        Update the saved file name list and store it in 'NAME_LIST.json'.
+        Update the saved file name list and store it in 'NAME_LIST_GUI.json'.
+        The file is only written if the list differs from what was last read or written.
 
         Args:
-            saved_list (List[Dict]): The updated list of saved files.
+            saved_list_gui (List[Dict]): The updated list of saved files.
 
         Returns:
             None
         """
-        file_path = "UML_UTILITY/SAVED_FILES/NAME_LIST_GUI.json"
+        self.__flush_name_list(NAME_LIST_GUI_PATH, saved_list_gui)
+        
+    # Write a name list if it changed #
+    def __flush_name_list(self, file_path: str, saved_list: List[Dict]):
+        text = json.dumps(saved_list, indent=4)
+        if self.__flushed_name_list_text.get(file_path) == text:
+            return
         try:
-            # Write the updated saved list to the file
-            with open(file_path, "w") as file:
-                json.dump(saved_list_gui, file, indent=4)
-        except FileNotFoundError:
-            print(f"\nFile {file_path} not found.")
-            return None
-        except json.JSONDecodeError:
-            print(f"\nError decoding JSON from {file_path}.")
-            return None
+            self._write_file_atomically(file_path, text)
+        except OSError as error:
+            print(f"\nError writing {file_path}: {error}")
+            return
+        self.__flushed_name_list_text[file_path] = text
 
 ###################################################################################################
\ No newline at end of file
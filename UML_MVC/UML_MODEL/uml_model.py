@@ -11,13 +11,19 @@ to handle save/load functionality and provides static methods for creating UML c
 import copy
 import re
 import os
-from typing import Dict, List
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Iterable, List, Mapping, Set, Tuple
 from UML_CORE.UML_CLASS.uml_class import UMLClass as Class
 from UML_CORE.UML_FIELD.uml_field import UMLField as Field
 from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_METHOD.uml_method_entry import UMLMethodEntry as MethodEntry
 from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
 from UML_CORE.UML_RELATIONSHIP.uml_relationship import UMLRelationship as Relationship
 from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager as Storage
+from UML_MVC.uml_event_bus import UMLEvent as Event, UMLEventBus as EventBus
+from UML_MVC.UML_MODEL.uml_read_only_view import UMLReadOnlyDict as ReadOnlyDict
+from UML_MVC.UML_MODEL.uml_type_registry import UMLTypeRegistry as TypeRegistry
 from UML_ENUM_CLASS.uml_enum import InterfaceOptions, RelationshipType
 from UML_MVC.UML_VIEW.UML_GUI_VIEW.uml_gui_canvas import UMLGraphicsView as GUIView
 # Get the root directory where the main.py file exists
@@ -26,6 +32,37 @@ root_directory = os.path.abspath(os.path.join(root_directory, "..", ".."))  # Mo
 
 ###################################################################################################
 
+class _Savepoint:
+
+    """
+    The restore point of one open transaction. Instead of a copy of the model, it keeps the main data entry
+    of each class and relationship the first time the transaction touches it.
+    """
+
+    __slots__ = ("pending_event_count", "number_of_method", "class_count", "relationship_count", "class_record_list",
+                 "relationship_record_list", "class_order", "relationship_order", "main_data")
+
+    def __init__(self, pending_event_count: int, number_of_method: int, class_count: int, relationship_count: int):
+        """
+        Parameters:
+            pending_event_count (int): The number of notifications already queued in the event bus.
+            number_of_method (int): The method counter of the model.
+            class_count (int): The number of class entries in main data.
+            relationship_count (int): The number of relationship entries in main data.
+        """
+        self.pending_event_count = pending_event_count
+        self.number_of_method = number_of_method
+        self.class_count = class_count
+        self.relationship_count = relationship_count
+        # Touched class name / relationship -> (copy of its entry, the entry itself), None if created in the transaction
+        self.class_record_list: Dict[str, Tuple[Dict, Dict] | None] = {}
+        self.relationship_record_list: Dict[Relationship, Tuple[Dict, Dict] | None] = {}
+        # The main data entry lists before the first removal, None while entries were only appended
+        self.class_order: List[Dict] | None = None
+        self.relationship_order: List[Dict] | None = None
+        # The complete main data, only saved when the whole model is replaced inside the transaction
+        self.main_data: Dict | None = None
+
 class UMLModel:
     
     """
@@ -52,10 +89,30 @@ class UMLModel:
         self.__console = console   
         self.__class_list: Dict[str, Class] = {}
         self.__storage_manager: Storage = Storage()
-        self.__relationship_list: List[Relationship] = []
+        # Relationships in insertion order (a dict used as an ordered set, so removal is O(1))
+        self.__relationship_list: Dict[Relationship, None] = {}
+        # Relationship store keyed by (source, destination) plus per-class adjacency sets
+        self.__relationship_index: Dict[Tuple[str, str], Relationship] = {}
+        self.__outgoing_relationship: Dict[str, Set[str]] = {}
+        self.__incoming_relationship: Dict[str, Set[str]] = {}
         self.__main_data: Dict = {"classes":[], "relationships":[]}
+        # Interned field, return and parameter types with a reverse index to the members using them
+        self.__type_registry: TypeRegistry = TypeRegistry()
+        # Bookkeeping for incremental main data updates: each class/relationship keeps a reference
+        # to its own entry inside main data, so an edit only re-serializes the entries it touched
+        self.__class_entry_list: Dict[str, Dict] = {}
+        self.__relationship_entry_list: Dict[Relationship, Dict] = {}
+        self.__dirty_class_set: set = set()
+        self.__dirty_relationship_set: set = set()
+        self.__is_main_data_stale: bool = False
+        self.__is_verifying_main_data: bool = False
         self._observers = [] # For observer design pattern
+        # Delivers events to the observers, immediately or as coalesced batches
+        self.__event_bus: EventBus = EventBus(self._observers)
         self._current_number_of_method = 0
+        # Restore points of the open transactions, innermost last. Their notifications are held back
+        # in the event bus until the outermost one commits
+        self.__savepoint_list: List[_Savepoint] = []
                     
     #################################################################
       
@@ -94,25 +151,283 @@ class UMLModel:
             is_loading (bool, optional): Flag indicating if the notification is part of a loading process.
             is_undo_or_redo (bool, optional): Flag indicating if the notification is part of an undo or redo operation.
 
-        This method calls the _update method on each attached observer, passing along the event information.
+        The event goes through the event bus, which calls the _update method on each attached observer right away,
+        or buffers it while a batch or transaction is open and delivers the whole batch at the end.
+        """
+        self.__event_bus._publish(Event(event_type, data, is_loading, is_undo_or_redo))
+
+    def _get_event_bus(self) -> EventBus:
         """
-        for observer in self._observers:
-            observer._update(event_type, data, is_loading, is_undo_or_redo)
+        Retrieves the event bus that delivers model events to the observers.
+
+        Returns:
+            EventBus: The event bus. Use 'with model._get_event_bus().batch():' to receive the
+                      events of a block as one coalesced batch without opening a transaction.
+        """
+        return self.__event_bus
     
     #################################################################
+
+    # Transaction #
+
+    @contextmanager
+    def transaction(self):
+        """
+        Groups several operations into one transaction:
+
+            with model.transaction():
+                model._add_class("Car")
+                model._add_field("Car", "int", "speed")
+
+        Every operation is still validated when it is called. Main data sync and observer notifications
+        are deferred until the outermost transaction commits, so building a large diagram does not
+        re-serialize and notify after every single call; observers then receive the events as one
+        coalesced batch through the event bus. If an exception escapes the block, the model
+        (classes, relationships and main data) is restored to its state when the block was entered and
+        the queued notifications of the block are dropped, then the exception is re-raised.
+        Transactions can be nested; each level rolls back only its own changes.
+
+        The restore point is copy-on-write: the main data entry of a class or relationship is copied the
+        first time the block touches it, so entering a transaction does not depend on the size of the
+        diagram and a rollback only rebuilds what the block changed.
+
+        Yields:
+            UMLModel: The model itself.
+        """
+        # Entries must be current, the savepoint copies them as they are first touched
+        self.__flush_main_data()
+        savepoint = _Savepoint(self.__event_bus._get_pending_count(), self._current_number_of_method,
+                               len(self.__main_data["classes"]), len(self.__main_data["relationships"]))
+        self.__savepoint_list.append(savepoint)
+        self.__event_bus._begin_batch()
+        try:
+            yield self
+        except BaseException:
+            self.__savepoint_list.pop()
+            self.__rollback(savepoint)
+            self.__event_bus._end_batch()
+            raise
+        self.__savepoint_list.pop()
+        if not self.__savepoint_list:
+            # Main data must be current before observers see the events
+            self.__flush_main_data()
+        self.__event_bus._end_batch()
+
+    def _is_in_transaction(self) -> bool:
+        """
+        Returns:
+            bool: True while a transaction is open.
+        """
+        return bool(self.__savepoint_list)
+
+    # Take a compact snapshot of the whole model #
+    def _create_checkpoint(self) -> Tuple[Dict, int]:
+        """
+        Captures the model in its main data form, which is much smaller than the UML objects it describes.
+
+        Returns:
+            Tuple[Dict, int]: A copy of the main data and the method counter, for _restore_checkpoint.
+        """
+        return (self._copy_main_data(), self._current_number_of_method)
+
+    # Bring the model back to a snapshot #
+    def _restore_checkpoint(self, checkpoint: Tuple[Dict, int]):
+        """
+        Rebuilds the model from a checkpoint taken by _create_checkpoint. The checkpoint itself is not
+        modified, so it can be restored again. Observers receive a single 'load' notification.
+
+        Parameters:
+            checkpoint (Tuple[Dict, int]): The main data and method counter returned by _create_checkpoint.
+        """
+        main_data, number_of_method = checkpoint
+        self.__rebuild_from_main_data(main_data)
+        self._current_number_of_method = number_of_method
+        self._notify_observers(event_type=InterfaceOptions.LOAD.value, data={"class_count": len(self.__class_list),
+                                                                            "relationship_count": len(self.__relationship_list)},
+                               is_loading=True, is_undo_or_redo=True)
+
+    # Restore the model to the state saved when a transaction began #
+    def __rollback(self, savepoint: _Savepoint):
+        """
+        Puts back the classes and relationships the transaction touched, in their original order, and drops
+        the notifications queued since the transaction began. Untouched classes and relationships are kept as they are.
+
+        Parameters:
+            savepoint (_Savepoint): The restore point of the transaction.
+        """
+        self.__event_bus._discard_pending(savepoint.pending_event_count)
+        self._current_number_of_method = savepoint.number_of_method
+        if savepoint.main_data is not None:
+            # The whole model was replaced inside the transaction
+            self.__rebuild_from_main_data(savepoint.main_data)
+            return
+        # Take out the touched classes, then put back the saved ones
+        for class_name, record in savepoint.class_record_list.items():
+            class_object = self.__class_list.get(class_name)
+            if class_object is not None:
+                self.__type_registry._unregister_class(class_object)
+            if record is None:
+                self.__class_list.pop(class_name, None)
+                self.__class_entry_list.pop(class_name, None)
+                continue
+            saved_entry, class_entry = record
+            class_entry.clear()
+            class_entry.update(saved_entry)
+            class_object = self.__build_class_from_record(class_entry)
+            # A class that is still there keeps its position in the class list
+            self.__class_list[class_name] = class_object
+            self.__type_registry._register_class(class_object)
+            self.__class_entry_list[class_name] = class_entry
+        # Relationships are unindexed first, so a restored one is not dropped with a new one sharing its classes
+        for relationship, record in savepoint.relationship_record_list.items():
+            if relationship in self.__relationship_list:
+                self.__unindex_relationship(relationship)
+            if record is None:
+                self.__relationship_list.pop(relationship, None)
+                self.__relationship_entry_list.pop(relationship, None)
+        for relationship, record in savepoint.relationship_record_list.items():
+            if record is None:
+                continue
+            saved_entry, relationship_entry = record
+            relationship_entry.clear()
+            relationship_entry.update(saved_entry)
+            relationship._set_source_class(saved_entry["source"])
+            relationship._set_destination_class(saved_entry["destination"])
+            relationship._set_type(saved_entry["type"])
+            self.__relationship_list[relationship] = None
+            self.__index_relationship(relationship)
+            self.__relationship_entry_list[relationship] = relationship_entry
+        # Without removals the entries created by the transaction are at the end, otherwise the saved order is restored
+        class_entry_list = self.__main_data["classes"]
+        if savepoint.class_order is None:
+            del class_entry_list[savepoint.class_count:]
+        else:
+            class_entry_list[:] = savepoint.class_order[:savepoint.class_count]
+            class_list = {class_entry["name"]: self.__class_list[class_entry["name"]] for class_entry in class_entry_list}
+            self.__class_list.clear()
+            self.__class_list.update(class_list)
+        relationship_entry_list = self.__main_data["relationships"]
+        if savepoint.relationship_order is None:
+            del relationship_entry_list[savepoint.relationship_count:]
+        else:
+            relationship_entry_list[:] = savepoint.relationship_order[:savepoint.relationship_count]
+            relationship_by_entry = {id(relationship_entry): relationship for relationship, relationship_entry in self.__relationship_entry_list.items()}
+            relationship_list = dict.fromkeys(relationship_by_entry[id(relationship_entry)] for relationship_entry in relationship_entry_list)
+            self.__relationship_list.clear()
+            self.__relationship_list.update(relationship_list)
+        self.__dirty_class_set.difference_update(savepoint.class_record_list)
+        self.__dirty_relationship_set.difference_update(savepoint.relationship_record_list)
+        if self.__is_verifying_main_data:
+            self._check_main_data_consistency()
+
+    # Save the entry of a class the first time each open transaction touches it #
+    def __record_class(self, class_name: str, is_removal: bool = False):
+        """
+        Copies the main data entry of a class into every open savepoint that has not saved it yet.
+        Called before the entry is re-serialized or removed, so the copy is the state at the start of the transaction.
+
+        Parameters:
+            class_name (str): The name of the class about to change.
+            is_removal (bool): True if the entry is about to be removed from main data.
+        """
+        for savepoint in self.__savepoint_list:
+            if savepoint.main_data is not None:
+                continue
+            if class_name not in savepoint.class_record_list:
+                class_entry = self.__class_entry_list.get(class_name)
+                # None marks a class created inside the transaction
+                savepoint.class_record_list[class_name] = None if class_entry is None else (dict(class_entry), class_entry)
+            if is_removal and savepoint.class_order is None:
+                savepoint.class_order = list(self.__main_data["classes"])
+
+    # Save the entry of a relationship the first time each open transaction touches it #
+    def __record_relationship(self, relationship: Relationship, is_removal: bool = False):
+        """
+        Copies the main data entry of a relationship into every open savepoint that has not saved it yet.
+
+        Parameters:
+            relationship (Relationship): The relationship about to change.
+            is_removal (bool): True if the entry is about to be removed from main data.
+        """
+        for savepoint in self.__savepoint_list:
+            if savepoint.main_data is not None:
+                continue
+            if relationship not in savepoint.relationship_record_list:
+                relationship_entry = self.__relationship_entry_list.get(relationship)
+                savepoint.relationship_record_list[relationship] = None if relationship_entry is None else (dict(relationship_entry), relationship_entry)
+            if is_removal and savepoint.relationship_order is None:
+                savepoint.relationship_order = list(self.__main_data["relationships"])
+
+    # Turn the open savepoints into full copies before the whole model is replaced #
+    def __save_full_savepoint(self):
+        """
+        Gives every open savepoint the complete main data of its start, assembled from the untouched entries
+        and the saved copies. Called before main data or the whole storage is replaced, since the entries
+        the savepoints refer to are dropped.
+        """
+        for savepoint in self.__savepoint_list:
+            if savepoint.main_data is not None:
+                continue
+            saved_entry_list = {id(record[1]): record[0] for record in savepoint.class_record_list.values() if record is not None}
+            saved_entry_list.update((id(record[1]), record[0]) for record in savepoint.relationship_record_list.values() if record is not None)
+            class_order = self.__main_data["classes"] if savepoint.class_order is None else savepoint.class_order
+            relationship_order = self.__main_data["relationships"] if savepoint.relationship_order is None else savepoint.relationship_order
+            savepoint.main_data = {
+                "classes": [saved_entry_list.get(id(entry), entry) for entry in class_order[:savepoint.class_count]],
+                "relationships": [saved_entry_list.get(id(entry), entry) for entry in relationship_order[:savepoint.relationship_count]],
+            }
+            savepoint.class_record_list = {}
+            savepoint.relationship_record_list = {}
+            savepoint.class_order = savepoint.relationship_order = None
+
+    #################################################################
         
     # Getters #
         
-    def _get_class_list(self) -> Dict[str, Class]:
+    def _get_class_list(self) -> Mapping[str, Class]:
         """
-        Retrieves a deep copy of the current class list.
+        Retrieves a read-only view of the current class list.
 
         Returns:
-            Dict[str, Class]: A deep copy of the dictionary containing all UML classes managed by the model.
+            Mapping[str, Class]: A read-only view of the dictionary containing all UML classes managed by the model.
+
+        The view is not a copy: it always reflects the current classes and costs nothing to create.
+        Use _copy_class_list() when an independent copy is needed.
+        """
+        return MappingProxyType(self.__class_list)
+
+    def _copy_class_list(self) -> Dict[str, Class]:
+        """
+        Retrieves a deep copy of the current class list.
 
-        This method provides access to the class list while ensuring the original data remains unmodified by returning a deep copy.
+        Returns:
+            Dict[str, Class]: A deep copy of the class list that can be modified without affecting the model.
         """
         return copy.deepcopy(self.__class_list)
+
+    def _has_class(self, class_name: str) -> bool:
+        """
+        Checks whether a class exists in the model.
+
+        Parameters:
+            class_name (str): The name of the class to look up.
+
+        Returns:
+            bool: True if the class exists, False otherwise.
+        """
+        return class_name in self.__class_list
+
+    def _get_class(self, class_name: str) -> Class | None:
+        """
+        Retrieves a class by name.
+
+        Parameters:
+            class_name (str): The name of the class to look up.
+
+        Returns:
+            Class | None: The class object, or None if no class has that name.
+        """
+        return self.__class_list.get(class_name)
     
     def _get_storage_manager(self) -> Storage:
         """
@@ -130,22 +445,53 @@ class UMLModel:
         Retrieves the current list of relationships.
 
         Returns:
-            List[Relationship]: The list of UML relationships managed by the model.
+            List[Relationship]: The list of UML relationships managed by the model, in the order they were added.
 
         This method provides access to the list of relationships between UML classes.
         """
-        return self.__relationship_list
+        return list(self.__relationship_list)
     
-    def _get_main_data(self) -> Dict:
+    def _get_main_data(self) -> ReadOnlyDict:
         """
-        Retrieves a deep copy of the main data dictionary.
+        Retrieves a read-only view of the main data dictionary.
 
         Returns:
-            Dict: A deep copy of the main data containing classes and relationships.
+            ReadOnlyDict: A read-only view of the main data containing classes and relationships.
 
         The main data dictionary holds all the UML data in a structured format suitable for saving and loading.
+        The view wraps the live dictionary, so nested entries cannot be modified through it.
+        Use _copy_main_data() when an independent copy is needed.
+        """
+        self.__flush_main_data()
+        return ReadOnlyDict(self.__main_data)
+
+    def _copy_main_data(self) -> Dict:
+        """
+        Retrieves a deep copy of the main data dictionary.
+
+        Returns:
+            Dict: A deep copy of the main data that can be modified without affecting the model.
         """
+        self.__flush_main_data()
         return copy.deepcopy(self.__main_data)
+
+    def _copy_class_data(self, class_name: str) -> Dict:
+        """
+        Builds the main data of a single class: its entry and the relationships it takes part in.
+        The cost depends on the size of the class only, not on the size of the diagram.
+
+        Parameters:
+            class_name (str): The name of the class.
+
+        Returns:
+            Dict: A new dictionary in the main data format, {"classes": [...], "relationships": [...]}.
+                  Both lists are empty if the class does not exist.
+        """
+        if class_name not in self.__class_list:
+            return {"classes": [], "relationships": []}
+        relationship_list = [relationship._convert_to_json_relationship()
+                             for relationship in self.__get_incident_relationship_list(class_name)]
+        return {"classes": [self._class_json_format(class_name)], "relationships": relationship_list}
     
     def _set_main_data(self, new_main_data) -> Dict:
         """
@@ -155,8 +501,11 @@ class UMLModel:
             new_main_data (Dict): The new main data dictionary to set.
 
         This method replaces the current main data with the provided data. It is used when loading new data into the model.
+        The incremental bookkeeping no longer matches the new dictionary, so the next sync performs a full rebuild.
         """
+        self.__save_full_savepoint()
         self.__main_data = new_main_data
+        self.__is_main_data_stale = True
     
     def _get_user_view(self):
         """
@@ -168,7 +517,49 @@ class UMLModel:
         The user view is responsible for displaying information and interacting with the user interface.
         """
         return self.__user_view
-        
+
+    def _get_type_registry(self) -> TypeRegistry:
+        """
+        Retrieves the type registry that interns field, return and parameter types.
+
+        Returns:
+            TypeRegistry: The registry holding every type name in use and the members using it.
+        """
+        return self.__type_registry
+
+    def _find_type_usage(self, type_name: str) -> List[Dict]:
+        """
+        Finds every field, method and parameter that uses a type.
+
+        Parameters:
+            type_name (str): The type name to look up.
+
+        Returns:
+            List[Dict]: One dictionary per usage with "class_name", "kind" ("field", "method" or "parameter"),
+                        "name", "method_index" (the 0-based index of the method, or of the method owning the
+                        parameter; None for a field) and "member" (the UML object itself).
+
+        The lookup goes through the reverse index of the type registry, so its cost depends on the number
+        of usages of that type and not on the size of the diagram.
+        """
+        usage_list = self.__type_registry._get_usage_list(type_name)
+        method_index_by_owner: Dict[Class, Dict[Method | Parameter, int]] = {}
+        for usage in usage_list:
+            if usage["kind"] == "field":
+                usage["method_index"] = None
+                continue
+            owner = self.__class_list[usage["class_name"]]
+            method_index_list = method_index_by_owner.get(owner)
+            if method_index_list is None:
+                # Method names and parameter names repeat, the index tells the members apart
+                method_index_list = method_index_by_owner[owner] = {}
+                for method_index, method_entry in enumerate(owner._get_method_and_parameters_list()):
+                    method_index_list[method_entry._get_method()] = method_index
+                    for param in method_entry._get_parameter_list():
+                        method_index_list[param] = method_index
+            usage["method_index"] = method_index_list[usage["member"]]
+        return usage_list
+
     #################################################################
     ### STATIC FUNCTIONS ###
 
@@ -293,7 +684,8 @@ class UMLModel:
         new_class = self.create_class(class_name)
         self.__class_list[class_name] = new_class
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self.__add_class_entry(class_name)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.ADD_CLASS.value, data={"class_name": class_name}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
     
@@ -315,16 +707,59 @@ class UMLModel:
         if not is_class_exist:
             return False
         # Remove the class from the class list
-        self.__class_list.pop(class_name)
+        self.__type_registry._unregister_class(self.__class_list.pop(class_name))
         # Clean up any relationships involving the class
         self.__clean_up_relationship(class_name)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self.__remove_class_entry(class_name)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.DELETE_CLASS.value, data={"class_name": class_name}, is_undo_or_redo=is_undo_or_redo)
         return True
+
+    # Restore a deleted class #
+    def _restore_class(self, class_object: Class, relationship_list: List[Relationship], is_undo_or_redo: bool = True) -> bool:
+        """
+        Puts back a class removed by _delete_class, with all of its fields, methods and parameters, and the
+        relationships it took part in, in one operation: the objects are reinserted as they are, main data
+        is synced once and observers are notified once for the class and once per relationship.
+
+        Parameters:
+            class_object (Class): The class object that was deleted.
+            relationship_list (List[Relationship]): The relationships that were removed along with it.
+                Relationships whose other class no longer exists, or that exist again, are skipped.
+            is_undo_or_redo (bool): Flag indicating if the operation is part of an undo or redo action.
+
+        Returns:
+            bool: True if the class was restored, False if a class with the same name exists.
+        """
+        class_name = class_object._get_class_name()
+        if class_name in self.__class_list:
+            self.__console.print(f"\n[bold red]Class [bold white]'{class_name}'[/bold white] already exists![/bold red]")
+            return False
+        self.__class_list[class_name] = class_object
+        self.__type_registry._register_class(class_object)
+        self._current_number_of_method += len(class_object._get_method_and_parameters_list())
+        self.__add_class_entry(class_name)
+        restored_relationship_list = []
+        for relationship in relationship_list:
+            source_class_name = relationship._get_source_class()
+            destination_class_name = relationship._get_destination_class()
+            if (source_class_name not in self.__class_list or destination_class_name not in self.__class_list
+                    or (source_class_name, destination_class_name) in self.__relationship_index):
+                continue
+            self.__insert_relationship(relationship)
+            self.__add_relationship_entry(relationship)
+            restored_relationship_list.append(relationship)
+        # Update main data and notify observers
+        self._sync_main_data()
+        self._notify_observers(event_type=InterfaceOptions.ADD_CLASS.value, data={"class_name": class_name}, is_undo_or_redo=is_undo_or_redo)
+        for relationship in restored_relationship_list:
+            self._notify_observers(event_type=InterfaceOptions.ADD_REL.value, data={"source": relationship._get_source_class(), "dest": relationship._get_destination_class(),
+                                                                                   "type": relationship._get_type()}, is_undo_or_redo=is_undo_or_redo)
+        return True
         
     # Rename class #
-    def _rename_class(self, current_name: str, new_name: str, is_undo_or_redo: bool = False):
+    def _rename_class(self, current_name: str, new_name: str, is_undo_or_redo: bool = False, is_refactor: bool = False, refactor_key_set: Set[Tuple[str, str, int | None, str]] = None):
         """
         Renames an existing UML class. Updates any associated relationships and notifies observers
         of the renaming event.
@@ -332,6 +767,18 @@ class UMLModel:
         Parameters:
             current_name (str): The current name of the class.
             new_name (str): The new name for the class.
+            is_refactor (bool): Also change every field type, return type and parameter type that refers to the class.
+            refactor_key_set (Set[Tuple[str, str, int | None, str]]): When refactoring, limits the changed members to these
+                                                         (owning class name, kind, method index, member name) keys, as
+                                                         found before the rename (see _find_type_usage). Used by undo/redo
+                                                         to touch exactly the same members.
+
+        Returns:
+            bool: True if the class was renamed, False otherwise.
+
+        In refactor mode the members are found through the type registry's reverse index, so the cost depends on
+        the number of references and not on the size of the diagram. Observers receive a single rename notification
+        whose data also lists the retyped members.
         """
         # Check valid input #
         if not self._is_valid_input(class_name=current_name, new_name=new_name):
@@ -341,17 +788,119 @@ class UMLModel:
         is_able_to_rename = self.__check_class_rename(current_name, new_name)
         if not is_able_to_rename:
             return False
+        # Find the members referring to the class and make sure retyping them keeps method signatures unique
+        usage_list = []
+        if is_refactor:
+            usage_list = self.__get_refactor_usage_list(current_name, refactor_key_set)
+            if not self.__check_refactor_signature(usage_list, new_name):
+                return False
         # Rename the class and update the class list
         class_object = self.__class_list[current_name]
         class_object._set_class_name(new_name)
         self.__class_list[new_name] = self.__class_list.pop(current_name)
         # Update the class name in the relationships
         self.__update_name_in_relationship(current_name, new_name)
+        # Update the type of every member referring to the class
+        retyped_member_list = self.__retype_member_list(usage_list, new_name)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
-        self._notify_observers(event_type=InterfaceOptions.RENAME_CLASS.value, data={"old_name": current_name, "new_name": new_name}, is_undo_or_redo=is_undo_or_redo)
+        self.__remove_class_entry(current_name)
+        self.__add_class_entry(new_name)
+        self._sync_main_data()
+        data = {"old_name": current_name, "new_name": new_name}
+        if is_refactor:
+            data["retyped_member_list"] = retyped_member_list
+        self._notify_observers(event_type=InterfaceOptions.RENAME_CLASS.value, data=data, is_undo_or_redo=is_undo_or_redo)
         return True
-        
+
+    # Get the members to retype when refactoring a class name #
+    def __get_refactor_usage_list(self, class_name: str, refactor_key_set: Set[Tuple[str, str, int | None, str]] = None) -> List[Dict]:
+        """
+        Finds the fields, methods and parameters whose type is the given class name.
+
+        Parameters:
+            class_name (str): The class name used as a type.
+            refactor_key_set (Set[Tuple[str, str, int | None, str]]): Optional (owning class name, kind, method index, member name) filter.
+
+        Returns:
+            List[Dict]: The matching usages, as returned by _find_type_usage.
+        """
+        usage_list = self._find_type_usage(class_name)
+        if refactor_key_set is not None:
+            usage_list = [usage for usage in usage_list
+                          if (usage["class_name"], usage["kind"], usage["method_index"], usage["name"]) in refactor_key_set]
+        return usage_list
+
+    # Check that retyping parameters does not create duplicate method signatures #
+    def __check_refactor_signature(self, usage_list: List[Dict], new_type: str) -> bool:
+        """
+        Checks that giving the parameters in usage_list the new type does not make two methods of a class
+        share the same signature.
+
+        Parameters:
+            usage_list (List[Dict]): The usages that will be retyped.
+            new_type (str): The new type name.
+
+        Returns:
+            bool: True if every signature stays unique, False otherwise.
+        """
+        param_set_by_class: Dict[Class, Set[Parameter]] = {}
+        for usage in usage_list:
+            if usage["kind"] == "parameter":
+                owner = self.__class_list[usage["class_name"]]
+                param_set_by_class.setdefault(owner, set()).add(usage["member"])
+        for owner, param_set in param_set_by_class.items():
+            signature_count = dict(owner._get_signature_index())
+            new_signature_list = []
+            for method_entry in owner._get_method_and_parameters_list():
+                param_list = method_entry._get_parameter_list()
+                if not any(param in param_set for param in param_list):
+                    continue
+                method_name = method_entry._get_method()._get_name()
+                signature_count[Class._make_signature(method_name, param_list)] -= 1
+                new_signature_list.append((method_name, tuple(new_type if param in param_set else param._get_type() for param in param_list)))
+            for signature in new_signature_list:
+                signature_count[signature] = signature_count.get(signature, 0) + 1
+                if signature_count[signature] > 1:
+                    self.__console.print(f"\n[bold red]Cannot change the parameter types of method [bold white]'{signature[0]}'[/bold white] to [bold white]'{new_type}'[/bold white] "
+                                         f"in class [bold white]'{owner._get_class_name()}'[/bold white], two methods would have the same signature![/bold red]")
+                    return False
+        return True
+
+    # Retype the members referring to a renamed class #
+    def __retype_member_list(self, usage_list: List[Dict], new_type: str) -> List[Dict]:
+        """
+        Gives every member in usage_list the new type, keeping the class indexes, the type registry and main data in sync.
+
+        Parameters:
+            usage_list (List[Dict]): The usages to retype, as returned by the type registry.
+            new_type (str): The new type name.
+
+        Returns:
+            List[Dict]: One {"class_name", "kind", "method_index", "name"} dictionary per retyped member, with current class names.
+        """
+        retyped_member_list = []
+        param_set_by_class: Dict[Class, Set[Parameter]] = {}
+        for usage in usage_list:
+            member = usage["member"]
+            owner = self.__type_registry._unregister(member)
+            if usage["kind"] == "parameter":
+                param_set_by_class.setdefault(owner, set()).add(member)
+            else:
+                member._set_type(new_type)
+                self.__type_registry._register(member, owner)
+            self._mark_class_dirty(owner._get_class_name())
+            retyped_member_list.append({"class_name": owner._get_class_name(), "kind": usage["kind"],
+                                        "method_index": usage["method_index"], "name": usage["name"]})
+        # Parameters go through their class so the signature index follows the new types
+        for owner, param_set in param_set_by_class.items():
+            for index, method_entry in enumerate(owner._get_method_and_parameters_list()):
+                param_list = [param for param in method_entry._get_parameter_list() if param in param_set]
+                if param_list:
+                    owner._set_parameter_list_type(index, param_list, new_type)
+                    for param in param_list:
+                        self.__type_registry._register(param, owner)
+        return retyped_member_list
+
     ## FIELD RELATED ##
     
     # Add field #
@@ -374,11 +923,12 @@ class UMLModel:
         if not is_class_and_field_exist:
             return False
         # Retrieve the class and add the new field to its field list
-        field_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
         new_field = self.create_field(field_type, field_name)
-        field_list.append(new_field)
+        self.__class_list[class_name]._add_field(new_field)
+        self.__type_registry._register(new_field, self.__class_list[class_name])
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._mark_class_dirty(class_name)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.ADD_FIELD.value, data={"class_name": class_name, "type": field_type, 
                                                                                   "field_name": field_name}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
@@ -400,11 +950,12 @@ class UMLModel:
         if not is_class_and_field_exist:
             return False
         # Remove the field from the class's field list
-        field_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
         chosen_field = self._get_chosen_field_or_method(class_name, field_name, is_field=True)
-        field_list.remove(chosen_field)
+        self.__class_list[class_name]._remove_field(chosen_field)
+        self.__type_registry._unregister(chosen_field)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._mark_class_dirty(class_name)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.DELETE_FIELD.value, data={"class_name": class_name, "field_name": field_name}, is_undo_or_redo=is_undo_or_redo)
         return True
         
@@ -427,10 +978,11 @@ class UMLModel:
             return False
         # Rename the field in the class
         chosen_field = self._get_chosen_field_or_method(class_name, old_field_name, is_field=True)
-        chosen_field._set_name(new_field_name)
+        self.__class_list[class_name]._rename_field(chosen_field, new_field_name)
         
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._mark_class_dirty(class_name)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.RENAME_FIELD.value, data={"class_name": class_name, "old_field_name": old_field_name, 
                                                                                      "new_field_name": new_field_name}, is_undo_or_redo=is_undo_or_redo)
         return True
@@ -461,8 +1013,7 @@ class UMLModel:
         if not is_class_and_method_exist:
             return False
 
-        # Retrieve the method list for the class and create the new method #
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
+        # Create the new method #
         new_method = self.create_method(method_type, method_name)
         method_and_pram_list_element = {new_method: []}  # Create a dictionary with method and an empty parameter list
 
@@ -473,10 +1024,12 @@ class UMLModel:
                 return False
             
         # Add the new method and its empty parameter list to the method_and_parameter_list #
-        method_and_parameter_list.append(method_and_pram_list_element)
+        self.__class_list[class_name]._add_method(new_method)
+        self.__type_registry._register(new_method, self.__class_list[class_name])
         self._current_number_of_method = self._current_number_of_method + 1
         # Notify observers and update internal data #
-        self._update_main_data_for_every_action()
+        self._mark_class_dirty(class_name)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.ADD_METHOD.value,
                                data={"class_name": class_name, "type": method_type, "method_name": method_name}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
@@ -502,9 +1055,8 @@ class UMLModel:
         method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
         selected_index = int(method_num) - 1  # Convert to zero-based index
         if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
-            method = next(iter(chosen_pair))  # Extract the method object
-            return method
+            chosen_entry = method_and_parameter_list[selected_index]
+            return chosen_entry._get_method()
         else:
             # Print error message if the method number is out of range
             self.__console.print("\n[bold red]Method number out of range! Please enter a valid number.[/bold red]")
@@ -532,45 +1084,42 @@ class UMLModel:
         method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
         selected_index = int(method_num) - 1  # Convert to zero-based index
         if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
+            chosen_entry = method_and_parameter_list[selected_index]
             # Extract the parameter list from the chosen method
-            param_list = next(iter(chosen_pair.values()))
+            param_list = chosen_entry._get_parameter_list()
             # Search for the parameter with the specified name
             for each_parameter in param_list:
                 if each_parameter._get_parameter_name() == parameter_name:
                     return each_parameter
         return None
 
-    def _check_method_param_list(self, class_name: str, new_method_and_params: dict):
+    def _check_method_param_list(self, class_name: str, new_method_and_params: dict, selected_index: int = None):
         """
         Checks if a method with the same signature (name and parameter types) already exists in the class.
 
         Parameters:
             class_name (str) : class which the method is being added to
             new_method_and_params (dict): A dictionary representing the new method and its parameter list.
+            selected_index (int): Index of the method being edited, if any. An edit that keeps
+                                  that method's own signature does not count as a duplicate.
 
         Returns:
             bool: True if no method with the same signature exists, False otherwise.
         """
-        # Loop through each method in the existing method list #
-        method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
-
-        for method_and_parameter in method_and_parameter_list:
-            # Loops through each method and gets the met
-            for method, param_list in method_and_parameter.items():
-                # Gets the new method from the parameter
-                new_method = next(iter(new_method_and_params))
-                # Compare method names #
-                if method._get_name() == new_method._get_name():
-                    # Retrieve parameter types for both methods (existing and new) #
-                    first_param_type_list = [param._get_type() for param in param_list]
-                    second_param_type_list = [param._get_type() for param in new_method_and_params[new_method]]
-
-                    # If parameter lists match, the new method is a duplicate #
-                    if first_param_type_list == second_param_type_list:
-                        self.__console.print(f"\n[bold red]New method [bold white]'{new_method._get_name()}'[/bold white] "
-                                             f"has the same parameter list signature as an existing method in class [bold white]'{class_name}'[/bold white]![bold red]")
-                        return False
+        # Look the (name, parameter types) signature up in the class's signature index #
+        new_method, new_param_list = next(iter(new_method_and_params.items()))
+        signature = Class._make_signature(new_method._get_name(), new_param_list)
+        chosen_class = self.__class_list[class_name]
+        number_of_matches = chosen_class._get_signature_index().get(signature, 0)
+        if selected_index is not None:
+            current_entry = chosen_class._get_method_entry(selected_index)
+            if Class._make_signature(current_entry._get_method()._get_name(), current_entry._get_parameter_list()) == signature:
+                number_of_matches -= 1
+        # If the signature is already taken, the new method is a duplicate #
+        if number_of_matches > 0:
+            self.__console.print(f"\n[bold red]New method [bold white]'{new_method._get_name()}'[/bold white] "
+                                 f"has the same parameter list signature as an existing method in class [bold white]'{class_name}'[/bold white]![bold red]")
+            return False
         return True
     
     # Check if the input for the method number is a number or not
@@ -624,14 +1173,18 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         if 0 <= selected_index < len(method_and_parameter_list):
-            # Get the pair of method, param_list from the index given #
-            chosen_pair = method_and_parameter_list[selected_index]
-            # Extract method and param_list (key and value) from the dictionary
-            method, param_list = next(iter(chosen_pair.items()))
+            # Get the method entry from the index given #
+            chosen_entry = method_and_parameter_list[selected_index]
+            # Extract method and param_list from the entry
+            method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
             # Remove method
-            method_and_parameter_list.remove(chosen_pair)
+            self.__class_list[class_name]._remove_method_at(selected_index)
+            self.__type_registry._unregister(method)
+            for param in param_list:
+                self.__type_registry._unregister(param)
             # Update observers and main data
-            self._update_main_data_for_every_action()
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             self._notify_observers(event_type=InterfaceOptions.DELETE_METHOD.value,
                                    data={"class_name": class_name, "method_name": method._get_name()}, is_undo_or_redo=is_undo_or_redo)
             self._current_number_of_method = self._current_number_of_method - 1
@@ -675,22 +1228,23 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         if 0 <= selected_index < len(method_and_parameter_list):
-            # Get the pair of method, param_list from the index given #
-            chosen_pair = method_and_parameter_list[selected_index]
-            # Extract method and param_list (key and value) from the dictionary
-            method, param_list = next(iter(chosen_pair.items()))
+            # Get the method entry from the index given #
+            chosen_entry = method_and_parameter_list[selected_index]
+            # Extract method and param_list from the entry
+            method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
             # Get the method name that will be changed (so it can be given to the observer)
             old_method_name = method._get_name()
             # Create a copy of the parameter list and make an object that represents the method with the added parameter
             copy_method = self.create_method(method._get_type(), new_name)
             method_with_new_name = {copy_method: param_list}
             # Check to see if the method with the new parameter is a duplicate
-            is_method_valid_with_param = self._check_method_param_list(class_name, method_with_new_name)
+            is_method_valid_with_param = self._check_method_param_list(class_name, method_with_new_name, selected_index)
             if not is_method_valid_with_param:
                 return False
             # Set the new method name and update observers #
-            method._set_name(new_name)
-            self._update_main_data_for_every_action()
+            self.__class_list[class_name]._rename_method(selected_index, new_name)
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             self._notify_observers(event_type=InterfaceOptions.RENAME_METHOD.value,
                                    data={"class_name": class_name, "old_method_name": old_method_name, "new_method_name": new_name}, is_undo_or_redo=is_undo_or_redo)
             return True
@@ -747,15 +1301,15 @@ class UMLModel:
 
         # Ensure the selected index is valid #
         if 0 <= selected_index < len(method_and_parameter_list):
-            # Get the pair of method, param_list from the index given #
-            chosen_pair = method_and_parameter_list[selected_index]
+            # Get the method entry from the index given #
+            chosen_entry = method_and_parameter_list[selected_index]
 
             # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+            method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
 
             # Check if the parameter already exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, method_and_param_list=chosen_entry, 
                 parameter_name=param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=False
             )
             if not is_param_exist:
@@ -773,10 +1327,12 @@ class UMLModel:
                 return False
 
             # If not a duplicate, add the new parameter to the method's parameter list
-            param_list.append(new_param)
+            self.__class_list[class_name]._add_parameter(selected_index, new_param)
+            self.__type_registry._register(new_param, self.__class_list[class_name])
 
             # Update main data and notify observers #
-            self._update_main_data_for_every_action()
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             if not is_loading:
                 self._notify_observers(event_type=InterfaceOptions.ADD_PARAM.value,
                                    data={"class_name": class_name, "method_name": method._get_name(), "param_name": param_name, "type": param_type}, is_undo_or_redo=is_undo_or_redo)
@@ -819,14 +1375,14 @@ class UMLModel:
 
         # Ensure the selected index is valid #
         if 0 <= selected_index < len(method_and_parameter_list):
-            # Get correct pair based on index
-            chosen_pair = method_and_parameter_list[selected_index]
+            # Get correct entry based on index
+            chosen_entry = method_and_parameter_list[selected_index]
 
             # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+            method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
             # Check if the parameter already exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, method_and_param_list=chosen_entry, 
                 parameter_name=param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=True
             )
             if not is_param_exist:
@@ -844,10 +1400,12 @@ class UMLModel:
                 return False
 
             # If not a duplicate, delete the parameter from the method's parameter list
-            param_list.remove(chosen_parameter)
+            self.__class_list[class_name]._remove_parameter(selected_index, chosen_parameter)
+            self.__type_registry._unregister(chosen_parameter)
 
             # Update main data and notify observers #
-            self._update_main_data_for_every_action()
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             self._notify_observers(event_type=InterfaceOptions.DELETE_PARAM.value,
                                    data={"class_name": class_name, "method_name": method._get_name(), 
                                          "param_type": chosen_parameter._get_type() , "param_name": param_name}, is_undo_or_redo=is_undo_or_redo)
@@ -889,13 +1447,13 @@ class UMLModel:
 
         # Ensure the selected index is valid #
         if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
+            chosen_entry = method_and_parameter_list[selected_index]
 
             # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+            method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
             # Check if the parameter already exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, method_and_param_list=chosen_entry, 
                 parameter_name=param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=True
             )
             if not is_param_exist:
@@ -908,24 +1466,24 @@ class UMLModel:
             new_param_list = []
             for param in param_list:
                 if param._get_parameter_name() == param_name:
-                    new_param = self.create_parameter(param_name, new_type)
+                    new_param = self.create_parameter(new_type, param_name)
                     new_param_list.append(new_param)
                 else:
                     new_param_list.append(param)
             method_with_new_param = {method: new_param_list}
 
             # Check to see if the method without the parameter is a duplicate
-            is_method_valid_with_param = self._check_method_param_list(class_name, method_with_new_param)
+            is_method_valid_with_param = self._check_method_param_list(class_name, method_with_new_param, selected_index)
             if not is_method_valid_with_param:
                 return False
             
             # If not a duplicate, then change type
-            for param in param_list:
-                if param._get_parameter_name() == param_name:
-                    param._set_type(new_type)
+            self.__class_list[class_name]._set_parameter_type(selected_index, chosen_parameter, new_type)
+            self.__type_registry._update_type(chosen_parameter, old_param_type)
 
             # Update main data and notify observers #
-            self._update_main_data_for_every_action()
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             self._notify_observers(event_type=InterfaceOptions.EDIT_PARAM_TYPE.value,
                                    data={"class_name": class_name, "method_name": method._get_name(), "old_param_type": old_param_type , 
                                          "param_name": param_name, "new_param_type": new_type}, is_undo_or_redo=is_undo_or_redo)
@@ -968,20 +1526,20 @@ class UMLModel:
 
         # Ensure the selected index is valid #
         if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
+            chosen_entry = method_and_parameter_list[selected_index]
             
             # Extract the selected method and its parameter list #
-            method, param_list = next(iter(chosen_pair.items()))
+            method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
             method_name = method._get_name()
             
             # Check if the current parameter exists in the method #
             is_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, method_and_param_list=chosen_entry, 
                 parameter_name=current_param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=True
             )
             # Check if the new parameter name already exists
             is_new_param_exist = self._validate_entities(
-                class_name=class_name, method_and_param_list=chosen_pair, 
+                class_name=class_name, method_and_param_list=chosen_entry, 
                 parameter_name=new_param_name, class_should_exist=True, method_should_exist=True, parameter_should_exist=False
             )
             if not is_param_exist or not is_new_param_exist:
@@ -991,7 +1549,8 @@ class UMLModel:
             # Rename the parameter
             chosen_parameter._set_parameter_name(new_param_name)
             # Update main data and notify observers
-            self._update_main_data_for_every_action()
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             self._notify_observers(event_type=InterfaceOptions.RENAME_PARAM.value, data={"class_name": class_name, "method_name": method_name, 
                                                                                          "old_param_name": current_param_name, "new_param_name": new_param_name}, is_undo_or_redo=is_undo_or_redo)
             return True
@@ -1021,9 +1580,7 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         if 0 <= selected_index < len(method_and_parameter_list):
-            if len(new_param_name_list) == 0:
-                return True
-            # Prepare new parameter list
+            # Prepare new parameter list, an empty list removes every parameter
             new_params_obj_list = []
             for param in new_param_name_list:
                 # Split param into type and name
@@ -1039,19 +1596,21 @@ class UMLModel:
                 new_param = self.create_parameter(param_type, param_name)
                 new_params_obj_list.append(new_param)
                 
-            chosen_pair = method_and_parameter_list[selected_index]
+            chosen_entry = method_and_parameter_list[selected_index]
             # Extract the selected method and its parameter list #
-            method, params_list = next(iter(chosen_pair.items()))
+            method, params_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
             # Check to see if the method with the new parameter is a duplicate
-            is_method_valid_with_param = self._check_method_param_list(class_name, {method: new_params_obj_list})
+            is_method_valid_with_param = self._check_method_param_list(class_name, {method: new_params_obj_list}, selected_index)
             if not is_method_valid_with_param:
                 return False
-            params_list.clear()
-        
+            for param in params_list:
+                self.__type_registry._unregister(param)
+            self.__class_list[class_name]._replace_parameter_list(selected_index, new_params_obj_list)
             for param in new_params_obj_list:
-                params_list.append(param)
+                self.__type_registry._register(param, self.__class_list[class_name])
             
-            self._update_main_data_for_every_action()
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             self._notify_observers(
                 event_type=InterfaceOptions.REPLACE_PARAM.value,
                 data={"class_name": class_name, "method_name": method._get_name(), "new_list": new_params_obj_list}, is_undo_or_redo=is_undo_or_redo
@@ -1082,9 +1641,9 @@ class UMLModel:
         selected_index = int(method_num) - 1
 
         if 0 <= selected_index < len(method_and_parameter_list):
-            chosen_pair = method_and_parameter_list[selected_index]
+            chosen_entry = method_and_parameter_list[selected_index]
             # Extract the selected method and its parameter list #
-            method, params_list = next(iter(chosen_pair.items()))
+            method, params_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
             param_string_list = []
             for param in params_list:
                 param_format = param._get_type() + " " + param._get_parameter_name()
@@ -1103,7 +1662,8 @@ class UMLModel:
         method_and_parameter_list = self._get_method_and_parameter_list_of_chosen_class(class_name)
         method_and_parameter_list[method_name] = new_param_list
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._mark_class_dirty(class_name)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.REPLACE_PARAM.value, data={"class_name": class_name, "method_name": method_name, "new_list": new_param_list})
         return True
         
@@ -1155,18 +1715,18 @@ class UMLModel:
                     return False
         # Create a new relationship and add it to the relationship list
         new_relationship = self.create_relationship(source_class_name, destination_class_name, rel_type)
-        self.__relationship_list.append(new_relationship)
+        self.__insert_relationship(new_relationship)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self.__add_relationship_entry(new_relationship)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.ADD_REL.value, data={"source": source_class_name, "dest": destination_class_name, 
                                                                                 "type": rel_type}, is_loading=is_loading, is_undo_or_redo=is_undo_or_redo)
         return True
     
     def _get_rel_type(self, source_class_name: str, destination_class_name: str):
-        for relationship in self.__relationship_list:
-            if (relationship._get_source_class() == source_class_name and
-                relationship._get_destination_class() == destination_class_name):
-                return relationship._get_type()
+        relationship = self.__relationship_index.get((source_class_name, destination_class_name))
+        if relationship is not None:
+            return relationship._get_type()
         return None
         
     # Delete relationship #
@@ -1194,9 +1754,10 @@ class UMLModel:
             return False
         # Delete the relationship
         current_relationship = self._get_chosen_relationship(source_class_name, destination_class_name)
-        self.__relationship_list.remove(current_relationship)
+        self.__discard_relationship(current_relationship)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self.__remove_relationship_entry(current_relationship)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.DELETE_REL.value, data={"source": source_class_name, "dest": destination_class_name}, is_undo_or_redo=is_undo_or_redo)
         return True
         
@@ -1232,7 +1793,8 @@ class UMLModel:
             return False
         current_relationship._set_type(new_type)
         # Update main data and notify observers
-        self._update_main_data_for_every_action()
+        self._mark_relationship_dirty(current_relationship)
+        self._sync_main_data()
         self._notify_observers(event_type=InterfaceOptions.EDIT_REL_TYPE.value, data={"source": source_class_name, "dest": destination_class_name, "new_type": new_type}, is_undo_or_redo=is_undo_or_redo)
         return True
          
@@ -1311,13 +1873,10 @@ class UMLModel:
         Parameters:
             class_name (str): The name of the class to clean relationships for.
         """
-        # Create a new list that excludes relationships with dest or source equal to class_name
-        relationship_list = self.__relationship_list
-        relationship_list[:] = [
-            relationship
-            for relationship in relationship_list
-            if relationship._get_source_class() != class_name and relationship._get_destination_class() != class_name
-        ]
+        # Only the relationships incident to the class are touched
+        for relationship in self.__get_incident_relationship_list(class_name):
+            self.__remove_relationship_entry(relationship)
+            self.__discard_relationship(relationship)
     
     # Update source/destination class name when we rename a class name #
     def __update_name_in_relationship(self, current_name: str, new_name: str):
@@ -1328,19 +1887,110 @@ class UMLModel:
             current_name (str): The current class name.
             new_name (str): The new class name to update in relationships.
         """
-        # Get relationship list
-        relationship_list = self.__relationship_list
-        # Loop through the relationship list
-        for each_relationship in relationship_list:
-            source_name = each_relationship._get_source_class()
-            destination_name = each_relationship._get_destination_class()
-            if source_name == current_name:
+        # Only the relationships incident to the class are touched, their order is kept
+        incident_relationship_list = self.__get_incident_relationship_list(current_name)
+        for each_relationship in incident_relationship_list:
+            self.__unindex_relationship(each_relationship)
+        for each_relationship in incident_relationship_list:
+            if each_relationship._get_source_class() == current_name:
                 each_relationship._set_source_class(new_name)
-            if destination_name == current_name:
+            if each_relationship._get_destination_class() == current_name:
                 each_relationship._set_destination_class(new_name)
+            self.__index_relationship(each_relationship)
+            self._mark_relationship_dirty(each_relationship)
+
+    # Add a relationship to the relationship store #
+    def __insert_relationship(self, relationship: Relationship):
+        """
+        Appends a relationship to the ordered relationship list and indexes it by (source, destination).
+
+        Parameters:
+            relationship (Relationship): The relationship to add.
+        """
+        self.__relationship_list[relationship] = None
+        self.__index_relationship(relationship)
+
+    # Remove a relationship from the relationship store #
+    def __discard_relationship(self, relationship: Relationship):
+        """
+        Removes a relationship from the ordered relationship list and from the index.
+
+        Parameters:
+            relationship (Relationship): The relationship to remove.
+        """
+        self.__relationship_list.pop(relationship, None)
+        self.__unindex_relationship(relationship)
+
+    # Index a relationship by its current source and destination #
+    def __index_relationship(self, relationship: Relationship):
+        """
+        Registers a relationship in the (source, destination) index and in the outgoing/incoming sets.
+
+        Parameters:
+            relationship (Relationship): The relationship to index.
+        """
+        source_name = relationship._get_source_class()
+        destination_name = relationship._get_destination_class()
+        self.__relationship_index[(source_name, destination_name)] = relationship
+        self.__outgoing_relationship.setdefault(source_name, set()).add(destination_name)
+        self.__incoming_relationship.setdefault(destination_name, set()).add(source_name)
+
+    # Drop a relationship from the index #
+    def __unindex_relationship(self, relationship: Relationship):
+        """
+        Removes a relationship from the (source, destination) index and from the outgoing/incoming sets.
+
+        Parameters:
+            relationship (Relationship): The relationship to remove from the index.
+        """
+        source_name = relationship._get_source_class()
+        destination_name = relationship._get_destination_class()
+        self.__relationship_index.pop((source_name, destination_name), None)
+        destination_set = self.__outgoing_relationship.get(source_name)
+        if destination_set is not None:
+            destination_set.discard(destination_name)
+            if not destination_set:
+                del self.__outgoing_relationship[source_name]
+        source_set = self.__incoming_relationship.get(destination_name)
+        if source_set is not None:
+            source_set.discard(source_name)
+            if not source_set:
+                del self.__incoming_relationship[destination_name]
+
+    # Get every relationship where the class is the source or the destination #
+    def __get_incident_relationship_list(self, class_name: str) -> List[Relationship]:
+        """
+        Retrieves the relationships where the class is either the source or the destination, in O(incident edges).
+
+        Parameters:
+            class_name (str): The name of the class.
+
+        Returns:
+            List[Relationship]: The incident relationships, each listed once.
+        """
+        incident_relationship_list = [self.__relationship_index[(class_name, destination_name)]
+                                      for destination_name in self.__outgoing_relationship.get(class_name, ())]
+        for source_name in self.__incoming_relationship.get(class_name, ()):
+            # A self relationship was already collected as an outgoing one
+            if source_name != class_name:
+                incident_relationship_list.append(self.__relationship_index[(source_name, class_name)])
+        return incident_relationship_list
+                
+    # Get the relationships a class takes part in #
+    def _get_class_relationship_list(self, class_name: str) -> List[Relationship]:
+        """
+        Retrieves the relationships where the class is either the source or the destination.
+
+        Parameters:
+            class_name (str): The name of the class.
+
+        Returns:
+            List[Relationship]: The incident relationships, each listed once.
+        """
+        return self.__get_incident_relationship_list(class_name)
                 
     # Get method and parameter list of a chosen class #
-    def _get_data_from_chosen_class(self, class_name: str, is_field_list: bool=None, is_method_and_param_list: bool=None) -> Dict[Method, List[Parameter]] | None:
+    def _get_data_from_chosen_class(self, class_name: str, is_field_list: bool=None, is_method_and_param_list: bool=None) -> List[Field] | List[MethodEntry] | None:
         """
         Retrieves the method and parameter list of a specified class.
 
@@ -1379,21 +2029,11 @@ class UMLModel:
         is_class_exist = self.__validate_class_existence(class_name, should_exist=True)
         if not is_class_exist:
             return
-        # Select the correct list based on whether it's a field or method
+        # Look the name up in the class's field or method name index
+        chosen_class = self.__class_list[class_name]
         if is_field:
-            field_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
-            for field in field_list:
-                if field._get_name() == input_name:
-                    return True
-        else:
-            method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
-            for each_element in method_and_parameter_list:
-                for method in each_element:
-                    if method._get_name() == input_name:
-                        return True
-        # Loop through the list to find the field or method
-        
-        return False
+            return chosen_class._get_field(input_name) is not None
+        return len(chosen_class._get_method_list(input_name)) > 0
     
     # Validate field existence based on whether it should exist or not #
     def __validate_field_existence(self, class_name: str, field_name: str, should_exist: bool) -> bool:
@@ -1487,15 +2127,15 @@ class UMLModel:
         Returns:
             Field | Method | None: The field or method object, or None if not found.
         """
-        # Select the correct list based on whether it's a field or method
+        # Look the name up in the class's field or method name index
+        chosen_class = self.__class_list.get(class_name)
+        if chosen_class is None:
+            return None
         if is_field:
-            general_list = self._get_data_from_chosen_class(class_name, is_field_list=True)
-        else:
-            general_list = self._get_data_from_chosen_class(class_name, is_method_list=True)
-        for element in general_list:
-            if element._get_name() == input_name:
-                return element
-        return None
+            return chosen_class._get_field(input_name)
+        # Overloads share a name, return the first one that was added
+        method_list = chosen_class._get_method_list(input_name)
+        return method_list[0] if method_list else None
     
     ## PARAMETER RELATED ##
     
@@ -1555,9 +2195,9 @@ class UMLModel:
             Parameter: The parameter object, or None if not found.
         """
         method_and_parameter_list = self._get_data_from_chosen_class(class_name, is_method_and_param_list=True)
-        chosen_pair = method_and_parameter_list[method_index]
+        chosen_entry = method_and_parameter_list[method_index]
         # Extract the selected method and its parameter list #
-        method, param_list = next(iter(chosen_pair.items()))
+        method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
 
         for each_parameter in param_list:
             if each_parameter._get_parameter_name() == parameter_name:
@@ -1611,11 +2251,7 @@ class UMLModel:
         Returns:
             bool: True if the relationship exists, False otherwise.
         """
-        relationship_list = self.__relationship_list
-        for each_relationship in relationship_list:
-            if each_relationship._get_source_class() == source_class_name and each_relationship._get_destination_class() == destination_class_name:
-                return True
-        return False
+        return (source_class_name, destination_class_name) in self.__relationship_index
     
     # Get the chosen relationship #
     def _get_chosen_relationship(self, source_class_name: str, destination_class_name: str) -> Relationship:
@@ -1629,11 +2265,7 @@ class UMLModel:
         Returns:
             Relationship: The relationship object, or None if not found.
         """
-        relationship_list = self.__relationship_list
-        for each_relationship in relationship_list:
-            if each_relationship._get_source_class() == source_class_name and each_relationship._get_destination_class() == destination_class_name:
-                return each_relationship
-        return None
+        return self.__relationship_index.get((source_class_name, destination_class_name))
     
     # Get the relationship type between two classes #
     def _get_chosen_relationship_type(self, source_class_name: str, destination_class_name: str) -> str | None:
@@ -1693,22 +2325,13 @@ class UMLModel:
         # Get method and parameter list for the specified class
         method_and_parameter_list = class_object._get_method_and_parameters_list()
         
-        for each_element in method_and_parameter_list:
-            for each_method in each_element:
-                # Convert method to JSON format
-                method_json_format = each_method._convert_to_json_method()
-                # Get the parameters of the current method
-                parameter_list = each_element[each_method]
-                parameter_json_list = []
-                for parameter in parameter_list:
-                    parameter_json_list.append(parameter._convert_to_json_parameter())
-                method_json_format["params"] = parameter_json_list
-                # Convert each parameter to JSON format
-                parameter_format_list: List[Dict] = []
-                for each_parameter in parameter_list:
-                    parameter_format_list.append(each_parameter._convert_to_json_parameter())
-                # Add method format to the method list format
-                method_list_format.append(method_json_format)
+        for each_entry in method_and_parameter_list:
+            # Convert method to JSON format
+            method_json_format = each_entry._get_method()._convert_to_json_method()
+            # Convert each parameter of the current method to JSON format
+            method_json_format["params"] = [parameter._convert_to_json_parameter() for parameter in each_entry._get_parameter_list()]
+            # Add method format to the method list format
+            method_list_format.append(method_json_format)
                         
         return method_list_format
     
@@ -1765,6 +2388,9 @@ class UMLModel:
         """
         Saves the current UML data to a JSON file, prompting the user for a file name or allowing them to select from 
         existing saved files. Data is saved in JSON format with the class and relationship data.
+
+        Returns:
+            str | None: The name of the saved file, or None if nothing was saved.
         """
         # Prompt the user for a file name to save
         self.__console.print("\n[bold yellow]Please provide a name for the file you'd like to save or choose file from the list to override.[/bold yellow]")
@@ -1793,6 +2419,7 @@ class UMLModel:
         # Save data to JSON file
         self.__storage_manager._save_data_to_json(user_input, main_data)
         self.__console.print(f"\n[bold green]Successfully saved data to [bold white]'{user_input}.json'![/bold white][/bold green]")
+        return user_input
 
     # Save for GUI #
     def _save_gui(self, file_name, full_path, class_name_list_from_gui):
@@ -1807,6 +2434,7 @@ class UMLModel:
         for class_name_gui, class_box in class_name_list_from_gui.items():
             if class_name_gui in self.__class_list:
                 self.__class_list[class_name_gui]._set_position(class_box.box_position["x"], class_box.box_position["y"])
+                self._mark_class_dirty(class_name_gui)
                 
         # Class and relationship data lists for storing in main data
         class_data_list = []
@@ -1823,15 +2451,17 @@ class UMLModel:
         self.__storage_manager._update_saved_list(saved_list)
         saved_list_gui = self.__storage_manager._get_saved_list_gui()
         self.__storage_manager._update_saved_list_gui(saved_list_gui)
-        # Save data to JSON via the GUI
-        self.__storage_manager._save_data_to_json(file_name, main_data)
-        self.__storage_manager._save_data_to_json_gui(full_path, main_data)
+        # Save data to JSON via the GUI, the root copy is written from the same serialization
+        self.__storage_manager._save_data_to_json_gui(full_path, main_data, file_name=file_name)
 
     # Load data #
     def _load(self):
         """
         Loads UML data from a saved JSON file, prompting the user for a file name or displaying a list of saved files.
         The data is loaded and the program's state is updated.
+
+        Returns:
+            str | None: The name of the loaded file, or None if nothing was loaded.
         """
         # Prompt the user for a file name to load
         self.__console.print("\n[bold yellow]Please provide a name for the file you'd like to load.[/bold yellow]")
@@ -1853,11 +2483,13 @@ class UMLModel:
         if not is_loading:
             self.__console.print(f"\n[bold red]File [bold white]'{user_input}.json'[/bold white] does not exist[/bold red]")
             return
-        # Load data from the file and update program state
-        main_data = self.__main_data = self.__storage_manager._load_data_from_json(user_input)
-        self.__update_data_members(main_data)
+        # Stream the file into the model, one class at a time
+        record_stream = self.__storage_manager._stream_data_from_json(user_input)
+        if record_stream is None or not self._bulk_load_stream(record_stream):
+            return
         self.__check_file_and_set_status(user_input)
         self.__console.print(f"\n[bold green]Successfully loaded data from [bold white]'{user_input}.json'[/bold white]![/bold green]")
+        return user_input
         
     def _load_gui(self, file_name: str, file_path: str, graphical_view: GUIView):
         """
@@ -1865,6 +2497,7 @@ class UMLModel:
         The data is loaded and the program's state is updated.
         """
         # Load data from the file and update program state
+        self.__save_full_savepoint()
         main_data = self.__main_data = self.__storage_manager._load_data_from_json_gui(file_path)
         is_file_exist_gui = self._check_saved_file_exist_gui(file_name)
         if not is_file_exist_gui:
@@ -1890,72 +2523,255 @@ class UMLModel:
         Returns:
             Dict: The updated main data dictionary containing class and relationship details.
         """
-        # Format relationships for JSON storage
-        relationship_data_list = self._get_relationship_format_list()
-        main_data = self.__main_data
         # Add the file name to the saved list if it is a new one
         self.__storage_manager._add_name_to_saved_file(user_input)
         if file_path is not None:
             self.__storage_manager._add_name_to_saved_file_gui(file_path)
-        # Format classes for JSON storage
-        for class_name in self.__class_list:
-            class_data_format = self._class_json_format(class_name)
-            class_data_list.append(class_data_format)
-        # Store formatted class and relationship data in main_data
-        main_data["classes"] = class_data_list
-        main_data["relationships"] = relationship_data_list
-        return main_data
+        # Main data is kept up to date after every action, only flush pending changes
+        self.__flush_main_data()
+        return self.__main_data
     
-    # Update UMLCoreManager data after loading a file #
-    def __update_data_members(self, main_data: Dict):
+    # Bulk load #
+    def _bulk_load_main_data(self, main_data: Dict) -> bool:
         """
-        Updates the internal data members (class and relationship) after loading from a JSON file.
+        Loads a whole diagram in one pass. Unlike replaying _add_class, _add_field, _add_method, _add_parameter
+        and _add_relationship for every element, the document is validated once, the UML objects are built
+        directly, main data is rebuilt once and observers receive a single 'load' notification.
 
         Parameters:
-            main_data (Dict): The data dictionary loaded from a JSON file.
+            main_data (Dict): The diagram in {"classes": [...], "relationships": [...]} format.
+
+        Returns:
+            bool: True if the diagram was loaded, False if the document is invalid (the model is left untouched).
         """
-        class_data = main_data["classes"]
-        relationship_data = main_data["relationships"]
-        # Reset the current storage before loading new data
+        if not self.__validate_main_data_format(main_data):
+            return False
+        record_stream = [("class", class_element) for class_element in main_data["classes"]]
+        record_stream += [("relationship", relationship_element) for relationship_element in main_data["relationships"]]
+        return self._bulk_load_stream(record_stream)
+
+    # Bulk load a diagram streamed one record at a time #
+    def _bulk_load_stream(self, record_stream: Iterable[Tuple[str, Dict]]) -> bool:
+        """
+        Loads a whole diagram from a stream of ("class", class_record) pairs followed by ("relationship", relationship_record)
+        pairs, as produced by UMLStorageManager._stream_data_from_json. Each class record is validated and built into
+        a class object as soon as it arrives and is not kept, so the document itself is never held in memory as a whole.
+        The model is only replaced once the whole stream is valid, then main data is rebuilt once and observers
+        receive a single 'load' notification.
+
+        Parameters:
+            record_stream (Iterable[Tuple[str, Dict]]): The class records, then the relationship records.
+
+        Returns:
+            bool: True if the diagram was loaded, False if the stream is invalid (the model is left untouched).
+        """
+        class_list: Dict[str, Class] = {}
+        relationship_key_list: Dict[Tuple[str, str], str] = {}
+        number_of_method = 0
+        try:
+            for record_kind, record in record_stream:
+                if record_kind == "class":
+                    if relationship_key_list:
+                        self.__console.print("\n[bold red]Invalid file format! Relationships must come after every class.[/bold red]")
+                        return False
+                    if not self.__validate_class_record(record, class_list):
+                        return False
+                    class_object = self.__build_class_from_record(record)
+                    class_list[class_object._get_class_name()] = class_object
+                    number_of_method += len(record["methods"])
+                else:
+                    if not self.__validate_relationship_record(record, class_list, relationship_key_list):
+                        return False
+                    relationship_key_list[(record["source"], record["destination"])] = record["type"]
+        except (KeyError, TypeError):
+            self.__console.print("\n[bold red]Invalid file format! A class, field, method, parameter or relationship entry is incomplete.[/bold red]")
+            return False
+        except ValueError:
+            # Raised by a streamed file that is not valid JSON
+            self.__console.print("\n[bold red]Invalid file format! The file is not a valid diagram document.[/bold red]")
+            return False
         self._reset_storage()
-        # Set the new main data
-        self.__main_data = main_data
-        # Extract and recreate class, fields, methods, and parameters from the loaded data
-        extracted_class_data = self._extract_class_data(class_data)
-        for each_pair in extracted_class_data:
-            for class_name, data in each_pair.items():
-                field_list = data["fields"]
-                method_list = data["method_list"]
+        for class_name, class_object in class_list.items():
+            self.__class_list[class_name] = class_object
+            self.__type_registry._register_class(class_object)
+        for (source_class_name, destination_class_name), rel_type in relationship_key_list.items():
+            self.__insert_relationship(self.create_relationship(source_class_name, destination_class_name, rel_type))
+        self._update_main_data_for_every_action()
+        self._current_number_of_method += number_of_method
+        # Notify observers once for the whole diagram
+        self._notify_observers(event_type=InterfaceOptions.LOAD.value, data={"class_count": len(self.__class_list),
+                                                                            "relationship_count": len(self.__relationship_list)}, is_loading=True)
+        return True
 
-                # Check for position data in the loaded class information
-                position = data.get("position")
+    # Replace the whole model with a validated diagram #
+    def __rebuild_from_main_data(self, main_data: Dict) -> int:
+        """
+        Resets the storage, builds every class and relationship of a validated diagram directly and
+        rebuilds main data once. Observers are not notified.
 
-                # Add classes, fields, methods, and parameters to the program state
-                self._add_class(class_name, is_loading=True)
+        Parameters:
+            main_data (Dict): The diagram in {"classes": [...], "relationships": [...]} format.
 
-                if position:
-                    self.__class_list[class_name]._set_position(position["x"], position["y"])
+        Returns:
+            int: The number of methods in the diagram.
+        """
+        self._reset_storage()
+        number_of_method = 0
+        for class_element in main_data["classes"]:
+            class_object = self.__build_class_from_record(class_element)
+            self.__class_list[class_object._get_class_name()] = class_object
+            self.__type_registry._register_class(class_object)
+            number_of_method += len(class_element["methods"])
+        for relationship_element in main_data["relationships"]:
+            new_relationship = self.create_relationship(relationship_element["source"], relationship_element["destination"], relationship_element["type"])
+            self.__insert_relationship(new_relationship)
+        self._update_main_data_for_every_action()
+        return number_of_method
 
-                for each_field in field_list:
-                    field_name = each_field["name"]
-                    field_type = each_field["type"]
-                    self._add_field(class_name, field_type, field_name, is_loading=True)
-                method_num = "0"
-                i = 0
-                for each_element in method_list:
-                    i = i + 1
-                    method_num = f"{i}"
-                    method_name = each_element["name"]
-                    return_type = each_element["return_type"]
-                    parameter_list = each_element["params"]
-                    self._add_method(class_name, return_type, method_name, is_loading=True)
-                    for param in parameter_list:
-                        param_type = param["type"]
-                        param_name = param["name"]
-                        self._add_parameter(class_name, method_num, param_type, param_name, is_loading=True)
-        # Recreate relationships from the loaded data
-        for each_dictionary in relationship_data:
-            self._add_relationship(each_dictionary["source"], each_dictionary["destination"], each_dictionary["type"], is_loading=True, is_gui=False)
+    # Build a class object from one class record #
+    def __build_class_from_record(self, class_element: Dict) -> Class:
+        """
+        Builds a UMLClass with its fields, methods and parameters from a validated class record.
+
+        Parameters:
+            class_element (Dict): One entry of main_data["classes"].
+
+        Returns:
+            Class: The fully populated class object.
+        """
+        position = class_element.get("position")
+        if position:
+            class_object = Class(class_element["name"], position["x"], position["y"])
+        else:
+            class_object = self.create_class(class_element["name"])
+        for each_field in class_element["fields"]:
+            class_object._add_field(self.create_field(each_field["type"], each_field["name"]))
+        for each_method in class_element["methods"]:
+            new_method = self.create_method(each_method["return_type"], each_method["name"])
+            param_list = [self.create_parameter(param["type"], param["name"]) for param in each_method["params"]]
+            class_object._add_method(new_method, param_list)
+        return class_object
+
+    # Validate a whole diagram before loading it #
+    def _validate_main_data(self, main_data: Dict) -> bool:
+        """
+        Validates a whole diagram document in a single pass: input format of every name and type, duplicate
+        classes, fields, parameters and method signatures, relationship endpoints, types and duplicates.
+
+        Parameters:
+            main_data (Dict): The diagram in {"classes": [...], "relationships": [...]} format.
+
+        Returns:
+            bool: True if the whole document can be loaded, False otherwise.
+        """
+        if not self.__validate_main_data_format(main_data):
+            return False
+        try:
+            class_name_set = set()
+            for class_element in main_data["classes"]:
+                if not self.__validate_class_record(class_element, class_name_set):
+                    return False
+                class_name_set.add(class_element["name"])
+            relationship_key_set = set()
+            for relationship_element in main_data["relationships"]:
+                if not self.__validate_relationship_record(relationship_element, class_name_set, relationship_key_set):
+                    return False
+                relationship_key_set.add((relationship_element["source"], relationship_element["destination"]))
+        except (KeyError, TypeError):
+            self.__console.print("\n[bold red]Invalid file format! A class, field, method, parameter or relationship entry is incomplete.[/bold red]")
+            return False
+        return True
+
+    # Check the top level of a diagram document #
+    def __validate_main_data_format(self, main_data: Dict) -> bool:
+        if not isinstance(main_data, dict) or not isinstance(main_data.get("classes"), list) or not isinstance(main_data.get("relationships"), list):
+            self.__console.print("\n[bold red]Invalid file format! Expected 'classes' and 'relationships' lists.[/bold red]")
+            return False
+        return True
+
+    # Validate one class record #
+    def __validate_class_record(self, class_element: Dict, class_name_set: Set[str] | Dict[str, Class]) -> bool:
+        """
+        Validates one class record: its name, fields, methods, parameters and position.
+
+        Parameters:
+            class_element (Dict): One entry of main_data["classes"].
+            class_name_set (Set[str] | Dict[str, Class]): The names of the classes read before it.
+
+        Returns:
+            bool: True if the class can be loaded, False otherwise.
+
+        Raises:
+            KeyError, TypeError: If the record is incomplete.
+        """
+        class_name = class_element["name"]
+        if not self._is_valid_input(class_name=class_name):
+            return False
+        if class_name in class_name_set:
+            self.__console.print(f"\n[bold red]Class [bold white]'{class_name}'[/bold white] has already existed![/bold red]")
+            return False
+        field_name_set = set()
+        for each_field in class_element["fields"]:
+            if not self._is_valid_input(field_name=each_field["name"], field_type=each_field["type"]):
+                return False
+            if each_field["name"] in field_name_set:
+                self.__console.print(f"\n[bold red]Field [bold white]'{each_field['name']}'[/bold white] has already existed in class [bold white]'{class_name}'[/bold white]![/bold red]")
+                return False
+            field_name_set.add(each_field["name"])
+        signature_set = set()
+        for each_method in class_element["methods"]:
+            if not self._is_valid_input(method_name=each_method["name"], method_type=each_method["return_type"]):
+                return False
+            param_name_set = set()
+            for param in each_method["params"]:
+                if not self._is_valid_input(parameter_name=param["name"], parameter_type=param["type"]):
+                    return False
+                if param["name"] in param_name_set:
+                    self.__console.print(f"\n[bold red]Parameter [bold white]'{param['name']}'[/bold white] has already existed![/bold red]")
+                    return False
+                param_name_set.add(param["name"])
+            signature = (each_method["name"], tuple(param["type"] for param in each_method["params"]))
+            if signature in signature_set:
+                self.__console.print(f"\n[bold red]New method [bold white]'{each_method['name']}'[/bold white] "
+                                     f"has the same parameter list signature as an existing method in class [bold white]'{class_name}'[/bold white]![bold red]")
+                return False
+            signature_set.add(signature)
+        position = class_element.get("position")
+        if position and ("x" not in position or "y" not in position):
+            self.__console.print(f"\n[bold red]Invalid position for class [bold white]'{class_name}'[/bold white]![/bold red]")
+            return False
+        return True
+
+    # Validate one relationship record #
+    def __validate_relationship_record(self, relationship_element: Dict, class_name_set: Set[str] | Dict[str, Class],
+                                       relationship_key_set: Set[Tuple[str, str]] | Dict[Tuple[str, str], str]) -> bool:
+        """
+        Validates one relationship record against the classes and relationships read before it.
+
+        Parameters:
+            relationship_element (Dict): One entry of main_data["relationships"].
+            class_name_set (Set[str] | Dict[str, Class]): The names of every class of the diagram.
+            relationship_key_set (Set[Tuple[str, str]] | Dict[Tuple[str, str], str]): The (source, destination) pairs read before it.
+
+        Returns:
+            bool: True if the relationship can be loaded, False otherwise.
+
+        Raises:
+            KeyError, TypeError: If the record is incomplete.
+        """
+        source_class_name = relationship_element["source"]
+        destination_class_name = relationship_element["destination"]
+        rel_type = relationship_element["type"]
+        if not self._is_valid_input(source_class=source_class_name, destination_class=destination_class_name, rel_type=rel_type):
+            return False
+        for class_name in (source_class_name, destination_class_name):
+            if class_name not in class_name_set:
+                self.__console.print(f"\n[bold red]Class [bold white]'{class_name}'[/bold white] does not exist![/bold red]")
+                return False
+        if (source_class_name, destination_class_name) in relationship_key_set:
+            self.__console.print(f"\n[bold red]Relationship between class [bold white]'{source_class_name}'[/bold white] and class [bold white]'{destination_class_name}'[/bold white] already exists![/bold red]")
+            return False
+        return self.__validate_type_existence(rel_type, should_exist=True)
             
     def __update_data_members_gui(self, main_data: Dict, graphical_view: GUIView):
         """
@@ -1970,7 +2786,7 @@ class UMLModel:
         # Reset the current storage before loading new data
         self._reset_storage()
         # Set the new main data
-        self.__main_data = main_data
+        self._set_main_data(main_data)
         # Extract and recreate class, fields, methods, and parameters from the loaded data
         extracted_class_data = self._extract_class_data(class_data)
         for each_pair in extracted_class_data:
@@ -2284,9 +3100,19 @@ class UMLModel:
         """
         Resets the entire storage by clearing all class data, relationships, and the main data dictionary.
         """
+        self.__save_full_savepoint()
         self.__class_list: Dict[str, Class] = {}
-        self.__relationship_list: List = []
+        self.__relationship_list: Dict[Relationship, None] = {}
+        self.__type_registry = TypeRegistry()
+        self.__relationship_index = {}
+        self.__outgoing_relationship = {}
+        self.__incoming_relationship = {}
         self.__main_data: Dict = {"classes": [], "relationships" : []}
+        self.__class_entry_list = {}
+        self.__relationship_entry_list = {}
+        self.__dirty_class_set = set()
+        self.__dirty_relationship_set = set()
+        self.__is_main_data_stale = False
     
     #################################################################
     ### UTILITY FUNCTIONS ###
@@ -2312,8 +3138,13 @@ class UMLModel:
     # Update main data for every action #
     def _update_main_data_for_every_action(self, is_undo_or_redo: bool=None):
         """
-        Updates the main data by fetching and formatting all classes and relationships, ensuring the state is kept up to date after every change.
+        Rebuilds the main data from scratch by fetching and formatting all classes and relationships.
+
+        This is O(whole diagram). Regular edits go through _sync_main_data, which only re-serializes the
+        entries that changed; the full rebuild is kept for stale main data and for verification.
         """
+        # Every entry is replaced, open transactions can no longer restore them one by one
+        self.__save_full_savepoint()
         class_data_list = []
         relationship_data_list = self._get_relationship_format_list()
         main_data = self.__main_data
@@ -2321,8 +3152,189 @@ class UMLModel:
         for class_name in self.__class_list:
             class_data_format = self._class_json_format(class_name)
             class_data_list.append(class_data_format)
-            main_data["classes"] = class_data_list
+        main_data["classes"] = class_data_list
         main_data["relationships"] = relationship_data_list
+        # Remember which entry belongs to which class/relationship for the next incremental update
+        self.__class_entry_list = dict(zip(self.__class_list, class_data_list))
+        self.__relationship_entry_list = dict(zip(self.__relationship_list, relationship_data_list))
+        self.__dirty_class_set = set()
+        self.__dirty_relationship_set = set()
+        self.__is_main_data_stale = False
+
+    # Mark a class whose fields, methods or position changed #
+    def _mark_class_dirty(self, class_name: str):
+        """
+        Marks a class so that its main data entry is re-serialized on the next _sync_main_data call.
+
+        Parameters:
+            class_name (str): The name of the class that changed.
+        """
+        if self.__savepoint_list:
+            self.__record_class(class_name)
+        self.__dirty_class_set.add(class_name)
+
+    # Mark a relationship whose source, destination or type changed #
+    def _mark_relationship_dirty(self, relationship: Relationship):
+        """
+        Marks a relationship so that its main data entry is re-serialized on the next _sync_main_data call.
+
+        Parameters:
+            relationship (Relationship): The relationship object that changed.
+        """
+        if self.__savepoint_list:
+            self.__record_relationship(relationship)
+        self.__dirty_relationship_set.add(relationship)
+
+    # Append the entry of a newly inserted class #
+    def __add_class_entry(self, class_name: str):
+        """
+        Appends the main data entry for a class that was just inserted into the class list.
+        Classes are appended in the same order as the class list, so the result matches a full rebuild.
+
+        Parameters:
+            class_name (str): The name of the new class.
+        """
+        if self.__savepoint_list:
+            self.__record_class(class_name)
+        if self.__is_main_data_stale:
+            return
+        class_entry = self._class_json_format(class_name)
+        self.__main_data["classes"].append(class_entry)
+        self.__class_entry_list[class_name] = class_entry
+        self.__dirty_class_set.discard(class_name)
+
+    # Remove the entry of a deleted class #
+    def __remove_class_entry(self, class_name: str):
+        """
+        Removes the main data entry of a class that is no longer in the class list.
+
+        Parameters:
+            class_name (str): The name of the removed class.
+        """
+        if self.__savepoint_list:
+            self.__record_class(class_name, is_removal=True)
+        self.__dirty_class_set.discard(class_name)
+        class_entry = self.__class_entry_list.pop(class_name, None)
+        if self.__is_main_data_stale or class_entry is None:
+            return
+        self.__remove_entry(self.__main_data["classes"], class_entry)
+
+    # Append the entry of a newly created relationship #
+    def __add_relationship_entry(self, relationship: Relationship):
+        """
+        Appends the main data entry for a relationship that was just added to the relationship list.
+
+        Parameters:
+            relationship (Relationship): The new relationship object.
+        """
+        if self.__savepoint_list:
+            self.__record_relationship(relationship)
+        if self.__is_main_data_stale:
+            return
+        relationship_entry = relationship._convert_to_json_relationship()
+        self.__main_data["relationships"].append(relationship_entry)
+        self.__relationship_entry_list[relationship] = relationship_entry
+
+    # Remove the entry of a deleted relationship #
+    def __remove_relationship_entry(self, relationship: Relationship):
+        """
+        Removes the main data entry of a relationship that is no longer in the relationship list.
+
+        Parameters:
+            relationship (Relationship): The removed relationship object.
+        """
+        if self.__savepoint_list:
+            self.__record_relationship(relationship, is_removal=True)
+        self.__dirty_relationship_set.discard(relationship)
+        relationship_entry = self.__relationship_entry_list.pop(relationship, None)
+        if self.__is_main_data_stale or relationship_entry is None:
+            return
+        self.__remove_entry(self.__main_data["relationships"], relationship_entry)
+
+    # Remove an entry from a main data list by identity #
+    @staticmethod
+    def __remove_entry(entry_list: List[Dict], entry: Dict):
+        """
+        Removes the given entry object from a main data list. list.remove compares whole dicts,
+        which walks every field of every entry before the match, comparing by identity does not.
+        Recent entries are the most likely to be removed (undo), so the search starts at the end.
+
+        Parameters:
+            entry_list (List[Dict]): The "classes" or "relationships" list of the main data.
+            entry (Dict): The entry to remove, it must be in the list.
+        """
+        for index in range(len(entry_list) - 1, -1, -1):
+            if entry_list[index] is entry:
+                del entry_list[index]
+                return
+
+    # Bring main data up to date after an action #
+    def _sync_main_data(self):
+        """
+        Brings the main data up to date by re-serializing only the classes and relationships marked as dirty.
+        Entries are patched in place, so the cost of an edit does not depend on the size of the diagram.
+        Falls back to a full rebuild when the main data was replaced from outside (e.g. after loading a file).
+        Inside a transaction nothing happens: the dirty entries are synced once when the transaction commits.
+        """
+        if self.__savepoint_list:
+            return
+        self.__flush_main_data()
+
+    # Re-serialize the dirty entries now, even inside a transaction #
+    def __flush_main_data(self):
+        """
+        Syncs the dirty main data entries regardless of open transactions. Used by readers of main data
+        and when a transaction commits.
+        """
+        if self.__is_main_data_stale:
+            self._update_main_data_for_every_action()
+            return
+        for class_name in self.__dirty_class_set:
+            class_entry = self.__class_entry_list.get(class_name)
+            if class_entry is None or class_name not in self.__class_list:
+                continue
+            new_class_entry = self._class_json_format(class_name)
+            class_entry.clear()
+            class_entry.update(new_class_entry)
+        for relationship in self.__dirty_relationship_set:
+            relationship_entry = self.__relationship_entry_list.get(relationship)
+            if relationship_entry is None:
+                continue
+            relationship_entry.clear()
+            relationship_entry.update(relationship._convert_to_json_relationship())
+        self.__dirty_class_set = set()
+        self.__dirty_relationship_set = set()
+        if self.__is_verifying_main_data:
+            self._check_main_data_consistency()
+
+    # Turn verification of incremental updates on or off #
+    def _set_main_data_verification(self, is_enabled: bool):
+        """
+        Enables or disables verification mode. When enabled, every _sync_main_data call compares the
+        incrementally maintained main data against a full rebuild.
+
+        Parameters:
+            is_enabled (bool): True to verify after every sync, False to turn verification off.
+        """
+        self.__is_verifying_main_data = is_enabled
+
+    # Compare incremental main data against a full rebuild #
+    def _check_main_data_consistency(self) -> bool:
+        """
+        Compares the current main data against a freshly built one. If they differ, an error is printed
+        and the main data is replaced by the full rebuild.
+
+        Returns:
+            bool: True if the incremental main data matches the full rebuild, False otherwise.
+        """
+        expected_class_list = [self._class_json_format(class_name) for class_name in self.__class_list]
+        expected_relationship_list = self._get_relationship_format_list()
+        is_consistent = (self.__main_data["classes"] == expected_class_list and
+                         self.__main_data["relationships"] == expected_relationship_list)
+        if not is_consistent:
+            self.__console.print("\n[bold red]Main data is out of sync with the model, rebuilding it![/bold red]")
+            self._update_main_data_for_every_action()
+        return is_consistent
     
     # Validate entities (Class, Field, Method, Parameter) #
     def _validate_entities(
@@ -2454,14 +3466,17 @@ class UMLModel:
                 return False
             # Retrieve the field and update its type
             chosen_field = self._get_chosen_field_or_method(class_name, input_name, is_field=True)
+            old_type = chosen_field._get_type()
             chosen_field._set_type(new_type)
+            self.__type_registry._update_type(chosen_field, old_type)
             # Notify observers and update main data
             self._notify_observers(
                 event_type=InterfaceOptions.EDIT_FIELD_TYPE.value,
                 data={"class_name": class_name, "field_name": input_name, "new_type": new_type},
                 is_undo_or_redo=is_undo_or_redo
             )
-            self._update_main_data_for_every_action()
+            self._mark_class_dirty(class_name)
+            self._sync_main_data()
             return True
 
         elif is_method:
@@ -2482,12 +3497,15 @@ class UMLModel:
             # Convert method_num to index and validate
             selected_index = int(method_num) - 1
             if 0 <= selected_index < len(method_and_parameter_list):
-                chosen_pair = method_and_parameter_list[selected_index]
-                method, param_list = next(iter(chosen_pair.items()))
+                chosen_entry = method_and_parameter_list[selected_index]
+                method, param_list = chosen_entry._get_method(), chosen_entry._get_parameter_list()
                 # Update the method's return type
+                old_type = method._get_type()
                 method._set_type(new_type)
+                self.__type_registry._update_type(method, old_type)
                 # Notify observers and update main data
-                self._update_main_data_for_every_action()
+                self._mark_class_dirty(class_name)
+                self._sync_main_data()
                 self._notify_observers(
                     event_type=InterfaceOptions.EDIT_METHOD_TYPE.value,
                     data={"class_name": class_name, "method_name": method._get_name(), "new_type": new_type},
@@ -0,0 +1,96 @@
+###################################################################################################
+"""
+Module: UMLReadOnlyView
+This module defines read-only views over the nested dictionaries and lists that make up the model's
+main data. A view wraps the live data without copying it: reads always see the current state, and
+nested dictionaries and lists are wrapped on access, so no level of the structure can be modified
+through the view. Code that needs a private, mutable snapshot asks for one with _copy().
+"""
+###################################################################################################
+
+import copy
+from collections.abc import Mapping, Sequence
+from typing import Dict, List
+
+###################################################################################################
+
+# Wrap a nested value, leaving scalars untouched #
+def _read_only(value):
+    if isinstance(value, dict):
+        return UMLReadOnlyDict(value)
+    if isinstance(value, list):
+        return UMLReadOnlyList(value)
+    return value
+
+# Get the plain container behind a view #
+def _unwrap(value):
+    if isinstance(value, (UMLReadOnlyDict, UMLReadOnlyList)):
+        return value._UMLReadOnlyView__data
+    return value
+
+###################################################################################################
+
+class UMLReadOnlyView:
+
+    """
+    Base class of the read-only views. Holds the wrapped container and implements what dictionaries
+    and lists have in common.
+    """
+
+    __slots__ = ("__data",)
+
+    def __init__(self, data: Dict | List):
+        self.__data = data
+
+    def __len__(self) -> int:
+        return len(self.__data)
+
+    def __eq__(self, other) -> bool:
+        return self.__data == _unwrap(other)
+
+    __hash__ = None
+
+    def __repr__(self) -> str:
+        return f"{type(self).__name__}({self.__data!r})"
+
+    # Get a private deep copy of the wrapped data #
+    def _copy(self) -> Dict | List:
+        """
+        Returns:
+            Dict | List: A deep copy of the wrapped container, independent from the model.
+        """
+        return copy.deepcopy(self.__data)
+
+class UMLReadOnlyDict(UMLReadOnlyView, Mapping):
+
+    """
+    Read-only view of a dictionary.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, key):
+        return _read_only(self._UMLReadOnlyView__data[key])
+
+    def __iter__(self):
+        return iter(self._UMLReadOnlyView__data)
+
+    def __contains__(self, key) -> bool:
+        return key in self._UMLReadOnlyView__data
+
+class UMLReadOnlyList(UMLReadOnlyView, Sequence):
+
+    """
+    Read-only view of a list.
+    """
+
+    __slots__ = ()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return UMLReadOnlyList(self._UMLReadOnlyView__data[index])
+        return _read_only(self._UMLReadOnlyView__data[index])
+
+    def __iter__(self):
+        for value in self._UMLReadOnlyView__data:
+            yield _read_only(value)
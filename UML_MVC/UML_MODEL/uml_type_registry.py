@@ -0,0 +1,165 @@
+###################################################################################################
+"""
+Module: UMLTypeRegistry
+This module defines the UMLTypeRegistry class, which interns the type names used by fields, methods
+(return types) and parameters, and keeps a reverse index from each type name to the members that use it.
+Every member sharing a type points at the same string, and finding the usages of a type does not
+require walking every class.
+"""
+###################################################################################################
+
+from typing import Dict, List
+from UML_CORE.UML_CLASS.uml_class import UMLClass as Class
+from UML_CORE.UML_FIELD.uml_field import UMLField as Field
+from UML_CORE.UML_METHOD.uml_method import UMLMethod as Method
+from UML_CORE.UML_PARAMETER.uml_parameter import UMLParameter as Parameter
+
+###################################################################################################
+
+class UMLTypeRegistry:
+
+    """
+    UMLTypeRegistry stores one canonical string per distinct type name and, for each type name,
+    the members using it together with the class that owns them.
+    """
+
+    #################################################################
+
+    # UML type registry constructor #
+    def __init__(self):
+        """
+        Initializes an empty registry.
+        """
+        # type name -> canonical (interned) string
+        self.__type_name_table: Dict[str, str] = {}
+        # type name -> {member: owning class}, members are fields, methods and parameters
+        self.__usage_index: Dict[str, Dict[Field | Method | Parameter, Class]] = {}
+
+    #################################################################
+
+    # Get the canonical string for a type name #
+    def _intern(self, type_name: str) -> str:
+        """
+        Returns the canonical string for a type name, adding it to the table if it is new.
+
+        Parameters:
+            type_name (str): The type name to intern.
+
+        Returns:
+            str: The shared string instance for that type name.
+        """
+        return self.__type_name_table.setdefault(type_name, type_name)
+
+    # Register a member under its current type #
+    def _register(self, member: Field | Method | Parameter, owner: Class):
+        """
+        Interns the member's type and records the member as a usage of that type.
+
+        Parameters:
+            member (Field | Method | Parameter): The member to register.
+            owner (Class): The class that owns the member.
+        """
+        type_name = self._intern(member._get_type())
+        member._set_type(type_name)
+        self.__usage_index.setdefault(type_name, {})[member] = owner
+
+    # Remove a member from the registry #
+    def _unregister(self, member: Field | Method | Parameter, type_name: str = None):
+        """
+        Removes a member from the usages of its type. Type names with no usage left are dropped.
+
+        Parameters:
+            member (Field | Method | Parameter): The member to remove.
+            type_name (str): The type the member was registered under, if it has changed since.
+
+        Returns:
+            Class | None: The class that owned the member, or None if the member was not registered.
+        """
+        type_name = member._get_type() if type_name is None else type_name
+        usage_list = self.__usage_index.get(type_name)
+        if usage_list is None:
+            return None
+        owner = usage_list.pop(member, None)
+        if not usage_list:
+            self.__usage_index.pop(type_name)
+            self.__type_name_table.pop(type_name, None)
+        return owner
+
+    # Move a member whose type has just changed #
+    def _update_type(self, member: Field | Method | Parameter, old_type: str):
+        """
+        Moves a member from the usages of its old type to the usages of its current type.
+
+        Parameters:
+            member (Field | Method | Parameter): The member whose type changed.
+            old_type (str): The type the member had before the change.
+        """
+        owner = self._unregister(member, old_type)
+        if owner is not None:
+            self._register(member, owner)
+
+    # Register or unregister every member of a class #
+    def _register_class(self, class_object: Class):
+        """
+        Registers every field, method and parameter of a class.
+
+        Parameters:
+            class_object (Class): The class to register.
+        """
+        for field in class_object._get_class_field_list():
+            self._register(field, class_object)
+        for method_entry in class_object._get_method_and_parameters_list():
+            self._register(method_entry._get_method(), class_object)
+            for param in method_entry._get_parameter_list():
+                self._register(param, class_object)
+
+    def _unregister_class(self, class_object: Class):
+        """
+        Unregisters every field, method and parameter of a class.
+
+        Parameters:
+            class_object (Class): The class to unregister.
+        """
+        for field in class_object._get_class_field_list():
+            self._unregister(field)
+        for method_entry in class_object._get_method_and_parameters_list():
+            self._unregister(method_entry._get_method())
+            for param in method_entry._get_parameter_list():
+                self._unregister(param)
+
+    #################################################################
+
+    # Get the list of distinct type names #
+    def _get_type_list(self) -> List[str]:
+        """
+        Returns:
+            List[str]: Every type name currently used by at least one member.
+        """
+        return list(self.__usage_index)
+
+    # Get the members using a type #
+    def _get_usage_list(self, type_name: str) -> List[Dict]:
+        """
+        Finds every member that uses a type.
+
+        Parameters:
+            type_name (str): The type name to look up.
+
+        Returns:
+            List[Dict]: One dictionary per usage with the owning class name, the kind of member
+                        ("field", "method" or "parameter"), its name and the member itself.
+        """
+        usage_list = []
+        for member, owner in self.__usage_index.get(type_name, {}).items():
+            if isinstance(member, Field):
+                kind, member_name = "field", member._get_name()
+            elif isinstance(member, Method):
+                kind, member_name = "method", member._get_name()
+            else:
+                kind, member_name = "parameter", member._get_parameter_name()
+            usage_list.append({"class_name": owner._get_class_name(), "kind": kind, "name": member_name, "member": member})
+        return usage_list
+
+    # Get the number of members using a type #
+    def _get_usage_count(self, type_name: str) -> int:
+        return len(self.__usage_index.get(type_name, {}))
@@ -14,6 +14,7 @@ from rich.tree import Tree
 from rich.table import Table
 from rich.panel import Panel
 from rich.box import SQUARE
+from collections import Counter
 from typing import List, Dict
 from UML_MVC.uml_observer import UMLObserver as Observer
 from UML_ENUM_CLASS.uml_enum import InterfaceOptions, RelationshipType
@@ -28,6 +29,9 @@ class UMLView(Observer):
     It implements the Observer pattern to receive updates from the UML model.
     """
 
+    # Batches larger than this are summarized instead of printed line by line #
+    BATCH_SUMMARY_THRESHOLD = 10
+
     def __init__(self):
         """
         Initializes the UMLView with a Rich console for formatted output.
@@ -61,6 +65,9 @@ class UMLView(Observer):
             new_name = data["new_name"]
             if not is_undo_or_redo:
                 self.console.print(f"\n[bold green]Class [bold white]'{old_name}'[/bold white] has been renamed to [bold white]'{new_name}'[/bold white].[/bold green]")
+                retyped_member_list = data.get("retyped_member_list")
+                if retyped_member_list:
+                    self.console.print(f"[bold green]Updated [bold white]{len(retyped_member_list)}[/bold white] type reference(s) to [bold white]'{new_name}'[/bold white].[/bold green]")
         
         # Add field
         elif event_type == InterfaceOptions.ADD_FIELD.value:
@@ -192,6 +199,27 @@ class UMLView(Observer):
             if not is_undo_or_redo:
                 self.console.print(f"\n[bold green]Successfully changed the relationship type between class [bold white]'{source_class}'[/bold white] and class [bold white]'{destination_class}' to [bold white]'{new_type}'[/bold white]![/bold green]")
     
+    def _update_batch(self, event_list: List):
+        """
+        Handles a batch of updates delivered at once (e.g. when a transaction commits).
+        Small batches are printed event by event, like _update. Larger ones are summarized in a single
+        line counting the changes per event type, so bulk work is not dominated by console output.
+
+        Args:
+            event_list (List[UMLEvent]): The coalesced events, in the order they happened.
+        """
+        if len(event_list) <= self.BATCH_SUMMARY_THRESHOLD:
+            for event in event_list:
+                self._update(event._get_event_type(), event._get_data(), event._is_loading(), event._is_undo_or_redo())
+            return
+        # Loading and undo/redo events are not reported, same as in _update
+        count_by_type = Counter(event._get_event_type() for event in event_list
+                                if not event._is_loading() and not event._is_undo_or_redo())
+        if not count_by_type:
+            return
+        summary = ", ".join(f"[bold white]{count}[/bold white] {event_type}" for event_type, count in count_by_type.items())
+        self.console.print(f"\n[bold green]Applied [bold white]{sum(count_by_type.values())}[/bold white] changes: {summary}.[/bold green]")
+
     def _prompt_menu(self):
         """
         Displays a formatted menu with available commands using the Rich library.
@@ -209,6 +237,7 @@ class UMLView(Observer):
             ["add_class [bright_white]<class_name>[bright_white]", "Add a new class"],
             ["delete_class [bright_white]<class_name>[bright_white]", "Delete an existing class"],
             ["rename_class [bright_white]<class_name> <new_name>[bright_white]", "Rename a class"],
+            ["refactor_class [bright_white]<class_name> <new_name>[bright_white]", "Rename a class and every type referring to it"],
 
             ["[bold yellow]Field Commands[/bold yellow]", ""],
             ["add_field [bright_white]<class_name> <type/Empty> <attr_name>[bright_white]", "Add a field to a class"],
@@ -235,6 +264,8 @@ class UMLView(Observer):
             ["edit_rel_type [bright_white]<source_class> <destination_class> <new_type>[bright_white]", "Modify the type of a relationship"],
             ["undo", "Undo an action"],
             ["redo", "Redo an action"],
+            ["history", "List the actions that can be undone or redone"],
+            ["goto [bright_white]<revision>[bright_white]", "Undo or redo up to a revision of the history"],
 
             ["[bold yellow]Class-Related Commands[/bold yellow]", ""],
             ["list_class", "List all created classes"],
@@ -429,6 +460,29 @@ class UMLView(Observer):
         self.console.print(table)
         return True
         
+    def _display_history(self, history_list: List):
+        """
+        Displays the undo history using a table format, marking the current revision.
+        
+        Args:
+            history_list (List): One (revision, description, is_current) tuple per action, oldest first.
+        """
+        if len(history_list) == 0:
+            self.console.print("\n[bold red]No action in the history![/bold red]")
+            return False
+
+        table = Table(title="\n[bold white]History[bold white]", show_header=True, header_style="bold yellow", border_style="bold dodger_blue2")
+        table.add_column("Revision", justify="center", style="bold white")
+        table.add_column("Action", justify="left", style="bold white")
+        table.add_column("", justify="center", style="bold green")
+
+        for revision, description, is_current in history_list:
+            table.add_row(str(revision), description, "<- current" if is_current else "")
+
+        # Print the history table
+        self.console.print(table)
+        return True
+        
     def _display_method_and_parameter_list(self, method_and_param_list: List):
         """
         Displays the list of methods and their parameters in a UML diagram using a table format.
@@ -5,6 +5,10 @@ from UML_ENUM_CLASS.uml_enum import RelationshipType
 from UML_MVC.UML_VIEW.UML_GUI_VIEW.uml_custom_dialog import CustomInputDialog as Dialog
 from UML_MVC.UML_VIEW.UML_GUI_VIEW.uml_gui_arrow_line import UMLArrow as ArrowLine
 from UML_MVC.uml_command_factory import CommandFactory
+from UML_MVC.UML_CONTROLLER.uml_storage_manager import UMLStorageManager
+
+# Diagram files the open and save dialogs accept, plain or compressed JSON
+DIAGRAM_FILE_FILTER = "JSON Files (*.json *.json.gz *.json.xz);;Compressed JSON Files (*.json.gz *.json.xz)"
 
 class UMLGraphicsView(QtWidgets.QGraphicsView):
     """
@@ -54,6 +58,7 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         self.selected_class = False
 
         self.move_start_pos = None  # Starting position for move actions
+        self.move_start_pos_list = {}  # Starting position of every selected box for group moves
 
     #################################################################
     ## GRID VIEW RELATED ##
@@ -1160,19 +1165,19 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         """
         Opens a file dialog to allow the user to select a JSON file for loading into the application.
 
-        This function uses the `QFileDialog` to let the user select a `.json` file from the file system.
+        This function uses the `QFileDialog` to let the user select a `.json`, `.json.gz` or `.json.xz` file from the file system.
         If a valid JSON file is selected, the function proceeds to load the file into the interface.
         If the selected file is not a JSON file, a warning is displayed to the user.
         """
         # Show an open file dialog and store the selected file path
         full_path, _ = QtWidgets.QFileDialog.getOpenFileName(
-            self, "Open File", os.getcwd(), "JSON Files (*.json)"
+            self, "Open File", os.getcwd(), DIAGRAM_FILE_FILTER
         )
         # Check if the user canceled the dialog (full_path will be empty if canceled)
         if not full_path:
             return  # Exit the function if the user cancels the dialog
         # Check if the selected file is a JSON file
-        if not full_path.endswith('.json'):
+        if not UMLStorageManager._is_diagram_file(full_path):
             QtWidgets.QMessageBox.warning(
                 None,
                 "Warning",
@@ -1182,8 +1187,7 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         self.clear_current_scene()  # Clear the scene before loading a new file
         # If a valid file is selected, proceed to load it into the interface
         if full_path:
-            file_base_name = os.path.basename(full_path)  # Extract the file name from the full path
-            file_name_only = os.path.splitext(file_base_name)[0]  # Remove the file extension
+            file_name_only = UMLStorageManager._get_diagram_name(full_path)  # Extract the file name without its extension
             self.interface.load_gui(file_name_only, full_path, self)  # Load the file into the GUI
 
     def save_as_gui(self):
@@ -1194,11 +1198,12 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         If the user cancels the dialog or selects an invalid file, appropriate actions are taken.
         """
         full_path, _ = QtWidgets.QFileDialog.getSaveFileName(
-            self, "Save File", os.getcwd(), "JSON Files (*.json)"
+            self, "Save File", os.getcwd(), DIAGRAM_FILE_FILTER
         )
         if not full_path:
             return  # If canceled, just return and do nothing
-        if not full_path.endswith('.json'):
+        # A '.json.gz' or '.json.xz' file is saved compressed
+        if not UMLStorageManager._is_diagram_file(full_path):
             QtWidgets.QMessageBox.warning(
                 None,
                 "Warning",
@@ -1206,9 +1211,8 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
             )
             return
         if full_path:
-            file_base_name = os.path.basename(full_path)
-            file_name_only = os.path.splitext(file_base_name)[0]
-            self.interface.save_gui(file_name_only, full_path)
+            file_name_only = UMLStorageManager._get_diagram_name(full_path)
+            self.interface.save_gui(file_name_only, full_path, self.class_name_list)
 
     def save_gui(self):
         """
@@ -1222,8 +1226,7 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         if current_active_file_path == "No active file!":
             self.save_as_gui()
         else:
-            file_base_name = os.path.basename(current_active_file_path)
-            file_name_only = os.path.splitext(file_base_name)[0]
+            file_name_only = UMLStorageManager._get_diagram_name(current_active_file_path)
             self.interface.save_gui(file_name_only, current_active_file_path, self.class_name_list)
 
     #################################################################
@@ -1249,6 +1252,26 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         self.input_handler.redo()
         self.scene().update()
 
+    def get_history_info(self):
+        """
+        Reports the state of the undo history shared with the CLI.
+
+        Returns:
+            dict: The history length, undo and redo counts, estimated memory in bytes, limits and the
+                  number of evicted commands (see InputHandler.get_history_info).
+        """
+        return self.input_handler.get_history_info()
+
+    def set_history_limit(self, max_depth, max_bytes):
+        """
+        Changes the maximum undo depth and the approximate memory budget of the undo history.
+
+        Parameters:
+            max_depth (int | None): The maximum number of undoable actions, None for no limit.
+            max_bytes (int | None): The memory budget in bytes, None for no limit.
+        """
+        self.input_handler.set_history_limit(max_depth, max_bytes)
+
     def clear_current_scene(self):
         """
         Removes all UMLClassBox and ArrowLine items from the scene.
@@ -1427,6 +1450,13 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
         # Call the parent class's mousePressEvent for default behavior
         super().mousePressEvent(event)
 
+        # The selection is settled now, remember where every selected box starts for a group move
+        self.move_start_pos_list = {}
+        if self.selected_class:
+            for selected_item in self.scene().selectedItems():
+                if isinstance(selected_item, UMLClassBox):
+                    self.move_start_pos_list[selected_item] = selected_item.pos()
+
     def mouseMoveEvent(self, event):
         """
         Handles mouse move events for updating the rubber band rectangle or panning the view.
@@ -1480,8 +1510,19 @@ class UMLGraphicsView(QtWidgets.QGraphicsView):
             old_x = self.move_start_pos.x()
             old_y = self.move_start_pos.y()
 
+            # Other selected boxes dragged along with this one
+            move_list = [(class_box, start_pos.x(), start_pos.y(), class_box.pos().x(), class_box.pos().y())
+                         for class_box, start_pos in self.move_start_pos_list.items()
+                         if class_box is not self.selected_class and class_box.pos() != start_pos]
+
             # Only create and execute the command if the position has changed
-            if (new_x, new_y) != (old_x, old_y):
+            if move_list:
+                move_list.append((self.selected_class, old_x, old_y, new_x, new_y))
+                move_unit_group_command = self.command_factory.create_command(
+                    command_name="move_unit_group", move_list=move_list
+                )
+                self.input_handler.execute_command(move_unit_group_command)
+            elif (new_x, new_y) != (old_x, old_y):
                 self.command_factory.class_box = self.selected_class
                 move_unit_command = self.command_factory.create_command(
                     command_name="move_unit", old_x=old_x, old_y=old_y, new_x=new_x, new_y=new_y
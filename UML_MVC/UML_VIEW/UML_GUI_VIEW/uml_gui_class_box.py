@@ -195,6 +195,22 @@ class UMLClassBox(QtWidgets.QGraphicsRectItem):
         # Set the new position using setPos()
         self.setPos(new_x, new_y)
 
+    def move_without_arrow_update(self, new_x, new_y):
+        """
+        Move the box without updating its arrow lines on the way.
+
+        Used when several boxes move at once: the caller moves every box first and then updates
+        each affected arrow line a single time.
+
+        Parameters:
+            new_x (float): The new x-coordinate of the box.
+            new_y (float): The new y-coordinate of the box.
+        """
+        self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, False)
+        self.setPos(new_x, new_y)
+        self.setFlag(QtWidgets.QGraphicsItem.ItemSendsGeometryChanges, True)
+        self.update_box_position()
+
     def itemChange(self, change, value):
         """
         Overridden method to handle item changes, such as position changes.
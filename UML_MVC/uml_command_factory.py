@@ -38,7 +38,7 @@ class CommandFactory:
         method_num=None, param_type=None, selected_param_index=None,
         new_param_list_obj=None, new_param_list_str=None,
         source_class=None, dest_class=None,
-        rel_type=None, new_type=None, arrow_line=None
+        rel_type=None, new_type=None, arrow_line=None, move_list=None
     ) -> Command:
         """
         Create a command object based on the provided command name and parameters.
@@ -65,6 +65,7 @@ class CommandFactory:
             rel_type (str, optional): The type of the relationship.
             new_type (str, optional): The new type for change type commands.
             arrow_line: The arrow line object in the GUI (for relationships).
+            move_list (list, optional): One (class_box, old_x, old_y, new_x, new_y) tuple per box (for group moves).
 
         Returns:
             Command: An instance of a command class corresponding to the command name.
@@ -82,6 +83,9 @@ class CommandFactory:
                 new_x=new_x,
                 new_y=new_y
             )
+        elif command_name == CommandType.MOVE_UNIT_GROUP.value:
+            # Create a MoveUnitGroupCommand to move several class boxes at once
+            return Command.MoveUnitGroupCommand(move_list=move_list)
         elif command_name == CommandType.ADD_CLASS.value:
             # Create an AddClassCommand to add a new class
             return Command.AddClassCommand(
@@ -110,6 +114,17 @@ class CommandFactory:
                 class_box=self.class_box,
                 is_gui=self.is_gui,
             )
+        elif command_name == CommandType.REFACTOR_CLASS.value:
+            # Create a RenameClassCommand that also renames every type referring to the class
+            return Command.RenameClassCommand(
+                class_name=class_name,
+                new_name=new_name,
+                uml_model=self.uml_model,
+                view=self.view,
+                class_box=self.class_box,
+                is_gui=self.is_gui,
+                is_refactor=True,
+            )
         elif command_name == CommandType.ADD_FIELD.value:
             # Create an AddFieldCommand to add a field to a class
             return Command.AddFieldCommand(
@@ -296,3 +311,59 @@ class CommandFactory:
         else:
             # Raise an error if an unknown command name is provided
             raise ValueError(f"Unknown command name: {command_name}")
+
+    def create_composite_command(self, spec_list) -> Command:
+        """
+        Create a CompositeCommand that runs several commands as one undoable unit.
+
+        Parameters:
+            spec_list (list): One entry per child command, in execution order. An entry is either a
+                              Command instance or a dict holding "command_name" and the keyword
+                              arguments of create_command.
+
+        Returns:
+            Command: A CompositeCommand wrapping the child commands.
+
+        Raises:
+            ValueError: If an entry names an unknown command or has no command name.
+        """
+        command_list = [spec if isinstance(spec, Command.Command) else self.create_command_from_spec(spec)
+                        for spec in spec_list]
+        return Command.CompositeCommand(uml_model=self.uml_model, command_list=command_list)
+
+    def create_command_from_spec(self, spec) -> Command:
+        """
+        Rebuild a command from the spec returned by its to_spec method.
+
+        Parameters:
+            spec (dict): The "command_name" and the keyword arguments of create_command. A composite
+                         spec holds the specs of its children in "spec_list".
+
+        Returns:
+            Command: The rebuilt command.
+
+        Raises:
+            ValueError: If the spec names an unknown command or has no command name.
+        """
+        spec = dict(spec)
+        command_name = spec.pop("command_name", None)
+        if command_name is None:
+            raise ValueError(f"Command spec has no command name: {spec}")
+        if command_name == CommandType.COMPOSITE.value:
+            return self.create_composite_command(spec.get("spec_list", []))
+        return self.create_command(command_name, **spec)
+
+    def create_command_from_record(self, record) -> Command:
+        """
+        Rebuild a command from the compact record returned by its to_record method.
+
+        Parameters:
+            record (list): [command_name, *arguments], see Command.RECORD_ARGUMENT_LIST.
+
+        Returns:
+            Command: The rebuilt command.
+
+        Raises:
+            ValueError: If the record is invalid or names an unknown command.
+        """
+        return self.create_command_from_spec(Command.record_to_spec(record))
@@ -1,6 +1,80 @@
+import sys
+import time
 from abc import ABC, abstractmethod
+from contextlib import contextmanager, nullcontext
 from UML_MVC.UML_VIEW.UML_GUI_VIEW.uml_gui_arrow_line import UMLArrow as ArrowLine
 
+# Compact records #
+# A command record is [command_name, *arguments]. The arguments are positional, in the order below,
+# and carry the CommandFactory spec keys of the same name. Trailing None arguments are left out.
+RECORD_ARGUMENT_LIST = {
+    "add_class": ("class_name",),
+    "delete_class": ("class_name",),
+    "rename_class": ("class_name", "new_name"),
+    "refactor_class": ("class_name", "new_name"),
+    "add_field": ("class_name", "field_type", "input_name"),
+    "delete_field": ("class_name", "input_name"),
+    "rename_field": ("class_name", "old_name", "new_name"),
+    "edit_field_type": ("class_name", "input_name", "new_type"),
+    "add_method": ("class_name", "method_type", "input_name"),
+    "delete_method": ("class_name", "method_num"),
+    "rename_method": ("class_name", "method_num", "new_name"),
+    "edit_method_type": ("class_name", "method_num", "new_type"),
+    "add_param": ("class_name", "method_num", "param_type", "input_name"),
+    "delete_param": ("class_name", "method_num", "input_name", "selected_param_index"),
+    "rename_param": ("class_name", "method_num", "old_name", "new_name"),
+    "edit_param_type": ("class_name", "method_num", "input_name", "new_type"),
+    "replace_param": ("class_name", "method_num", "new_param_list_str"),
+    "add_rel": ("source_class", "dest_class", "rel_type"),
+    "delete_rel": ("source_class", "dest_class"),
+    "edit_rel_type": ("source_class", "dest_class", "new_type"),
+}
+
+def spec_to_record(spec):
+    """
+    Convert a CommandFactory spec to a compact record. A composite record holds the records of its
+    children: ["composite", [record, ...]].
+
+    Parameters:
+        spec (dict): The spec, as returned by Command.to_spec.
+
+    Returns:
+        list: The record.
+    """
+    command_name = spec["command_name"]
+    if command_name == "composite":
+        return [command_name, [spec_to_record(child_spec) for child_spec in spec["spec_list"]]]
+    argument_list = [spec.get(argument_name) for argument_name in RECORD_ARGUMENT_LIST[command_name]]
+    while argument_list and argument_list[-1] is None:
+        argument_list.pop()
+    return [command_name, *argument_list]
+
+def record_to_spec(record):
+    """
+    Convert a compact record back to a CommandFactory spec.
+
+    Parameters:
+        record (list): The record, as returned by spec_to_record.
+
+    Returns:
+        dict: The spec.
+
+    Raises:
+        ValueError: If the record is empty, names an unknown command or has too many arguments.
+    """
+    if not isinstance(record, (list, tuple)) or not record:
+        raise ValueError(f"Invalid command record: {record!r}")
+    command_name, *argument_list = record
+    if command_name == "composite":
+        child_record_list = argument_list[0] if argument_list else []
+        return {"command_name": command_name, "spec_list": [record_to_spec(child_record) for child_record in child_record_list]}
+    argument_name_list = RECORD_ARGUMENT_LIST.get(command_name)
+    if argument_name_list is None or len(argument_list) > len(argument_name_list):
+        raise ValueError(f"Invalid command record: {record!r}")
+    spec = dict(zip(argument_name_list, argument_list))
+    spec["command_name"] = command_name
+    return spec
+
 class Command(ABC):
     """
     Abstract base class for the Command pattern.
@@ -31,6 +105,53 @@ class Command(ABC):
             bool: True if the command was undone successfully, False otherwise.
         """
         pass
+
+    def merge_with(self, next_command):
+        """
+        Absorb a command that was just executed after this one, so that both are undone in one step.
+
+        Parameters:
+            next_command (Command): The command executed right after this one.
+
+        Returns:
+            bool: True if next_command was merged into this command and must not be added to the history.
+        """
+        return False
+
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec, so it can be written to the session journal and rebuilt.
+
+        Returns:
+            dict | None: The command name and the create_command arguments that rebuild this command,
+                         or None if the command only changes the GUI and is not journaled.
+        """
+        return None
+
+    def to_record(self):
+        """
+        Describe the command as a compact record, [command_name, *arguments] (see RECORD_ARGUMENT_LIST).
+
+        Returns:
+            list | None: The record, or None if the command only changes the GUI.
+        """
+        spec = self.to_spec()
+        return spec_to_record(spec) if spec is not None else None
+
+    def describe(self):
+        """
+        Describe the command in a few words for the history list.
+
+        Returns:
+            str: The kind of command followed by the class or relationship it works on.
+        """
+        action = type(self).__name__.removesuffix("Command")
+        action = "".join(f" {char.lower()}" if char.isupper() else char for char in action).strip()
+        source_class = getattr(self, "source_class", None)
+        if source_class:
+            return f"{action} {source_class} -> {getattr(self, 'dest_class', None)}"
+        class_name = getattr(self, "class_name", None)
+        return f"{action} {class_name}" if class_name else action
         
 class MoveUnitCommand(Command):
     """
@@ -38,8 +159,11 @@ class MoveUnitCommand(Command):
 
     This command encapsulates the action of moving a UML class box to a new position.
     It can be undone to move the class box back to its original position.
+    Consecutive moves of the same box within MERGE_WINDOW seconds are merged into one undo step.
     """
 
+    MERGE_WINDOW = 1.0
+
     def __init__(self, class_box, old_x, old_y, new_x, new_y):
         """
         Initialize the MoveUnitCommand.
@@ -56,6 +180,7 @@ class MoveUnitCommand(Command):
         self.old_y = old_y
         self.new_x = new_x
         self.new_y = new_y
+        self.timestamp = time.monotonic()
         
     def execute(self, is_undo_or_redo=False):
         """
@@ -68,8 +193,9 @@ class MoveUnitCommand(Command):
             bool: True if the move was successful, False otherwise.
         """
         if self.class_box:
-            self.class_box.setPos(self.new_x, self.new_y)
-            self.class_box.update_box()
+            # Only the position changes, the box layout does not need to be recomputed
+            self.class_box.move_without_arrow_update(self.new_x, self.new_y)
+            self.class_box.update_arrow_lines()
             return True
         return False
         
@@ -81,10 +207,113 @@ class MoveUnitCommand(Command):
             bool: True if the undo was successful, False otherwise.
         """
         if self.class_box:
-            self.class_box.setPos(self.old_x, self.old_y)
-            self.class_box.update_box()
+            self.class_box.move_without_arrow_update(self.old_x, self.old_y)
+            self.class_box.update_arrow_lines()
             return True
         return False
+
+    def merge_with(self, next_command):
+        """
+        Merge a move of the same box that starts where this one ended and follows within MERGE_WINDOW seconds.
+
+        Parameters:
+            next_command (Command): The command executed right after this one.
+
+        Returns:
+            bool: True if the move was merged into this command.
+        """
+        if (not isinstance(next_command, MoveUnitCommand) or next_command.class_box is not self.class_box
+                or next_command.timestamp - self.timestamp > self.MERGE_WINDOW
+                or (next_command.old_x, next_command.old_y) != (self.new_x, self.new_y)):
+            return False
+        self.new_x = next_command.new_x
+        self.new_y = next_command.new_y
+        self.timestamp = next_command.timestamp
+        return True
+
+class MoveUnitGroupCommand(Command):
+    """
+    Command to move several UML class boxes at once, e.g. after a rubber band selection.
+
+    Every box is moved first, then each arrow line touching a moved box is updated a single time,
+    and the whole group move is undone in one step. Consecutive moves of the same group within
+    MERGE_WINDOW seconds are merged.
+    """
+
+    MERGE_WINDOW = 1.0
+
+    def __init__(self, move_list):
+        """
+        Initialize the MoveUnitGroupCommand.
+
+        Parameters:
+            move_list (list): One (class_box, old_x, old_y, new_x, new_y) tuple per moved box.
+        """
+        self.move_list = list(move_list)
+        self.timestamp = time.monotonic()
+
+    def execute(self, is_undo_or_redo=False):
+        """
+        Execute the group move by placing every box at its new position.
+
+        Parameters:
+            is_undo_or_redo (bool): Indicates if the command is part of an undo or redo operation.
+
+        Returns:
+            bool: True if the boxes were moved, False if there is nothing to move.
+        """
+        return self.__place([(class_box, new_x, new_y) for class_box, _, _, new_x, new_y in self.move_list])
+
+    def undo(self):
+        """
+        Undo the group move by placing every box back at its original position.
+
+        Returns:
+            bool: True if the boxes were moved back, False if there is nothing to move.
+        """
+        return self.__place([(class_box, old_x, old_y) for class_box, old_x, old_y, _, _ in self.move_list])
+
+    def merge_with(self, next_command):
+        """
+        Merge a move of the same group of boxes that starts where this one ended and follows within MERGE_WINDOW seconds.
+
+        Parameters:
+            next_command (Command): The command executed right after this one.
+
+        Returns:
+            bool: True if the move was merged into this command.
+        """
+        if (not isinstance(next_command, MoveUnitGroupCommand) or len(next_command.move_list) != len(self.move_list)
+                or next_command.timestamp - self.timestamp > self.MERGE_WINDOW):
+            return False
+        end_position_list = {id(class_box): (new_x, new_y) for class_box, _, _, new_x, new_y in self.move_list}
+        for class_box, old_x, old_y, _, _ in next_command.move_list:
+            if end_position_list.get(id(class_box)) != (old_x, old_y):
+                return False
+        start_position_list = {id(class_box): (old_x, old_y) for class_box, old_x, old_y, _, _ in self.move_list}
+        self.move_list = [(class_box, *start_position_list[id(class_box)], new_x, new_y)
+                          for class_box, _, _, new_x, new_y in next_command.move_list]
+        self.timestamp = next_command.timestamp
+        return True
+
+    def __place(self, position_list):
+        """
+        Move every box, then update each affected arrow line once.
+
+        Parameters:
+            position_list (list): One (class_box, x, y) tuple per box.
+
+        Returns:
+            bool: True if at least one box was moved.
+        """
+        arrow_line_list = {}
+        for class_box, x, y in position_list:
+            class_box.move_without_arrow_update(x, y)
+            for arrow_line in class_box.arrow_line_list:
+                arrow_line_list[id(arrow_line)] = arrow_line
+        for arrow_line in arrow_line_list.values():
+            arrow_line.update_position()
+        return bool(position_list)
         
 class AddClassCommand(Command):
     """
@@ -111,6 +340,15 @@ class AddClassCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "add_class", "class_name": self.class_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the add class command by adding the class to the model and GUI.
@@ -199,8 +437,9 @@ class DeleteClassCommand(Command):
         self.view = view
         self.class_box = class_box
         self.is_gui = is_gui
-        self.cli_class_list = None
-        self.cli_main_data = None
+        # CLI mode: the deleted class object and its relationships, put back as they are on undo
+        self.stored_class = None
+        self.stored_class_relationships = []
 
         # Store the state of the class before deletion
         self.stored_fields = []          # List of tuples: (field_type, field_name)
@@ -208,6 +447,15 @@ class DeleteClassCommand(Command):
         self.stored_parameters = {}      # Dict: {method_key: [(param_type, param_name), ...]}
         self.stored_relationships = {}   # Dictionary of relationships
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "delete_class", "class_name": self.class_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the delete class command by removing the class from the model and GUI.
@@ -218,7 +466,10 @@ class DeleteClassCommand(Command):
         Returns:
             bool: True if the class was deleted successfully, False otherwise.
         """
-        self.cli_main_data = self.uml_model._get_main_data()
+        if not self.is_gui:
+            # Only the deleted class and its relationships are needed to restore it
+            self.stored_class = self.uml_model._get_class(self.class_name)
+            self.stored_class_relationships = self.uml_model._get_class_relationship_list(self.class_name) if self.stored_class else []
         if self.is_gui:
             # Store relationships
             self.stored_relationships = self.view.relationship_track_list.copy()
@@ -366,81 +617,12 @@ class DeleteClassCommand(Command):
                     )
                     add_relationship_command.execute(is_undo_or_redo=True)
         else:
-            # For CLI mode, re-add the class and its components
-            if self.class_name in self.uml_model._get_class_list():
+            # For CLI mode, put the class and its relationships back in one operation
+            if self.stored_class is None or self.uml_model._has_class(self.class_name):
                 return False
-            main_data = self.cli_main_data
-            class_data = main_data["classes"]
-            relationship_data = main_data["relationships"]
-            extracted_class_data = self.uml_model._extract_class_data(class_data)
-
-            for each_pair in extracted_class_data:
-                for class_name, data in each_pair.items():
-                    field_list = data["fields"]
-                    method_list = data["method_list"]
-
-                    if class_name != self.class_name:
-                        continue
-                    add_class_command = AddClassCommand(
-                        uml_model=self.uml_model,
-                        class_name=self.class_name,
-                        view=self.view,
-                        class_box=self.class_box,
-                    )
-                    add_class_command.execute(is_undo_or_redo=True)
-                    
-                    for each_field in field_list:
-                        field_name = each_field["name"]
-                        field_type = each_field["type"]
-                        add_field_command = AddFieldCommand(
-                            uml_model=self.uml_model,
-                            class_name=self.class_name,
-                            type=field_type,
-                            field_name=field_name,
-                            view=self.view,
-                            class_box=self.class_box,
-                        )
-                        add_field_command.execute(is_undo_or_redo=True)
-                            
-                    method_num = "0"
-                    i = 0
-                    for each_element in method_list:
-                        i += 1
-                        method_num = f"{i}"
-                        method_name = each_element["name"]
-                        return_type = each_element["return_type"]
-                        parameter_list = each_element["params"]
-                        
-                        add_method_command = AddMethodCommand(
-                            uml_model=self.uml_model,
-                            class_name=self.class_name,
-                            type=return_type,
-                            method_name=method_name,
-                            view=self.view,
-                            class_box=self.class_box,
-                        )
-                        add_method_command.execute(is_undo_or_redo=True)
-                            
-                        for param in parameter_list:
-                            param_type = param["type"]
-                            param_name = param["name"]
-                            add_param_command = AddParameterCommand(
-                                uml_model=self.uml_model,
-                                class_name=self.class_name,
-                                method_num=method_num,
-                                param_type=param_type,
-                                param_name=param_name,
-                                view=self.view,
-                                class_box=self.class_box,
-                            )
-                            add_param_command.execute(is_undo_or_redo=True)
-                                
-            # Recreate relationships from the loaded data
-            for each_dictionary in relationship_data:
-                if each_dictionary["source"] == self.class_name:
-                    self.uml_model._add_relationship(each_dictionary["source"], each_dictionary["destination"], each_dictionary["type"], is_loading=True, is_gui=False)
-                if each_dictionary["destination"] == self.class_name:
-                    self.uml_model._add_relationship(each_dictionary["source"], each_dictionary["destination"], each_dictionary["type"], is_loading=True, is_gui=False)
+            self.uml_model._restore_class(self.stored_class, self.stored_class_relationships, is_undo_or_redo=True)
+            self.stored_class = None
+            self.stored_class_relationships = []
                 
         # Clear stored data
         self.stored_fields = []
@@ -455,9 +637,11 @@ class RenameClassCommand(Command):
 
     This command encapsulates the action of renaming a class.
     It can be undone to restore the original class name.
+    In refactor mode, every field, return and parameter type referring to the class is renamed
+    as part of the same command, and undo restores exactly those members.
     """
 
-    def __init__(self, uml_model, class_name, new_name, view=None, class_box=None, is_gui=False):
+    def __init__(self, uml_model, class_name, new_name, view=None, class_box=None, is_gui=False, is_refactor=False):
         """
         Initialize the RenameClassCommand.
 
@@ -468,6 +652,7 @@ class RenameClassCommand(Command):
             view (UMLGraphicsView, optional): The view for GUI updates.
             class_box (UMLClassBox, optional): The GUI representation of the class.
             is_gui (bool): Flag indicating whether the command is for GUI mode.
+            is_refactor (bool): Flag indicating whether type references to the class are renamed too.
         """
         self.uml_model = uml_model
         self.class_name = class_name
@@ -475,6 +660,18 @@ class RenameClassCommand(Command):
         self.view = view
         self.class_box = class_box
         self.is_gui = is_gui
+        self.is_refactor = is_refactor
+        # (owning class name, kind, method index, member name) of the members retyped by the first execution
+        self.refactor_key_set = None
+
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "refactor_class" if self.is_refactor else "rename_class", "class_name": self.class_name, "new_name": self.new_name}
 
     def execute(self, is_undo_or_redo=False):
         """
@@ -486,7 +683,12 @@ class RenameClassCommand(Command):
         Returns:
             bool: True if the class was renamed successfully, False otherwise.
         """
-        is_class_renamed = self.uml_model._rename_class(self.class_name, self.new_name, is_undo_or_redo=is_undo_or_redo)
+        if self.is_refactor and self.refactor_key_set is None:
+            # Remember which members refer to the class so undo and redo touch the same ones
+            self.refactor_key_set = {(usage["class_name"], usage["kind"], usage["method_index"], usage["name"])
+                                     for usage in self.uml_model._find_type_usage(self.class_name)}
+        is_class_renamed = self.uml_model._rename_class(self.class_name, self.new_name, is_undo_or_redo=is_undo_or_redo,
+                                                        is_refactor=self.is_refactor, refactor_key_set=self.refactor_key_set)
         if is_class_renamed and self.is_gui:
             self.class_box.class_name_text.setPlainText(self.new_name)
             self.class_box.update_box()
@@ -501,7 +703,13 @@ class RenameClassCommand(Command):
         """
         if self.is_gui:
             self.class_box.class_name_text.setPlainText(self.class_name)
-        return self.uml_model._rename_class(self.new_name, self.class_name, is_undo_or_redo=True)
+        undo_key_set = None
+        if self.is_refactor:
+            # Members of the renamed class itself are now listed under the new name
+            undo_key_set = {(self.new_name if owner_name == self.class_name else owner_name, kind, method_index, name)
+                            for owner_name, kind, method_index, name in self.refactor_key_set}
+        return self.uml_model._rename_class(self.new_name, self.class_name, is_undo_or_redo=True,
+                                            is_refactor=self.is_refactor, refactor_key_set=undo_key_set)
             
 class AddFieldCommand(Command):
     """
@@ -532,6 +740,15 @@ class AddFieldCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "add_field", "class_name": self.class_name, "field_type": self.field_type, "input_name": self.field_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the add field command by adding the field to the model and GUI.
@@ -601,6 +818,15 @@ class DeleteFieldCommand(Command):
         self.position = None  # To store the position of the field when deleted
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "delete_field", "class_name": self.class_name, "input_name": self.field_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the delete field command by removing the field from the model and GUI.
@@ -674,6 +900,15 @@ class RenameFieldCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "rename_field", "class_name": self.class_name, "old_name": self.old_name, "new_name": self.new_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the rename field command by updating the field name in the model and GUI.
@@ -750,6 +985,15 @@ class AddMethodCommand(Command):
         self.method_num = None
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "add_method", "class_name": self.class_name, "method_type": self.method_type, "input_name": self.method_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the add method command by adding the method to the model and GUI.
@@ -829,6 +1073,15 @@ class DeleteMethodCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "delete_method", "class_name": self.class_name, "method_num": self.method_num}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the delete method command by removing the method from the model and GUI.
@@ -916,6 +1169,15 @@ class RenameMethodCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "rename_method", "class_name": self.class_name, "method_num": self.method_num, "new_name": self.new_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the rename method command, renaming the method in the model and GUI.
@@ -1021,6 +1283,16 @@ class AddParameterCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "add_param", "class_name": self.class_name, "method_num": self.method_num,
+                "param_type": self.param_type, "input_name": self.param_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the add parameter command, adding the parameter to the method in the model and GUI.
@@ -1093,6 +1365,16 @@ class DeleteParameterCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "delete_param", "class_name": self.class_name, "method_num": self.method_num,
+                "selected_param_index": self.selected_param_index, "input_name": self.param_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the delete parameter command, removing the parameter from the method in the model and GUI.
@@ -1172,6 +1454,16 @@ class RenameParameterCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "rename_param", "class_name": self.class_name, "method_num": self.method_num,
+                "old_name": self.old_param_name, "new_name": self.new_param_name}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the rename parameter command, renaming the parameter in the model and GUI.
@@ -1243,7 +1535,7 @@ class ReplaceParameterListCommand(Command):
         self.uml_model = uml_model
         self.class_name = class_name
         self.method_num = method_num
-        self.old_param_list_str = None  # Will be set during execution
+        self.old_param_list_str = None  # Will be set during execution, in CLI and GUI mode
         self.old_param_list_obj = None  # Will be set during execution
         self.new_param_list_str = new_param_list_str
         self.new_param_list_obj = new_param_list_obj
@@ -1251,6 +1543,16 @@ class ReplaceParameterListCommand(Command):
         self.class_box = class_box
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "replace_param", "class_name": self.class_name, "method_num": self.method_num,
+                "new_param_list_str": list(self.new_param_list_str or [])}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the replace parameter list command, replacing the method's parameters in the model and GUI.
@@ -1261,14 +1563,16 @@ class ReplaceParameterListCommand(Command):
         Returns:
             bool: True if the parameter list was replaced successfully, False otherwise.
         """
+        # Store the old parameter list as "type name" strings before replacing, undo puts it back
+        old_param_list_str = self.__get_current_param_list_str()
         is_param_list_replaced = self.uml_model._replace_param_list(
             self.class_name, self.method_num, self.new_param_list_str, is_undo_or_redo=is_undo_or_redo
         )
+        if is_param_list_replaced:
+            self.old_param_list_str = old_param_list_str
         if is_param_list_replaced and self.is_gui:
-            # Store the old parameter list before replacing
             method_entry = self.class_box.method_list[int(self.method_num) - 1]
             self.old_param_list_obj = method_entry["parameters"]
-            self.old_param_list_str = [f"{ptype} {pname}" for ptype, pname in self.old_param_list_obj]
             # Replace the parameter list
             method_entry["parameters"] = self.new_param_list_obj
             self.class_box.param_num = len(method_entry["parameters"])
@@ -1294,6 +1598,23 @@ class ReplaceParameterListCommand(Command):
             self.class_box.update_box()  # Update the UML box
         return is_param_list_replaced
 
+    def __get_current_param_list_str(self):
+        """
+        Get the current parameters of the method as "type name" strings.
+
+        Returns:
+            list of str | None: The parameters, or None if the class or method does not exist.
+        """
+        class_object = self.uml_model._get_class(self.class_name)
+        if class_object is None or not str(self.method_num).isdigit():
+            return None
+        method_and_parameter_list = class_object._get_method_and_parameters_list()
+        selected_index = int(self.method_num) - 1
+        if not 0 <= selected_index < len(method_and_parameter_list):
+            return None
+        return [f"{param._get_type()} {param._get_parameter_name()}"
+                for param in method_and_parameter_list[selected_index]._get_parameter_list()]
+
 class AddRelationshipCommand(Command):
     """
     Command to add a relationship between two UML classes in the model and GUI.
@@ -1325,6 +1646,15 @@ class AddRelationshipCommand(Command):
         self.is_gui = is_gui
         self.arrow_line = None  # Will be set during execution
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "add_rel", "source_class": self.source_class, "dest_class": self.dest_class, "rel_type": self.rel_type}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the add relationship command, adding the relationship to the model and GUI.
@@ -1424,6 +1754,15 @@ class DeleteRelationshipCommand(Command):
         self.is_gui = is_gui
         self.arrow_line = None  # Will be set during undo if needed
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        return {"command_name": "delete_rel", "source_class": self.source_class, "dest_class": self.dest_class}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the delete relationship command, removing the relationship from the model and GUI.
@@ -1545,6 +1884,22 @@ class ChangeTypeCommand(Command):
         self.original_rel_type = None
         self.is_gui = is_gui
 
+    def to_spec(self):
+        """
+        Describe the command as a CommandFactory spec.
+
+        Returns:
+            dict: The command name and the create_command arguments that rebuild this command.
+        """
+        if self.is_field:
+            return {"command_name": "edit_field_type", "class_name": self.class_name, "input_name": self.input_name, "new_type": self.new_type}
+        if self.is_method:
+            return {"command_name": "edit_method_type", "class_name": self.class_name, "method_num": self.method_num, "new_type": self.new_type}
+        if self.is_param:
+            return {"command_name": "edit_param_type", "class_name": self.class_name, "method_num": self.method_num,
+                    "input_name": self.input_name, "new_type": self.new_type}
+        return {"command_name": "edit_rel_type", "source_class": self.source_class, "dest_class": self.dest_class, "new_type": self.new_type}
+
     def execute(self, is_undo_or_redo=False):
         """
         Execute the change type command, changing the type in the model and GUI.
@@ -1876,24 +2231,207 @@ class ChangeTypeCommand(Command):
         # Return False if none of the conditions were met
         return False
 
+class CompositeCommand(Command):
+    """
+    Command that runs a list of commands as a single undoable unit.
+
+    The children are executed in order inside one model transaction, so main data is synced and
+    observers are notified once for the whole group instead of once per child. Undo runs the
+    children's undo in reverse order, also inside one transaction. The group is all-or-nothing:
+    if a child fails, the children already executed are undone, the transaction is aborted so
+    observers receive nothing, and the command fails.
+    """
+
+    def __init__(self, uml_model, command_list):
+        """
+        Initialize the CompositeCommand.
+
+        Parameters:
+            uml_model: The UML model the children operate on.
+            command_list (list[Command]): The commands to run, in execution order.
+        """
+        self.uml_model = uml_model
+        self.command_list = list(command_list)
+
+    def to_spec(self):
+        """
+        Describe the group as a CommandFactory spec holding the specs of its children.
+
+        Returns:
+            dict | None: The spec, or None if a child cannot be described.
+        """
+        spec_list = [command.to_spec() for command in self.command_list]
+        if any(spec is None for spec in spec_list):
+            return None
+        return {"command_name": "composite", "spec_list": spec_list}
+
+    def execute(self, is_undo_or_redo=False):
+        """
+        Execute every child command in one transaction.
+
+        Parameters:
+            is_undo_or_redo (bool): Indicates if the command is part of an undo or redo operation.
+
+        Returns:
+            bool: True if every child was executed successfully, False otherwise.
+        """
+        if not self.command_list:
+            return False
+        try:
+            with self.uml_model.transaction():
+                executed_list = []
+                for command in self.command_list:
+                    if not command.execute(is_undo_or_redo=is_undo_or_redo):
+                        # Undo the children so the view matches the model again, then abort the
+                        # transaction so the events of the group are dropped
+                        for executed_command in reversed(executed_list):
+                            executed_command.undo()
+                        raise _CompositeFailure()
+                    executed_list.append(command)
+        except _CompositeFailure:
+            return False
+        return True
+
+    def describe(self):
+        """
+        Describe the group by its size and first child.
+
+        Returns:
+            str: A short description of the group.
+        """
+        if not self.command_list:
+            return "composite"
+        return f"composite of {len(self.command_list)} ({self.command_list[0].describe()}, ...)"
+
+    def undo(self):
+        """
+        Undo every child command in reverse order, in one transaction.
+
+        Returns:
+            bool: True if every child was undone successfully, False otherwise.
+        """
+        is_undone = True
+        with self.uml_model.transaction():
+            for command in reversed(self.command_list):
+                is_undone = command.undo() is not False and is_undone
+        return is_undone
+
+class _CompositeFailure(Exception):
+    """
+    Raised inside the transaction of a CompositeCommand whose child failed, to roll the transaction back.
+    """
+
+# Attributes shared with the rest of the application, not owned by a command #
+SHARED_ATTRIBUTE_SET = {"uml_model", "view"}
+
+def estimate_size(value, seen=None, depth=0):
+    """
+    Approximate the memory held by a command: the command itself and everything it references,
+    except the model and the view it shares with the rest of the application. Qt objects are
+    counted by their Python wrapper only, the rest of their memory lives in Qt.
+
+    Parameters:
+        value: The object to measure.
+        seen (set): Ids of the objects already counted.
+        depth (int): The current recursion depth, nesting deeper than 8 levels is not counted.
+
+    Returns:
+        int: The estimated size in bytes.
+    """
+    if seen is None:
+        seen = set()
+    if id(value) in seen or depth > 8:
+        return 0
+    seen.add(id(value))
+    size = sys.getsizeof(value)
+    if isinstance(value, (str, bytes, int, float, bool, type(None))):
+        return size
+    if isinstance(value, dict):
+        return size + sum(estimate_size(key, seen, depth + 1) + estimate_size(item, seen, depth + 1) for key, item in value.items())
+    if isinstance(value, (list, tuple, set, frozenset)):
+        return size + sum(estimate_size(item, seen, depth + 1) for item in value)
+    if any(base.__module__.startswith("PyQt5") for base in type(value).__mro__):
+        return size
+    attribute_list = list(getattr(value, "__dict__", {}).items())
+    for slot_owner in type(value).__mro__:
+        for slot_name in getattr(slot_owner, "__slots__", ()):
+            if slot_name.startswith("__") and not slot_name.endswith("__"):
+                slot_name = f"_{slot_owner.__name__.lstrip('_')}{slot_name}"
+            if hasattr(value, slot_name):
+                attribute_list.append((slot_name, getattr(value, slot_name)))
+    for attribute_name, attribute in attribute_list:
+        if attribute_name not in SHARED_ATTRIBUTE_SET:
+            size += estimate_size(attribute, seen, depth + 1)
+    return size
+
+def is_model_only(command):
+    """
+    Tell whether a command only changes the model, so that its effect can be reproduced by
+    restoring a model checkpoint. Commands that also update the GUI, or move GUI boxes, cannot.
+
+    Parameters:
+        command (Command): The command to check.
+
+    Returns:
+        bool: True if the command only changes the model.
+    """
+    if isinstance(command, CompositeCommand):
+        return all(is_model_only(child) for child in command.command_list)
+    return getattr(command, "uml_model", None) is not None and not getattr(command, "is_gui", False)
+
 class InputHandler:
     """
     Handles the execution of commands and manages the undo/redo stack.
 
     This class maintains a list of executed commands and a pointer to the current position.
     It provides methods to execute commands, undo, and redo actions.
+    The history is bounded: when it holds more than max_depth commands, or its estimated size
+    exceeds max_bytes, the oldest commands are evicted and can no longer be undone.
+
+    Every point of the history has a revision number: the number of commands applied since the
+    handler was created, so revision 0 is the state before the first command. When a model is given,
+    a checkpoint of the model is taken every checkpoint_interval revisions, and goto(revision) restores
+    the nearest checkpoint and replays at most checkpoint_interval commands instead of undoing or
+    redoing every command in between.
     """
 
-    def __init__(self):
+    DEFAULT_MAX_DEPTH = 1000
+    DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+    DEFAULT_CHECKPOINT_INTERVAL = 50
+
+    def __init__(self, max_depth=DEFAULT_MAX_DEPTH, max_bytes=DEFAULT_MAX_BYTES,
+                 uml_model=None, checkpoint_interval=DEFAULT_CHECKPOINT_INTERVAL):
         """
         Initialize the InputHandler.
 
+        Parameters:
+            max_depth (int | None): The maximum number of commands kept in the history, None for no limit.
+            max_bytes (int | None): The approximate memory budget of the history in bytes, None for no limit.
+            uml_model: The UML model the commands operate on, None to take no checkpoints.
+            checkpoint_interval (int | None): The number of revisions between two checkpoints, None for no checkpoints.
+
         Attributes:
             command_list (list): The list of executed commands.
             pointer (int): The index of the current command in the command_list.
+            size_list (list): The estimated size in bytes of each command in command_list.
+            checkpoint_list (dict): The model checkpoints by revision.
+            journal (UMLSessionJournal | None): The session journal the history is recorded to.
+            journaled_id_set (set): Ids of the commands whose execution is in the journal, so their
+                                    undo and redo can be recorded as plain undo and redo entries.
         """
         self.command_list = []
         self.pointer = -1  # Start before the first command
+        self.size_list = []
+        self.total_size = 0
+        self.evicted_count = 0
+        self.max_depth = max_depth
+        self.max_bytes = max_bytes
+        self.uml_model = uml_model
+        self.checkpoint_interval = checkpoint_interval
+        self.checkpoint_list = {}
+        self.journal = None
+        self.journaled_id_set = set()
+        self.is_journal_paused = False
 
     def execute_command(self, command):
         """
@@ -1906,21 +2444,53 @@ class InputHandler:
             bool: True if the command was executed successfully, False otherwise.
         """
         # Clear all commands after the current pointer position (for redo)
-        del self.command_list[self.pointer + 1:]
+        self.__truncate(self.pointer + 1)
+        self.__take_checkpoint()
         # Execute the new command
         is_command_valid = command.execute()
         if not is_command_valid:
             return False
+        # Fold the command into the previous one when they form a single step (e.g. nudging a box)
+        if self.pointer >= 0 and self.command_list[self.pointer].merge_with(command):
+            merged_size = estimate_size(self.command_list[self.pointer])
+            self.total_size += merged_size - self.size_list[self.pointer]
+            self.size_list[self.pointer] = merged_size
+            # The state at the current revision now includes the merged command
+            self.checkpoint_list.pop(self.get_revision(), None)
+            if id(self.command_list[self.pointer]) in self.journaled_id_set:
+                # The journaled spec no longer matches the command
+                self.__compact_journal()
+            return True
+        self.__record(command)
+        if self.journal is not None and not self.is_journal_paused:
+            record = command.to_record()
+            if record is not None:
+                self.journal._append(record)
+                self.journaled_id_set.add(id(command))
+                if self.journal._needs_compaction():
+                    self.__compact_journal()
+        return True
+
+    def __record(self, command):
+        """
+        Add an executed command to the history.
+        """
         # Add the command to the list and increment the pointer
+        command_size = estimate_size(command)
         self.command_list.append(command)
+        self.size_list.append(command_size)
+        self.total_size += command_size
         self.pointer += 1
-        return True
+        self.__evict()
 
     def undo(self):
         """
         Undo the last executed command.
 
         Moves the pointer back and calls undo on the current command.
+
+        Returns:
+            bool: True if a command was undone, False if there was nothing to undo.
         """
         if self.pointer >= 0:
             # Retrieve the current command
@@ -1929,12 +2499,18 @@ class InputHandler:
             command.undo()
             # Move the pointer back
             self.pointer -= 1
+            self.__journal_step([command], "undo")
+            return True
+        return False
 
     def redo(self):
         """
         Redo the last undone command.
 
         Moves the pointer forward and calls execute on the current command.
+
+        Returns:
+            bool: True if a command was redone, False if there was nothing to redo.
         """
         if self.pointer < len(self.command_list) - 1:
             # Move the pointer forward
@@ -1942,4 +2518,286 @@ class InputHandler:
             # Retrieve the command to redo
             command = self.command_list[self.pointer]
             # Execute the command again
-            command.execute(is_undo_or_redo=True)
\ No newline at end of file
+            command.execute(is_undo_or_redo=True)
+            self.__journal_step([command], "redo")
+            return True
+        return False
+
+    def get_revision(self):
+        """
+        Returns:
+            int: The current revision, the number of commands applied since the handler was created.
+        """
+        return self.evicted_count + self.pointer + 1
+
+    def goto(self, revision):
+        """
+        Bring the model to the state it had at a revision of the history.
+
+        When the commands involved only change the model, the nearest checkpoint at or before the
+        revision is restored and the remaining commands are replayed in one model transaction, if that
+        is shorter than undoing or redoing one command at a time from the current revision. Otherwise
+        the commands are undone or redone one by one.
+
+        Parameters:
+            revision (int): The revision to go to, between the oldest revision still in the history
+                            and the revision of the last command.
+
+        Returns:
+            bool: True if the model is at the revision, False if the revision is not in the history.
+        """
+        first_revision = self.evicted_count
+        if not isinstance(revision, int) or not first_revision <= revision <= first_revision + len(self.command_list):
+            return False
+        current_revision = self.get_revision()
+        if revision == current_revision:
+            return True
+        transaction = self.uml_model.transaction() if self.uml_model is not None else nullcontext()
+        # The commands between the two revisions, in the order they are undone or redone
+        if revision < current_revision:
+            crossed_command_list = self.command_list[revision - first_revision:current_revision - first_revision][::-1]
+        else:
+            crossed_command_list = self.command_list[current_revision - first_revision:revision - first_revision]
+        checkpoint_revision = self.__find_checkpoint(revision, current_revision)
+        self.is_journal_paused = True
+        try:
+            if checkpoint_revision is not None:
+                self.uml_model._restore_checkpoint(self.checkpoint_list[checkpoint_revision])
+                with transaction:
+                    for command in self.command_list[checkpoint_revision - first_revision:revision - first_revision]:
+                        command.execute(is_undo_or_redo=True)
+                self.pointer = revision - first_revision - 1
+            else:
+                with transaction:
+                    while self.get_revision() > revision:
+                        self.undo()
+                    while self.get_revision() < revision:
+                        self.redo()
+        finally:
+            self.is_journal_paused = False
+        self.__journal_step(crossed_command_list, "undo" if revision < current_revision else "redo")
+        return True
+
+    def get_history_list(self):
+        """
+        List the commands kept in the history.
+
+        Returns:
+            list: One (revision, description, is_current) tuple per command, oldest first. The
+                  revision is the one reached once the command is applied.
+        """
+        current_revision = self.get_revision()
+        return [(self.evicted_count + index + 1, command.describe(), self.evicted_count + index + 1 == current_revision)
+                for index, command in enumerate(self.command_list)]
+
+    def clear_checkpoints(self):
+        """
+        Drop every checkpoint. Used when the model is changed outside the history (e.g. by loading a file),
+        so goto never restores a state the history does not lead to.
+        """
+        self.checkpoint_list = {}
+
+    def set_journal(self, journal):
+        """
+        Record the history to a session journal from now on. The commands already in the history are not
+        in the journal, so undoing or redoing them later writes a snapshot instead of a journal entry.
+
+        Parameters:
+            journal (UMLSessionJournal | None): The journal to record to, None to stop recording.
+                                                Recording requires the handler to have a model.
+        """
+        self.journal = journal
+        self.journaled_id_set = set()
+
+    def replay_journal(self, entry_list, command_factory):
+        """
+        Re-apply journal entries on top of the model, rebuilding the history they describe. The commands are
+        run as undo/redo operations, so observers do not report every step, and in one model transaction.
+        Replay stops at the first entry that cannot be rebuilt.
+
+        Parameters:
+            entry_list (list): The entries returned by UMLSessionJournal._read.
+            command_factory (CommandFactory): The factory rebuilding commands from their records.
+
+        Returns:
+            int: The number of entries applied.
+        """
+        applied_count = 0
+        self.is_journal_paused = True
+        try:
+            with self.uml_model.transaction():
+                for entry in entry_list:
+                    if entry == ["undo"]:
+                        self.undo()
+                    elif entry == ["redo"]:
+                        self.redo()
+                    else:
+                        try:
+                            command = command_factory.create_command_from_record(entry)
+                        except (KeyError, TypeError, ValueError):
+                            break
+                        self.__truncate(self.pointer + 1)
+                        self.__take_checkpoint()
+                        if command.execute(is_undo_or_redo=True):
+                            self.__record(command)
+                            self.journaled_id_set.add(id(command))
+                    applied_count += 1
+        finally:
+            self.is_journal_paused = False
+        return applied_count
+
+    def __journal_step(self, command_list, operation):
+        """
+        Record undoing or redoing commands. A step over a command whose execution is not in the journal
+        cannot be replayed from it, so the current model is written as a snapshot instead.
+        """
+        if self.journal is None or self.is_journal_paused:
+            return
+        journaled_list = [command for command in command_list if command.to_record() is not None]
+        if not journaled_list:
+            return
+        if not all(id(command) in self.journaled_id_set for command in journaled_list):
+            self.__compact_journal()
+            return
+        for _ in journaled_list:
+            self.journal._append([operation])
+        if self.journal._needs_compaction():
+            self.__compact_journal()
+
+    def __compact_journal(self):
+        """
+        Replace the journal by a snapshot of the current model.
+        """
+        self.journal._compact(self.uml_model._copy_main_data())
+        self.journaled_id_set = set()
+
+    def set_history_limit(self, max_depth=DEFAULT_MAX_DEPTH, max_bytes=DEFAULT_MAX_BYTES):
+        """
+        Change the bounds of the history. Commands exceeding the new bounds are evicted right away.
+
+        Parameters:
+            max_depth (int | None): The maximum number of commands kept in the history, None for no limit.
+            max_bytes (int | None): The approximate memory budget of the history in bytes, None for no limit.
+        """
+        self.max_depth = max_depth
+        self.max_bytes = max_bytes
+        self.__evict()
+
+    def get_history_info(self):
+        """
+        Report the state of the history.
+
+        Returns:
+            dict: The number of commands kept ("length"), how many can be undone ("undo_count") and
+                  redone ("redo_count"), the estimated memory in bytes ("estimated_bytes"), the limits
+                  ("max_depth", "max_bytes"), the number of commands evicted so far ("evicted_count"),
+                  the current revision ("revision") and the number of model checkpoints ("checkpoint_count").
+        """
+        return {
+            "length": len(self.command_list),
+            "undo_count": self.pointer + 1,
+            "redo_count": len(self.command_list) - self.pointer - 1,
+            "estimated_bytes": self.total_size,
+            "max_depth": self.max_depth,
+            "max_bytes": self.max_bytes,
+            "evicted_count": self.evicted_count,
+            "revision": self.get_revision(),
+            "checkpoint_count": len(self.checkpoint_list),
+        }
+
+    def __truncate(self, length):
+        """
+        Drop the commands from position length onwards.
+        """
+        self.total_size -= sum(self.size_list[length:])
+        for command in self.command_list[length:]:
+            self.journaled_id_set.discard(id(command))
+        del self.command_list[length:]
+        del self.size_list[length:]
+        last_revision = self.evicted_count + length
+        self.checkpoint_list = {revision: checkpoint for revision, checkpoint in self.checkpoint_list.items()
+                                if revision <= last_revision}
+
+    def __take_checkpoint(self):
+        """
+        Checkpoint the model at the current revision when it falls on the checkpoint interval.
+        """
+        if self.uml_model is None or not self.checkpoint_interval:
+            return
+        revision = self.get_revision()
+        if revision % self.checkpoint_interval == 0 and revision not in self.checkpoint_list:
+            self.checkpoint_list[revision] = self.uml_model._create_checkpoint()
+
+    def __find_checkpoint(self, revision, current_revision):
+        """
+        Find the checkpoint goto should restore to reach a revision.
+
+        Returns:
+            int | None: The revision of the checkpoint, or None if undoing or redoing step by step is
+                        as short, or if a command on the way also changes the GUI.
+        """
+        candidate_list = [checkpoint_revision for checkpoint_revision in self.checkpoint_list
+                          if checkpoint_revision <= revision]
+        if not candidate_list:
+            return None
+        checkpoint_revision = max(candidate_list)
+        if revision - checkpoint_revision + 1 >= abs(revision - current_revision):
+            return None
+        # Restoring the checkpoint also discards the commands between it and the current revision
+        first_index = min(checkpoint_revision, current_revision) - self.evicted_count
+        last_index = max(revision, current_revision) - self.evicted_count
+        if not all(is_model_only(command) for command in self.command_list[first_index:last_index]):
+            return None
+        return checkpoint_revision
+
+    def __evict(self):
+        """
+        Drop the oldest commands until the history fits in max_depth and max_bytes.
+        The most recent command is always kept, even if it alone exceeds the byte budget.
+        """
+        evict_count = 0
+        length = len(self.command_list)
+        total_size = self.total_size
+        while length - evict_count > 1 and (
+                (self.max_depth is not None and length - evict_count > self.max_depth) or
+                (self.max_bytes is not None and total_size > self.max_bytes)):
+            total_size -= self.size_list[evict_count]
+            evict_count += 1
+        if self.max_depth is not None and self.max_depth < 1:
+            # A history of depth 0 keeps nothing at all
+            evict_count = length
+            total_size = 0
+        if evict_count == 0:
+            return
+        for command in self.command_list[:evict_count]:
+            self.journaled_id_set.discard(id(command))
+        del self.command_list[:evict_count]
+        del self.size_list[:evict_count]
+        self.total_size = total_size
+        self.pointer = max(self.pointer - evict_count, -1)
+        self.evicted_count += evict_count
+        self.checkpoint_list = {revision: checkpoint for revision, checkpoint in self.checkpoint_list.items()
+                                if revision >= self.evicted_count}
+
+    @contextmanager
+    def transaction(self, uml_model):
+        """
+        Executes the commands issued inside the block in one model transaction.
+
+        Each command is still recorded as its own undo step. If the block raises an exception,
+        the model is rolled back and the commands executed inside the block are removed from the
+        history, so undo and redo never replay them.
+
+        Parameters:
+            uml_model: The UML model the commands operate on.
+        """
+        saved_history = (list(self.command_list), list(self.size_list), self.total_size, self.pointer, self.evicted_count, dict(self.checkpoint_list))
+        try:
+            with uml_model.transaction():
+                yield self
+        except BaseException:
+            self.command_list, self.size_list, self.total_size, self.pointer, self.evicted_count, self.checkpoint_list = saved_history
+            if self.journal is not None:
+                # The journal holds the commands that were rolled back
+                self.__compact_journal()
+            raise
\ No newline at end of file
@@ -0,0 +1,319 @@
+###################################################################################################
+"""
+Module: UMLEventBus
+This module defines the UMLEventBus class, which sits between the model and its observers. Outside a batch
+every event is delivered right away through observer._update, exactly like calling the observers directly.
+Inside a batch events are buffered and delivered together when the batch ends, through
+observer._update_batch(event_list), or one _update call per event for observers without it.
+Before a batch is delivered, repeated state changes of the same member (for example several
+EDIT_FIELD_TYPE events on one field) are coalesced so observers only see the final state.
+Delivery itself can be moved off the mutation path: in THREAD mode events are queued and delivered on a
+worker thread, in QT mode on the Qt event loop. Either way they are delivered in publish order, and
+flush() waits until everything published so far has been delivered.
+"""
+###################################################################################################
+
+import queue
+import threading
+from collections import deque
+from contextlib import contextmanager
+from typing import Callable, Dict, List, Tuple
+from UML_ENUM_CLASS.uml_enum import DispatchMode, InterfaceOptions
+
+###################################################################################################
+
+class UMLEvent:
+
+    """
+    One model change as seen by the observers.
+    """
+
+    __slots__ = ("__event_type", "__data", "__is_loading", "__is_undo_or_redo")
+
+    def __init__(self, event_type: str = None, data: Dict = None, is_loading: bool = None, is_undo_or_redo: bool = None):
+        self.__event_type = event_type
+        self.__data = data
+        self.__is_loading = is_loading
+        self.__is_undo_or_redo = is_undo_or_redo
+
+    def _get_event_type(self) -> str:
+        return self.__event_type
+
+    def _get_data(self) -> Dict:
+        return self.__data
+
+    def _is_loading(self) -> bool:
+        return self.__is_loading
+
+    def _is_undo_or_redo(self) -> bool:
+        return self.__is_undo_or_redo
+
+    def __repr__(self) -> str:
+        return f"UMLEvent({self.__event_type!r}, {self.__data!r})"
+
+###################################################################################################
+
+# Event types that set a value on a member, with the data keys identifying that member.
+# A later event with the same key supersedes an earlier one.
+DEFAULT_COALESCE_KEY_LIST: Dict[str, Tuple[str, ...]] = {
+    InterfaceOptions.EDIT_FIELD_TYPE.value: ("class_name", "field_name"),
+    InterfaceOptions.EDIT_REL_TYPE.value: ("source", "dest"),
+}
+
+class UMLEventBus:
+
+    """
+    UMLEventBus delivers model events to a list of observers, either immediately or as coalesced batches,
+    on the caller's thread, a worker thread or the Qt event loop.
+    """
+
+    #################################################################
+
+    # UML event bus constructor #
+    def __init__(self, observer_list: List):
+        """
+        Initializes the bus.
+
+        Parameters:
+            observer_list (List): The observers to deliver to. The list is shared, not copied,
+                                  so observers attached later are picked up.
+        """
+        self.__observer_list = observer_list
+        self.__batch_depth: int = 0
+        self.__pending_event_list: List[UMLEvent] = []
+        self.__coalesce_key_list: Dict[str, Tuple[str, ...]] = dict(DEFAULT_COALESCE_KEY_LIST)
+        # Asynchronous delivery: each job delivers one event or one batch to the observers
+        self.__dispatch_mode: DispatchMode = DispatchMode.SYNC
+        self.__job_queue: queue.Queue | None = None
+        self.__worker: threading.Thread | None = None
+        self.__qt_job_list: deque = deque()
+        self.__qt_lock = threading.Lock()
+        self.__error_list: List[Exception] = []
+
+    #################################################################
+
+    # Publish an event #
+    def _publish(self, event: UMLEvent):
+        """
+        Delivers the event now, or buffers it if a batch is open.
+
+        Parameters:
+            event (UMLEvent): The event to publish.
+        """
+        if self.__batch_depth > 0:
+            self.__pending_event_list.append(event)
+            return
+        self.__dispatch(self.__deliver_event, list(self.__observer_list), event)
+
+    # Open and close batches #
+    def _begin_batch(self):
+        self.__batch_depth += 1
+
+    def _end_batch(self):
+        """
+        Closes a batch. When the outermost batch closes, the buffered events are delivered.
+        """
+        self.__batch_depth -= 1
+        if self.__batch_depth == 0:
+            self._deliver_pending()
+
+    @contextmanager
+    def batch(self):
+        """
+        Buffers every event published inside the block and delivers them as one batch when it ends.
+        """
+        self._begin_batch()
+        try:
+            yield self
+        finally:
+            self._end_batch()
+
+    def _is_batching(self) -> bool:
+        return self.__batch_depth > 0
+
+    #################################################################
+
+    # Deliver the buffered events #
+    def _deliver_pending(self):
+        """
+        Coalesces the buffered events and dispatches them as one batch.
+        """
+        if not self.__pending_event_list:
+            return
+        event_list = self._coalesce(self.__pending_event_list)
+        self.__pending_event_list = []
+        self.__dispatch(self.__deliver_batch, list(self.__observer_list), event_list)
+
+    # Deliver one event to every observer #
+    @staticmethod
+    def __deliver_event(observer_list: List, event: UMLEvent):
+        for observer in observer_list:
+            observer._update(event._get_event_type(), event._get_data(), event._is_loading(), event._is_undo_or_redo())
+
+    # Deliver a batch to every observer #
+    @staticmethod
+    def __deliver_batch(observer_list: List, event_list: List[UMLEvent]):
+        """
+        Delivers a batch through _update_batch when the observer has it and one _update call per event otherwise.
+        """
+        for observer in observer_list:
+            update_batch = getattr(observer, "_update_batch", None)
+            if callable(update_batch):
+                update_batch(event_list)
+            else:
+                for event in event_list:
+                    observer._update(event._get_event_type(), event._get_data(), event._is_loading(), event._is_undo_or_redo())
+
+    # Drop the most recent buffered events #
+    def _discard_pending(self, pending_event_count: int = 0):
+        """
+        Drops the buffered events published after the first pending_event_count ones.
+
+        Parameters:
+            pending_event_count (int): The number of buffered events to keep.
+        """
+        del self.__pending_event_list[pending_event_count:]
+
+    def _get_pending_count(self) -> int:
+        return len(self.__pending_event_list)
+
+    #################################################################
+
+    # Register an event type whose events can be coalesced #
+    def _set_coalesce_key(self, event_type: str, key_name_list: Tuple[str, ...]):
+        """
+        Declares that events of a type set a value on the member identified by the given data keys.
+
+        Parameters:
+            event_type (str): The event type.
+            key_name_list (Tuple[str, ...]): The data keys identifying the member.
+        """
+        self.__coalesce_key_list[event_type] = tuple(key_name_list)
+
+    # Keep only the final state of repeatedly changed members #
+    def _coalesce(self, event_list: List[UMLEvent]) -> List[UMLEvent]:
+        """
+        Removes events superseded by a later event with the same coalesce key. Any other event
+        (adding, deleting or renaming something) ends the run, so events are never merged across a
+        structural change that could make the same key refer to a different member.
+
+        Parameters:
+            event_list (List[UMLEvent]): The events in publish order.
+
+        Returns:
+            List[UMLEvent]: The remaining events, still in publish order.
+        """
+        last_index_by_key: Dict[Tuple, int] = {}
+        superseded_index_set = set()
+        for index, event in enumerate(event_list):
+            key_name_list = self.__coalesce_key_list.get(event._get_event_type())
+            if key_name_list is None:
+                last_index_by_key.clear()
+                continue
+            data = event._get_data() or {}
+            key = (event._get_event_type(),) + tuple(data.get(key_name) for key_name in key_name_list)
+            previous_index = last_index_by_key.get(key)
+            if previous_index is not None:
+                superseded_index_set.add(previous_index)
+            last_index_by_key[key] = index
+        if not superseded_index_set:
+            return list(event_list)
+        return [event for index, event in enumerate(event_list) if index not in superseded_index_set]
+
+    #################################################################
+
+    # Choose where events are delivered #
+    def _set_dispatch_mode(self, dispatch_mode: DispatchMode):
+        """
+        Changes how events are delivered. Events already dispatched are delivered first.
+
+        Parameters:
+            dispatch_mode (DispatchMode): SYNC delivers inside the mutation call (the default).
+                                          THREAD delivers on a worker thread, QT on the Qt event loop
+                                          (mutations must then happen on the Qt thread).
+        """
+        self.flush()
+        if dispatch_mode is self.__dispatch_mode:
+            # Keep the running worker, a second one would leave the first blocked on its queue
+            return
+        if self.__dispatch_mode is DispatchMode.THREAD:
+            self.__stop_worker()
+        self.__dispatch_mode = dispatch_mode
+        if dispatch_mode is DispatchMode.THREAD:
+            self.__start_worker()
+
+    def _get_dispatch_mode(self) -> DispatchMode:
+        return self.__dispatch_mode
+
+    # Wait until every dispatched event has been delivered #
+    def flush(self):
+        """
+        Barrier: returns once every event dispatched so far has been delivered. In QT mode the remaining
+        events are delivered right away on the calling thread. Events still buffered in an open batch are
+        not dispatched yet and are not affected. If an observer raised while events were delivered
+        asynchronously, the first error is raised here.
+        """
+        if self.__dispatch_mode is DispatchMode.THREAD:
+            self.__job_queue.join()
+        elif self.__dispatch_mode is DispatchMode.QT:
+            self.__run_qt_job_list()
+        if self.__error_list:
+            error = self.__error_list[0]
+            self.__error_list = []
+            raise error
+
+    # Run a delivery job according to the dispatch mode #
+    def __dispatch(self, deliver: Callable, observer_list: List, payload):
+        if not observer_list:
+            return
+        if self.__dispatch_mode is DispatchMode.THREAD:
+            self.__job_queue.put((deliver, observer_list, payload))
+        elif self.__dispatch_mode is DispatchMode.QT:
+            self.__post_qt_job((deliver, observer_list, payload))
+        else:
+            deliver(observer_list, payload)
+
+    # Worker thread #
+    def __start_worker(self):
+        self.__job_queue = queue.Queue()
+        self.__worker = threading.Thread(target=self.__run_worker, args=(self.__job_queue,), name="UMLEventBus", daemon=True)
+        self.__worker.start()
+
+    def __stop_worker(self):
+        self.__job_queue.put(None)
+        self.__worker.join()
+        self.__job_queue = None
+        self.__worker = None
+
+    def __run_worker(self, job_queue: queue.Queue):
+        while True:
+            job = job_queue.get()
+            if job is None:
+                job_queue.task_done()
+                return
+            self.__run_job(job)
+            job_queue.task_done()
+
+    # Qt event loop #
+    def __post_qt_job(self, job: Tuple):
+        from PyQt5.QtCore import QTimer
+        with self.__qt_lock:
+            self.__qt_job_list.append(job)
+        # Jobs are kept in our own queue, the timer only wakes the event loop up to run them in order
+        QTimer.singleShot(0, self.__run_qt_job_list)
+
+    def __run_qt_job_list(self):
+        while True:
+            with self.__qt_lock:
+                if not self.__qt_job_list:
+                    return
+                job = self.__qt_job_list.popleft()
+            self.__run_job(job)
+
+    # Deliver one job, keeping the error for flush() #
+    def __run_job(self, job: Tuple):
+        deliver, observer_list, payload = job
+        try:
+            deliver(observer_list, payload)
+        except Exception as error:
+            self.__error_list.append(error)
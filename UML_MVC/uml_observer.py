@@ -1,5 +1,10 @@
 # observer.py
 
 class UMLObserver:
-    def _update(self, event_type=None, data=None, is_loading: bool = None):
+    def _update(self, event_type=None, data=None, is_loading: bool = None, is_undo_or_redo: bool = None):
         pass
+
+    # Receive several events at once, by default one _update call per event #
+    def _update_batch(self, event_list):
+        for event in event_list:
+            self._update(event._get_event_type(), event._get_data(), event._is_loading(), event._is_undo_or_redo())
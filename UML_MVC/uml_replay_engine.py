@@ -0,0 +1,193 @@
+###################################################################################################
+"""
+Module: UMLReplayEngine
+This module defines the UMLReplayEngine class, which applies a stream of compact command records
+(see Command.to_record) to a UMLModel without building Command objects or an undo history.
+Each record is dispatched straight to the matching model operation, and the whole stream runs in one
+model transaction, so main data is synced and observers are notified once at the end. With the default
+headless model no view is attached at all. This is meant for reproducible load tests and scripted bulk edits.
+"""
+###################################################################################################
+
+import json
+from typing import Callable, Dict, Iterable, Iterator, List
+from rich.console import Console
+from UML_MVC.UML_MODEL.uml_model import UMLModel as Model
+
+###################################################################################################
+
+# Model operation of each record, called with the record arguments #
+# Records are replayed as undo/redo operations, so the CLI view does not report every step.
+APPLY_LIST: Dict[str, Callable] = {
+    "add_class": lambda model, class_name:
+        model._add_class(class_name, is_undo_or_redo=True),
+    "delete_class": lambda model, class_name:
+        model._delete_class(class_name, is_undo_or_redo=True),
+    "rename_class": lambda model, class_name, new_name:
+        model._rename_class(class_name, new_name, is_undo_or_redo=True),
+    "refactor_class": lambda model, class_name, new_name:
+        model._rename_class(class_name, new_name, is_undo_or_redo=True, is_refactor=True),
+    "add_field": lambda model, class_name, field_type, field_name:
+        model._add_field(class_name, field_type, field_name, is_undo_or_redo=True),
+    "delete_field": lambda model, class_name, field_name:
+        model._delete_field(class_name, field_name, is_undo_or_redo=True),
+    "rename_field": lambda model, class_name, old_name, new_name:
+        model._rename_field(class_name, old_name, new_name, is_undo_or_redo=True),
+    "edit_field_type": lambda model, class_name, field_name, new_type:
+        model._change_data_type(class_name=class_name, input_name=field_name, new_type=new_type, is_field=True, is_undo_or_redo=True),
+    "add_method": lambda model, class_name, method_type, method_name:
+        model._add_method(class_name, method_type, method_name, is_undo_or_redo=True),
+    "delete_method": lambda model, class_name, method_num:
+        model._delete_method(class_name, method_num, is_undo_or_redo=True),
+    "rename_method": lambda model, class_name, method_num, new_name:
+        model._rename_method(class_name, method_num, new_name, is_undo_or_redo=True),
+    "edit_method_type": lambda model, class_name, method_num, new_type:
+        model._change_data_type(class_name=class_name, method_num=method_num, new_type=new_type, is_method=True, is_undo_or_redo=True),
+    "add_param": lambda model, class_name, method_num, param_type, param_name:
+        model._add_parameter(class_name, method_num, param_type, param_name, is_undo_or_redo=True),
+    # The parameter index only matters to the GUI
+    "delete_param": lambda model, class_name, method_num, param_name, selected_param_index=None:
+        model._delete_parameter(class_name, str(method_num), param_name, is_undo_or_redo=True),
+    "rename_param": lambda model, class_name, method_num, old_name, new_name:
+        model._rename_parameter(class_name, method_num, old_name, new_name, is_undo_or_redo=True),
+    "edit_param_type": lambda model, class_name, method_num, param_name, new_type:
+        model._change_data_type(class_name=class_name, method_num=method_num, input_name=param_name, new_type=new_type, is_param=True, is_undo_or_redo=True),
+    "replace_param": lambda model, class_name, method_num, new_param_list_str=None:
+        model._replace_param_list(class_name, method_num, new_param_list_str or [], is_undo_or_redo=True),
+    "add_rel": lambda model, source_class, dest_class, rel_type:
+        model._add_relationship(source_class, dest_class, rel_type, is_gui=False, is_undo_or_redo=True),
+    "delete_rel": lambda model, source_class, dest_class:
+        model._delete_relationship(source_class, dest_class, is_undo_or_redo=True),
+    "edit_rel_type": lambda model, source_class, dest_class, new_type:
+        model._change_data_type(source_class=source_class, dest_class=dest_class, new_type=new_type, is_rel=True, is_undo_or_redo=True),
+}
+
+class UMLReplayEngine:
+
+    """
+    UMLReplayEngine applies recorded command streams to a model.
+    """
+
+    #################################################################
+
+    # UML replay engine constructor #
+    def __init__(self, uml_model: Model = None):
+        """
+        Initializes the engine.
+
+        Parameters:
+            uml_model (Model): The model to apply the records to. By default a new model with no view
+                               and a silent console is created.
+        """
+        self.__model: Model = uml_model if uml_model is not None else self.create_headless_model()
+        self.__applied_count: int = 0
+        self.__failed_count: int = 0
+
+    # Create a model with no view attached #
+    @staticmethod
+    def create_headless_model() -> Model:
+        return Model(None, Console(quiet=True))
+
+    def _get_model(self) -> Model:
+        return self.__model
+
+    def _get_statistics(self) -> Dict[str, int]:
+        """
+        Returns:
+            Dict[str, int]: The number of records applied ("applied_count") and rejected by the model
+                            ("failed_count") since the engine was created.
+        """
+        return {"applied_count": self.__applied_count, "failed_count": self.__failed_count}
+
+    #################################################################
+
+    # Apply a stream of records #
+    def replay(self, record_stream: Iterable[List], stop_on_failure: bool = False) -> bool:
+        """
+        Applies the records in order, in one model transaction. A record the model rejects (for example
+        adding a class that already exists) is counted and skipped.
+
+        Parameters:
+            record_stream (Iterable[List]): The records, e.g. a list or read_record_file(file_path).
+            stop_on_failure (bool): True to stop at the first rejected record.
+
+        Returns:
+            bool: True if every record was applied.
+
+        Raises:
+            ValueError: If a record is malformed or names an unknown command. The model is rolled back
+                        to its state before the replay.
+        """
+        is_every_record_applied = True
+        with self.__model.transaction():
+            for record in record_stream:
+                is_applied = self.__apply(record)
+                if is_applied:
+                    self.__applied_count += 1
+                else:
+                    self.__failed_count += 1
+                    is_every_record_applied = False
+                    if stop_on_failure:
+                        break
+        return is_every_record_applied
+
+    # Apply one record, a composite record counts as one #
+    def __apply(self, record: List) -> bool:
+        if not isinstance(record, (list, tuple)) or not record:
+            raise ValueError(f"Invalid command record: {record!r}")
+        command_name, *argument_list = record
+        if command_name == "composite":
+            child_record_list = argument_list[0] if argument_list else []
+            # The children of a group are applied together or not at all. The savepoint only copies
+            # what the children touch, so a group costs about as much as its records sent one by one
+            try:
+                with self.__model.transaction():
+                    for child_record in child_record_list:
+                        if not self.__apply(child_record):
+                            raise _CompositeFailure()
+            except _CompositeFailure:
+                return False
+            return True
+        apply = APPLY_LIST.get(command_name)
+        if apply is None:
+            raise ValueError(f"Unknown command name: {command_name}")
+        try:
+            return apply(self.__model, *argument_list) is True
+        except TypeError as error:
+            raise ValueError(f"Invalid command record: {record!r}") from error
+
+###################################################################################################
+
+class _CompositeFailure(Exception):
+    """
+    Raised inside a composite record to roll its children back.
+    """
+
+# Record files: one JSON record per line #
+def write_record_file(file_path: str, record_stream: Iterable[List]):
+    """
+    Writes records to a file, one compact JSON record per line.
+
+    Parameters:
+        file_path (str): The file to write.
+        record_stream (Iterable[List]): The records.
+    """
+    with open(file_path, "w") as record_file:
+        for record in record_stream:
+            record_file.write(json.dumps(record, separators=(",", ":")))
+            record_file.write("\n")
+
+def read_record_file(file_path: str) -> Iterator[List]:
+    """
+    Reads the records of a file lazily, so a long stream is never held in memory at once.
+
+    Parameters:
+        file_path (str): The file written by write_record_file.
+
+    Yields:
+        List: One record per non-empty line.
+    """
+    with open(file_path, "r") as record_file:
+        for line in record_file:
+            if line.strip():
+                yield json.loads(line)
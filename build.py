@@ -50,7 +50,7 @@ def activate_venv():
         print("\nDependencies installed successfully.\n")
 
 
-def run_program(cli_mode=False):
+def run_program(cli_mode=False, pretty=False):
     """Runs the main program using the virtual environment's Python."""
     print("Running main.py...\n")
 
@@ -79,6 +79,9 @@ def run_program(cli_mode=False):
     # Add the --cli argument if cli_mode is True
     if cli_mode:
         command.append("--cli")
+    # Add the --pretty argument to save indented diagram files
+    if pretty:
+        command.append("--pretty")
 
     result = subprocess.run(command)
     if result.returncode != 0:
@@ -91,10 +94,11 @@ if __name__ == "__main__":
     # Set up argument parser to handle the --cli argument
     parser = argparse.ArgumentParser(description="Build and run the UML application.")
     parser.add_argument('--cli', action='store_true', help="Run the program in CLI mode")
+    parser.add_argument('--pretty', action='store_true', help="Save diagram files as indented JSON")
     args = parser.parse_args()
 
     check_python_version()
     activate_venv()
 
     # Pass the --cli argument to the main program if provided
-    run_program(cli_mode=args.cli)
+    run_program(cli_mode=args.cli, pretty=args.pretty)
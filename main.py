@@ -10,10 +10,12 @@ def main():
     # Set up argument parser to handle the --cli argument
     parser = argparse.ArgumentParser(description="Run the UML application in GUI or CLI mode.")
     parser.add_argument('--cli', action='store_true', help="Run the program in CLI mode")
+    parser.add_argument('--pretty', action='store_true', help="Save diagram files as indented JSON")
     args = parser.parse_args()
     
     cli_view = CLIView()
     interface = Interface(cli_view)
+    interface.set_pretty_output(args.pretty)
     # CLI Mode
     if args.cli:
         